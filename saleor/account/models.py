@@ -184,6 +184,24 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
         # Drop cache for authentication backend
         self._effective_permissions_cache = None
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        super().save(force_insert, force_update, using, update_fields)
+
+        from ..core.jwt import invalidate_user_auth_cache
+
+        invalidate_user_auth_cache(self.pk)
+
+    def delete(self, *args, **kwargs):
+        user_pk = self.pk
+        result = super().delete(*args, **kwargs)
+
+        from ..core.jwt import invalidate_user_auth_cache
+
+        invalidate_user_auth_cache(user_pk)
+        return result
+
     def get_full_name(self):
         if self.first_name or self.last_name:
             return ("%s %s" % (self.first_name, self.last_name)).strip()
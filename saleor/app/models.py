@@ -37,6 +37,23 @@ class App(ModelWithMetadata):
         ordering = ("name", "pk")
         permissions = ((AppPermission.MANAGE_APPS.codename, "Manage apps",),)
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        super().save(force_insert, force_update, using, update_fields)
+
+        from .utils import invalidate_app_tokens_cache
+
+        invalidate_app_tokens_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        from .utils import invalidate_app_tokens_cache
+
+        invalidate_app_tokens_cache()
+        return result
+
     def get_permissions(self) -> Set[str]:
         """Return the permissions of the app."""
         if not self.is_active:
@@ -75,6 +92,23 @@ class AppToken(models.Model):
     name = models.CharField(blank=True, default="", max_length=128)
     auth_token = models.CharField(default=generate_token, unique=True, max_length=30)
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        super().save(force_insert, force_update, using, update_fields)
+
+        from .utils import invalidate_app_tokens_cache
+
+        invalidate_app_tokens_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        from .utils import invalidate_app_tokens_cache
+
+        invalidate_app_tokens_cache()
+        return result
+
 
 class AppInstallation(Job):
     app_name = models.CharField(max_length=60)
@@ -0,0 +1,60 @@
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..core.utils.cache import bump_cache_version, get_cache_version
+from .models import App
+
+# Fields and permissions of apps are cached under hashes of their tokens;
+# bumping the version invalidates all of them at once
+APP_TOKEN_CACHE_KEY = "app_token:{version}:{token_hash}"
+APP_TOKEN_VERSION_CACHE_KEY = "app_token_version"
+
+
+def _get_app_token_cache_key(auth_token: str) -> str:
+    version = get_cache_version(APP_TOKEN_VERSION_CACHE_KEY)
+    token_hash = hashlib.sha256(auth_token.encode()).hexdigest()
+    return APP_TOKEN_CACHE_KEY.format(version=version, token_hash=token_hash)
+
+
+def _get_app_and_cache(auth_token: str) -> Optional[App]:
+    field_names = [field.attname for field in App._meta.concrete_fields]
+    fields = (
+        App.objects.filter(tokens__auth_token=auth_token, is_active=True)
+        .values(*field_names)
+        .first()
+    )
+    if fields is None:
+        return None
+    app = App.from_db(None, list(fields), list(fields.values()))
+    cache.set(
+        _get_app_token_cache_key(auth_token),
+        {"fields": fields, "permissions": app.get_permissions()},
+        timeout=settings.APP_TOKEN_CACHE_TIMEOUT,
+    )
+    return app
+
+
+def get_active_app_by_token(auth_token: str) -> Optional[App]:
+    """Return the active app the token belongs to.
+
+    With `APP_TOKEN_CACHE_TIMEOUT` set, fields and permissions of apps are
+    cached for that many seconds, so authenticating an app doesn't hit the
+    database. The cache is invalidated whenever apps or their tokens change.
+    """
+    if not settings.APP_TOKEN_CACHE_TIMEOUT:
+        return App.objects.filter(tokens__auth_token=auth_token, is_active=True).first()
+    data = cache.get(_get_app_token_cache_key(auth_token))
+    if data is None:
+        return _get_app_and_cache(auth_token)
+    app = App.from_db(None, list(data["fields"]), list(data["fields"].values()))
+    app._app_perm_cache = set(data["permissions"])
+    return app
+
+
+def invalidate_app_tokens_cache():
+    """Drop the cached apps of all tokens after the commit."""
+    transaction.on_commit(lambda: bump_cache_version(APP_TOKEN_VERSION_CACHE_KEY))
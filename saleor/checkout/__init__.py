@@ -1,4 +1,8 @@
 import logging
+from dataclasses import dataclass
+from typing import Dict
+
+from prices import Money, TaxedMoney
 
 logger = logging.getLogger(__name__)
 
@@ -11,3 +15,14 @@ class AddressType:
         (BILLING, "Billing"),
         (SHIPPING, "Shipping"),
     ]
+
+
+@dataclass(frozen=True)
+class CheckoutPrices:
+    """Prices of a checkout calculated in a single pass."""
+
+    line_totals: Dict[int, TaxedMoney]
+    subtotal: TaxedMoney
+    shipping_price: TaxedMoney
+    discount: Money
+    total: TaxedMoney
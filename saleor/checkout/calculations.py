@@ -1,15 +1,62 @@
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Hashable, Iterable, List, Optional
 
 from ..core.prices import quantize_price
 from ..core.taxes import zero_taxed_money
 from ..discount import DiscountInfo
 from ..plugins.manager import get_plugins_manager
+from . import CheckoutPrices
 
 if TYPE_CHECKING:
     from prices import TaxedMoney
+    from ..plugins.manager import PluginsManager
     from .models import Checkout, CheckoutLine
 
 
+def _get_prices_cache_key(
+    checkout: "Checkout",
+    lines: List["CheckoutLine"],
+    discounts: List[DiscountInfo],
+    manager: "PluginsManager",
+) -> Hashable:
+    return (
+        tuple((plugin.PLUGIN_ID, plugin.active) for plugin in manager.plugins),
+        checkout.last_change,
+        checkout.currency,
+        str(checkout.country),
+        checkout.discount_amount,
+        checkout.shipping_method_id,
+        checkout.shipping_method.price if checkout.shipping_method_id else None,
+        checkout.shipping_address_id,
+        checkout.billing_address_id,
+        tuple((line.pk, line.variant_id, line.quantity) for line in lines),
+        tuple((type(discount.sale), discount.sale.pk) for discount in discounts),
+    )
+
+
+def checkout_prices(
+    *,
+    checkout: "Checkout",
+    lines: Iterable["CheckoutLine"],
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+    manager: Optional["PluginsManager"] = None,
+) -> CheckoutPrices:
+    """Return prices of the checkout lines, subtotal, shipping and total.
+
+    All prices are calculated in one pass through the plugins and memoized on
+    the checkout instance until the checkout, its lines or discounts change.
+    """
+    lines = list(lines)
+    discounts = list(discounts or [])
+    manager = manager or get_plugins_manager()
+    key = _get_prices_cache_key(checkout, lines, discounts, manager)
+    cached = getattr(checkout, "_prices_cache", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    prices = manager.calculate_checkout_prices(checkout, lines, discounts)
+    checkout._prices_cache = (key, prices)
+    return prices
+
+
 def checkout_shipping_price(
     *,
     checkout: "Checkout",
@@ -20,10 +67,8 @@ def checkout_shipping_price(
 
     It takes in account all plugins.
     """
-    calculated_checkout_shipping = get_plugins_manager().calculate_checkout_shipping(
-        checkout, lines, discounts or []
-    )
-    return quantize_price(calculated_checkout_shipping, checkout.currency)
+    prices = checkout_prices(checkout=checkout, lines=lines, discounts=discounts)
+    return prices.shipping_price
 
 
 def checkout_subtotal(
@@ -36,10 +81,8 @@ def checkout_subtotal(
 
     It takes in account all plugins.
     """
-    calculated_checkout_subtotal = get_plugins_manager().calculate_checkout_subtotal(
-        checkout, lines, discounts or []
-    )
-    return quantize_price(calculated_checkout_subtotal, checkout.currency)
+    prices = checkout_prices(checkout=checkout, lines=lines, discounts=discounts)
+    return prices.subtotal
 
 
 def calculate_checkout_total_with_gift_cards(
@@ -66,10 +109,8 @@ def checkout_total(
 
     It takes in account all plugins.
     """
-    calculated_checkout_total = get_plugins_manager().calculate_checkout_total(
-        checkout, lines, discounts or []
-    )
-    return quantize_price(calculated_checkout_total, checkout.currency)
+    prices = checkout_prices(checkout=checkout, lines=lines, discounts=discounts)
+    return prices.total
 
 
 def checkout_line_total(
@@ -4,6 +4,7 @@ from typing import Iterable, List, Optional, Tuple
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 from django.utils.encoding import smart_text
 from django.utils.translation import get_language
 from prices import TaxedMoney
@@ -31,10 +32,10 @@ from ..order.models import Order, OrderLine
 from ..payment import PaymentError, gateway
 from ..payment.models import Payment, Transaction
 from ..payment.utils import store_customer_id
-from ..plugins.manager import get_plugins_manager
-from ..warehouse.availability import check_stock_quantity
-from ..warehouse.management import allocate_stock
-from . import AddressType, models
+from ..plugins.manager import PluginsManager, get_plugins_manager
+from ..warehouse.availability import check_stock_quantity_bulk
+from ..warehouse.management import allocate_stocks
+from . import AddressType, CheckoutPrices, models
 from .checkout_cleaner import clean_checkout_payment, clean_checkout_shipping
 from .models import Checkout, CheckoutLine
 from .utils import get_voucher_for_checkout
@@ -123,17 +124,29 @@ def _validate_gift_cards(checkout: Checkout):
         raise NotApplicable(msg)
 
 
-def _create_line_for_order(checkout_line: "CheckoutLine", discounts) -> OrderLine:
-    """Create a line for the given order.
+def _prefetch_checkout_lines(checkout: Checkout):
+    """Load lines of the checkout with all the data needed to create order lines.
 
-    :raises InsufficientStock: when there is not enough items in stock for this variant.
+    Variants, products, their translations and collections are fetched with
+    a fixed number of queries, regardless of the number of lines.
     """
+    lines = CheckoutLine.objects.select_related(
+        "variant__product__product_type"
+    ).prefetch_related(
+        "variant__translations",
+        "variant__product__translations",
+        "variant__product__collections",
+    )
+    prefetch_related_objects([checkout], Prefetch("lines", queryset=lines))
+
 
+def _create_line_for_order(
+    checkout_line: "CheckoutLine", total_line_price: TaxedMoney
+) -> OrderLine:
+    """Create a line for the given order."""
     quantity = checkout_line.quantity
     variant = checkout_line.variant
     product = variant.product
-    country = checkout_line.checkout.get_country()
-    check_stock_quantity(variant, country, quantity)
 
     product_name = str(product)
     variant_name = str(variant)
@@ -147,8 +160,6 @@ def _create_line_for_order(checkout_line: "CheckoutLine", discounts) -> OrderLin
     if translated_variant_name == variant_name:
         translated_variant_name = ""
 
-    manager = get_plugins_manager()
-    total_line_price = manager.calculate_checkout_line_total(checkout_line, discounts)
     unit_price = quantize_price(
         total_line_price / checkout_line.quantity, total_line_price.currency
     )
@@ -173,26 +184,47 @@ def _create_line_for_order(checkout_line: "CheckoutLine", discounts) -> OrderLin
     return line
 
 
+def _create_lines_for_order(
+    checkout: Checkout, lines: List[CheckoutLine], prices: CheckoutPrices
+) -> List[OrderLine]:
+    """Create lines for the given order from all checkout lines at once.
+
+    :raises InsufficientStock: when there is not enough items in stock for a variant.
+    """
+    check_stock_quantity_bulk(
+        [(line.variant, line.quantity) for line in lines], checkout.get_country()
+    )
+    return [_create_line_for_order(line, prices.line_totals[line.pk]) for line in lines]
+
+
 def _prepare_order_data(
-    *, checkout: Checkout, lines: Iterable[CheckoutLine], discounts
+    *,
+    checkout: Checkout,
+    lines: Iterable[CheckoutLine],
+    discounts,
+    manager: Optional[PluginsManager] = None,
 ) -> dict:
     """Run checks and return all the data from a given checkout to create an order.
 
+    All prices are calculated once with a single plugins manager.
+
     :raises NotApplicable InsufficientStock:
     """
     order_data = {}
 
-    manager = get_plugins_manager()
-    taxed_total = calculations.checkout_total(
-        checkout=checkout, lines=lines, discounts=discounts
+    lines = list(lines)
+    manager = manager or get_plugins_manager()
+    prices = calculations.checkout_prices(
+        checkout=checkout, lines=lines, discounts=discounts, manager=manager
     )
+    taxed_total = prices.total
     cards_total = checkout.get_total_gift_cards_balance()
     taxed_total.gross -= cards_total
     taxed_total.net -= cards_total
 
     taxed_total = max(taxed_total, zero_taxed_money(checkout.currency))
 
-    shipping_total = manager.calculate_checkout_shipping(checkout, lines, discounts)
+    shipping_total = prices.shipping_price
     order_data.update(_process_shipping_data_for_order(checkout, shipping_total))
     order_data.update(_process_user_data_for_order(checkout))
     order_data.update(
@@ -203,10 +235,7 @@ def _prepare_order_data(
         }
     )
 
-    order_data["lines"] = [
-        _create_line_for_order(checkout_line=line, discounts=discounts)
-        for line in lines
-    ]
+    order_data["lines"] = _create_lines_for_order(checkout, lines, prices)
 
     # validate checkout gift cards
     _validate_gift_cards(checkout)
@@ -217,9 +246,7 @@ def _prepare_order_data(
     # assign gift cards to the order
 
     order_data["total_price_left"] = (
-        manager.calculate_checkout_subtotal(checkout, lines, discounts)
-        + shipping_total
-        - checkout.discount
+        prices.subtotal + shipping_total - checkout.discount
     ).gross
 
     manager.preprocess_order_creation(checkout, discounts)
@@ -254,10 +281,10 @@ def _create_order(*, checkout: Checkout, order_data: dict, user: User) -> Order:
     order_lines = OrderLine.objects.bulk_create(order_lines)
 
     # allocate stocks from the lines
-    for line in order_lines:  # type: OrderLine
-        variant = line.variant
-        if variant and variant.track_inventory:
-            allocate_stock(line, checkout.get_country(), line.quantity)
+    allocate_stocks(
+        [line for line in order_lines if line.variant and line.variant.track_inventory],
+        checkout.get_country(),
+    )
 
     # Add gift cards to the order
     for gift_card in checkout.gift_cards.select_for_update():
@@ -285,10 +312,14 @@ def _create_order(*, checkout: Checkout, order_data: dict, user: User) -> Order:
 
 
 def _prepare_checkout(
-    checkout: models.Checkout, discounts, tracking_code, redirect_url, payment
+    checkout: models.Checkout,
+    lines: List[CheckoutLine],
+    discounts,
+    tracking_code,
+    redirect_url,
+    payment,
 ):
     """Prepare checkout object to complete the checkout process."""
-    lines = list(checkout)
 
     clean_checkout_shipping(checkout, lines, discounts, CheckoutErrorCode)
     clean_checkout_payment(
@@ -325,11 +356,16 @@ def release_voucher_usage(order_data: dict):
             remove_voucher_usage_by_customer(voucher, order_data["user_email"])
 
 
-def _get_order_data(checkout: models.Checkout, discounts: List[DiscountInfo]) -> dict:
+def _get_order_data(
+    checkout: models.Checkout,
+    lines: List[CheckoutLine],
+    discounts: List[DiscountInfo],
+    manager: PluginsManager,
+) -> dict:
     """Prepare data that will be converted to order and its lines."""
     try:
         order_data = _prepare_order_data(
-            checkout=checkout, lines=list(checkout), discounts=discounts,
+            checkout=checkout, lines=lines, discounts=discounts, manager=manager
         )
     except InsufficientStock as e:
         raise ValidationError(f"Insufficient product stock: {e.item}", code=e.code)
@@ -388,8 +424,12 @@ def complete_checkout(
     :raises ValidationError
     """
     payment = checkout.get_last_active_payment()
+    _prefetch_checkout_lines(checkout)
+    lines = list(checkout)
+    manager = get_plugins_manager()
     _prepare_checkout(
         checkout=checkout,
+        lines=lines,
         discounts=discounts,
         tracking_code=tracking_code,
         redirect_url=redirect_url,
@@ -397,7 +437,7 @@ def complete_checkout(
     )
 
     try:
-        order_data = _get_order_data(checkout, discounts)
+        order_data = _get_order_data(checkout, lines, discounts, manager)
     except ValidationError as error:
         gateway.payment_refund_or_void(payment)
         raise error
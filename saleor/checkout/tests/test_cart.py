@@ -5,7 +5,7 @@ from prices import Money, TaxedMoney
 from ...product.models import Category
 from .. import calculations, utils
 from ..models import Checkout
-from ..utils import add_variant_to_checkout
+from ..utils import add_variant_to_checkout, add_variants_to_checkout
 
 
 @pytest.fixture()
@@ -72,6 +72,38 @@ def test_adding_invalid_quantity(checkout, product):
         add_variant_to_checkout(checkout, variant, -1)
 
 
+def test_adding_many_variants(checkout_with_item, product_list):
+    checkout = checkout_with_item
+    line = checkout.lines.get()
+    variants = [line.variant] + [product.variants.get() for product in product_list]
+
+    add_variants_to_checkout(checkout, variants, [2, 1, 1, 1])
+
+    line.refresh_from_db()
+    assert line.quantity == 5
+    assert checkout.lines.count() == 4
+    assert checkout.quantity == 8
+
+
+def test_replacing_many_variants(checkout_with_items):
+    checkout = checkout_with_items
+    lines = list(checkout)
+    variants = [line.variant for line in lines]
+    quantities = [0] + [3] * (len(lines) - 1)
+
+    add_variants_to_checkout(checkout, variants, quantities, replace=True)
+
+    assert [line.variant for line in checkout] == variants[1:]
+    assert all(line.quantity == 3 for line in checkout)
+    assert checkout.quantity == 3 * (len(lines) - 1)
+
+
+def test_adding_many_variants_invalid_quantity(checkout_with_item):
+    variant = checkout_with_item.lines.get().variant
+    with pytest.raises(ValueError):
+        add_variants_to_checkout(checkout_with_item, [variant], [-4])
+
+
 def test_getting_line(checkout, product):
     variant = product.variants.get()
     assert checkout.get_line(variant) is None
@@ -15,6 +15,7 @@ from ...discount import DiscountValueType, VoucherType
 from ...discount.models import NotApplicable, Voucher
 from ...payment.models import Payment
 from ...plugins.manager import get_plugins_manager
+from ...shipping import utils as shipping_utils
 from ...shipping.models import ShippingZone
 from .. import AddressType, calculations
 from ..models import Checkout
@@ -24,6 +25,7 @@ from ..utils import (
     change_billing_address_in_checkout,
     change_shipping_address_in_checkout,
     clear_shipping_method,
+    get_valid_shipping_methods_for_checkout,
     get_voucher_discount_for_checkout,
     get_voucher_for_checkout,
     is_fully_paid,
@@ -52,6 +54,27 @@ def test_is_valid_shipping_method(checkout_with_item, address, shipping_zone):
     assert not is_valid_shipping_method(checkout, lines, None)
 
 
+def test_get_valid_shipping_methods_for_checkout_is_memoized(
+    checkout_with_item,
+    address,
+    shipping_zone,
+    enable_process_cache,
+    django_assert_num_queries,
+):
+    enable_process_cache(shipping_utils._shipping_methods_index)
+    checkout = checkout_with_item
+    checkout.shipping_address = address
+    checkout.save()
+    lines = list(checkout)
+    shipping_method = shipping_zone.shipping_methods.get()
+    methods = get_valid_shipping_methods_for_checkout(checkout, lines, None)
+
+    with django_assert_num_queries(0):
+        methods_again = get_valid_shipping_methods_for_checkout(checkout, lines, None)
+
+    assert methods == methods_again == [shipping_method]
+
+
 def test_clear_shipping_method(checkout, shipping_method):
     checkout.shipping_method = shipping_method
     checkout.save()
@@ -867,3 +890,32 @@ def test_cancel_active_payments(checkout_with_payments):
 
     # then
     assert checkout.payments.filter(is_active=True).count() == 0
+
+
+def test_checkout_prices_are_memoized(checkout_with_item):
+    checkout = checkout_with_item
+    manager = get_plugins_manager()
+    lines = list(checkout)
+
+    with patch.object(
+        manager, "calculate_checkout_prices", wraps=manager.calculate_checkout_prices,
+    ) as mocked_calculate:
+        prices = calculations.checkout_prices(
+            checkout=checkout, lines=lines, manager=manager
+        )
+        assert (
+            calculations.checkout_prices(
+                checkout=checkout, lines=list(checkout), manager=manager
+            )
+            is prices
+        )
+        assert mocked_calculate.call_count == 1
+
+        lines[0].quantity += 1
+        new_prices = calculations.checkout_prices(
+            checkout=checkout, lines=lines, manager=manager
+        )
+
+    assert mocked_calculate.call_count == 2
+    assert new_prices.subtotal > prices.subtotal
+    assert new_prices.line_totals[lines[0].pk] == new_prices.subtotal
@@ -9,7 +9,12 @@ from ...order import OrderEvents, OrderEventsEmails
 from ...order.models import OrderEvent
 from ...tests.utils import flush_post_commit_hooks
 from .. import calculations
-from ..complete_checkout import _create_order, _prepare_order_data
+from ..complete_checkout import (
+    _create_lines_for_order,
+    _create_order,
+    _prefetch_checkout_lines,
+    _prepare_order_data,
+)
 from ..utils import add_variant_to_checkout
 
 
@@ -624,3 +629,21 @@ def test_create_order_with_variant_tracking_false(
         checkout=checkout, order_data=order_data, user=customer_user,
     )
     assert order_1.checkout_token == checkout.token
+
+
+def test_create_lines_for_order_uses_prefetched_lines(
+    checkout_with_items, product_translation_fr, settings, django_assert_num_queries
+):
+    settings.LANGUAGE_CODE = "fr"
+    checkout = checkout_with_items
+    _prefetch_checkout_lines(checkout)
+    lines = list(checkout)
+    prices = calculations.checkout_prices(checkout=checkout, lines=lines)
+
+    # All stocks are checked with a single query
+    with django_assert_num_queries(1):
+        order_lines = _create_lines_for_order(checkout, lines, prices)
+
+    assert [line.variant for line in order_lines] == [line.variant for line in lines]
+    assert order_lines[0].translated_product_name == product_translation_fr.name
+    assert order_lines[0].unit_price == prices.line_totals[lines[0].pk]
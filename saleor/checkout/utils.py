@@ -1,9 +1,10 @@
 """Checkout-related utility functions."""
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
 
 from django.core.exceptions import ValidationError
-from django.db.models import Max, Min, Sum
+from django.db.models import Sum
 from django.utils import timezone
+from measurement.measures import Weight
 from prices import Money, MoneyRange, TaxedMoneyRange
 
 from ..account.models import User
@@ -30,7 +31,8 @@ from ..giftcard.utils import (
 )
 from ..plugins.manager import get_plugins_manager
 from ..shipping.models import ShippingMethod
-from ..warehouse.availability import check_stock_quantity
+from ..shipping.utils import get_applicable_shipping_methods
+from ..warehouse.availability import check_stock_quantity, check_stock_quantity_bulk
 from . import AddressType
 from .models import Checkout, CheckoutLine
 
@@ -119,6 +121,76 @@ def add_variant_to_checkout(
     update_checkout_quantity(checkout)
 
 
+def add_variants_to_checkout(
+    checkout, variants, quantities, replace=False, check_quantity=True
+):
+    """Add many product variants to checkout at once.
+
+    Works like `add_variant_to_checkout` called for every variant, but the new
+    quantities are calculated in memory, stocks of all variants are checked with
+    a single query and the lines are saved with bulk queries.
+    """
+    if any(not variant.product.is_published for variant in variants):
+        raise ProductNotPublished()
+
+    lines_by_variant = {line.variant_id: line for line in checkout.lines.all()}
+    variants_by_pk = {}
+    new_quantities: Dict[int, int] = {}
+    for variant, quantity in zip(variants, quantities):
+        line = lines_by_variant.get(variant.pk)
+        line_quantity = new_quantities.get(
+            variant.pk, 0 if line is None else line.quantity
+        )
+        new_quantity = quantity if replace else (quantity + line_quantity)
+        if new_quantity < 0:
+            raise ValueError(
+                "%r is not a valid quantity (results in %r)" % (quantity, new_quantity)
+            )
+        variants_by_pk[variant.pk] = variant
+        new_quantities[variant.pk] = new_quantity
+
+    if check_quantity:
+        check_stock_quantity_bulk(
+            [
+                (variants_by_pk[variant_pk], new_quantity)
+                for variant_pk, new_quantity in new_quantities.items()
+                if new_quantity > 0
+            ],
+            checkout.get_country(),
+        )
+
+    lines_to_create = []
+    lines_to_update = []
+    line_pks_to_delete = []
+    for variant_pk, new_quantity in new_quantities.items():
+        line = lines_by_variant.get(variant_pk)
+        if new_quantity == 0:
+            if line is not None:
+                line_pks_to_delete.append(line.pk)
+                del lines_by_variant[variant_pk]
+        elif line is None:
+            line = CheckoutLine(
+                checkout=checkout,
+                variant=variants_by_pk[variant_pk],
+                quantity=new_quantity,
+            )
+            lines_to_create.append(line)
+            lines_by_variant[variant_pk] = line
+        elif line.quantity != new_quantity:
+            line.quantity = new_quantity
+            lines_to_update.append(line)
+
+    if line_pks_to_delete:
+        CheckoutLine.objects.filter(pk__in=line_pks_to_delete).delete()
+    if lines_to_create:
+        CheckoutLine.objects.bulk_create(lines_to_create)
+    if lines_to_update:
+        CheckoutLine.objects.bulk_update(lines_to_update, ["quantity"])
+
+    checkout.quantity = sum(line.quantity for line in lines_by_variant.values())
+    checkout.save(update_fields=["quantity"])
+
+
 def _check_new_checkout_address(checkout, address, address_type):
     """Check if and address in checkout has changed and if to remove old one."""
     if address_type == AddressType.BILLING:
@@ -424,17 +496,62 @@ def remove_voucher_from_checkout(checkout: Checkout):
     )
 
 
+def _get_shipping_methods_lookup_cache_key(
+    checkout: Checkout, lines: List[CheckoutLine], discounts: List[DiscountInfo]
+) -> Hashable:
+    return (
+        checkout.last_change,
+        checkout.currency,
+        checkout.shipping_address_id,
+        tuple((line.pk, line.variant_id, line.quantity) for line in lines),
+        tuple((type(discount.sale), discount.sale.pk) for discount in discounts),
+    )
+
+
+def _get_shipping_methods_lookup(
+    checkout: Checkout, lines: List[CheckoutLine], discounts: List[DiscountInfo]
+) -> Optional[Tuple[Money, Weight, str]]:
+    """Return the subtotal, weight and country used to look up shipping methods.
+
+    The values are memoized on the checkout instance until the checkout, its
+    lines or discounts change. Return None if the checkout can't be shipped.
+    """
+    key = _get_shipping_methods_lookup_cache_key(checkout, lines, discounts)
+    cached = getattr(checkout, "_shipping_methods_lookup_cache", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    lookup = None
+    if checkout.is_shipping_required() and checkout.shipping_address:
+        manager = get_plugins_manager()
+        lookup = (
+            manager.calculate_checkout_subtotal(checkout, lines, discounts).gross,
+            checkout.get_total_weight(),
+            checkout.shipping_address.country.code,
+        )
+    checkout._shipping_methods_lookup_cache = (key, lookup)
+    return lookup
+
+
 def get_valid_shipping_methods_for_checkout(
     checkout: Checkout,
     lines: Iterable[CheckoutLine],
     discounts: Iterable[DiscountInfo],
     country_code: Optional[str] = None,
-):
-    manager = get_plugins_manager()
-    return ShippingMethod.objects.applicable_shipping_methods_for_instance(
-        checkout,
-        price=manager.calculate_checkout_subtotal(checkout, lines, discounts).gross,
-        country_code=country_code,
+) -> Optional[List[ShippingMethod]]:
+    """Return shipping methods applicable to the checkout, the cheapest first.
+
+    Methods are matched in memory against the cached shipping methods index.
+    Returned methods are copies, which may be modified by the caller.
+    """
+    lookup = _get_shipping_methods_lookup(checkout, list(lines), list(discounts or []))
+    if lookup is None:
+        return None
+    subtotal, weight, shipping_country_code = lookup
+    return get_applicable_shipping_methods(
+        price=subtotal,
+        weight=weight,
+        country_code=country_code or shipping_country_code,
     )
 
 
@@ -467,14 +584,13 @@ def get_shipping_price_estimate(
     if shipping_methods is None:
         return None
 
-    # TODO: extension manager should be able to have impact on shipping price estimates
-    min_price_amount, max_price_amount = shipping_methods.aggregate(
-        price_amount_min=Min("price_amount"), price_amount_max=Max("price_amount")
-    ).values()
-
-    if min_price_amount is None:
+    if not shipping_methods:
         return None
 
+    # TODO: extension manager should be able to have impact on shipping price estimates
+    min_price_amount = min(method.price_amount for method in shipping_methods)
+    max_price_amount = max(method.price_amount for method in shipping_methods)
+
     manager = get_plugins_manager()
     prices = MoneyRange(
         start=Money(min_price_amount, checkout.currency),
@@ -4,11 +4,18 @@ from typing import Any, Dict, Optional
 import graphene
 import jwt
 from django.conf import settings
+from django.core.cache import cache
 from django.core.handlers.wsgi import WSGIRequest
+from django.db import router, transaction
 
 from ..account.models import User
 from ..app.models import App
-from .permissions import get_permission_names, get_permissions_from_names
+from .permissions import (
+    get_permission_names,
+    get_permissions_enum_dict,
+    split_permission_codename,
+)
+from .utils.cache import bump_cache_version, get_cache_version
 
 JWT_ALGORITHM = "HS256"
 JWT_AUTH_HEADER = "HTTP_AUTHORIZATION"
@@ -20,6 +27,19 @@ JWT_REFRESH_TOKEN_COOKIE_NAME = "refreshToken"
 
 PERMISSIONS_FIELD = "permissions"
 
+# Fields and permissions of users authenticated with tokens are cached under
+# their IDs; bumping the version invalidates all of them at once
+USER_AUTH_CACHE_KEY = "jwt_user:{version}:{user_pk}"
+USER_AUTH_VERSION_CACHE_KEY = "jwt_user_version"
+# Sensitive fields are not cached, they are deferred and loaded from the
+# database when accessed
+USER_UNCACHED_FIELDS = {"password", "note", "private_metadata"}
+USER_CACHED_FIELDS = [
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname not in USER_UNCACHED_FIELDS
+]
+
 
 def jwt_base_payload(exp_delta: timedelta) -> Dict[str, Any]:
     utc_now = datetime.utcnow()
@@ -96,8 +116,92 @@ def get_token_from_request(request: WSGIRequest) -> Optional[str]:
     return auth[1]
 
 
+def _get_user_auth_cache_key(user_pk) -> str:
+    version = get_cache_version(USER_AUTH_VERSION_CACHE_KEY)
+    return USER_AUTH_CACHE_KEY.format(version=version, user_pk=user_pk)
+
+
+def _get_user_pk_from_payload(payload: Dict[str, Any]) -> Optional[str]:
+    try:
+        _type, user_pk = graphene.Node.from_global_id(payload["user_id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return user_pk
+
+
+def _get_deferred_user(fields: Dict[str, Any]) -> User:
+    # Saving a user loaded from a database updates only the loaded fields
+    values = [fields[name] for name in USER_CACHED_FIELDS]
+    return User.from_db(router.db_for_read(User), USER_CACHED_FIELDS, values)
+
+
+def _get_cached_user(user_pk, email: str) -> Optional[User]:
+    data = cache.get(_get_user_auth_cache_key(user_pk))
+    if data is None or data["fields"]["email"] != email:
+        return None
+    user = _get_deferred_user(data["fields"])
+    user._effective_permissions_cache = set(data["permissions"])
+    return user
+
+
+def _get_user_and_cache(email: str) -> Optional[User]:
+    fields = (
+        User.objects.filter(email=email, is_active=True)
+        .values(*USER_CACHED_FIELDS)
+        .first()
+    )
+    if fields is None:
+        return None
+    user = _get_deferred_user(fields)
+    permissions = user.effective_permissions.values_list(
+        "content_type__app_label", "codename"
+    ).order_by()
+    user._effective_permissions_cache = {
+        "%s.%s" % (app_label, codename) for app_label, codename in permissions
+    }
+    cache.set(
+        _get_user_auth_cache_key(user.pk),
+        {"fields": fields, "permissions": user._effective_permissions_cache},
+        timeout=settings.JWT_USER_CACHE_TIMEOUT,
+    )
+    return user
+
+
+def _get_active_user(payload: Dict[str, Any]) -> Optional[User]:
+    email = payload["email"]
+    if not settings.JWT_USER_CACHE_TIMEOUT:
+        return User.objects.filter(email=email, is_active=True).first()
+    user_pk = _get_user_pk_from_payload(payload)
+    user = _get_cached_user(user_pk, email) if user_pk else None
+    return user or _get_user_and_cache(email)
+
+
+def invalidate_user_auth_cache(user_pk):
+    """Drop the cached authentication data of a user after the commit."""
+
+    def _invalidate():
+        cache.delete(_get_user_auth_cache_key(user_pk))
+
+    transaction.on_commit(_invalidate)
+
+
+def invalidate_users_auth_cache():
+    """Drop the cached authentication data of all users after the commit.
+
+    Use it when permissions of groups change, as they affect many users.
+    """
+    transaction.on_commit(lambda: bump_cache_version(USER_AUTH_VERSION_CACHE_KEY))
+
+
 def get_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
-    user = User.objects.filter(email=payload["email"], is_active=True).first()
+    """Return the active user the token was issued for.
+
+    With `JWT_USER_CACHE_TIMEOUT` set, fields from `USER_CACHED_FIELDS` and
+    effective permissions of users are cached for that many seconds, so
+    verifying a token doesn't hit the database. The cache is invalidated
+    whenever a user is saved and when permission groups change.
+    """
+    user = _get_active_user(payload)
     user_jwt_token = payload.get("token")
     if not user_jwt_token or not user:
         raise jwt.InvalidTokenError(
@@ -120,11 +224,20 @@ def get_user_from_access_token(token: str) -> Optional[User]:
     permissions = payload.get(PERMISSIONS_FIELD, None)
     user = get_user_from_payload(payload)
     if user and permissions is not None:
-        token_permissions = get_permissions_from_names(permissions)
-        token_codenames = [perm.codename for perm in token_permissions]
+        permission_enums = get_permissions_enum_dict()
+        token_codenames = split_permission_codename(
+            [permission_enums[name].value for name in permissions]
+        )
+        user_permissions = getattr(user, "_effective_permissions_cache", None)
         user.effective_permissions = user.effective_permissions.filter(
             codename__in=token_codenames
         )
+        if user_permissions is not None:
+            user._effective_permissions_cache = {
+                permission
+                for permission in user_permissions
+                if permission.split(".")[1] in token_codenames
+            }
     return user
 
 
@@ -8,6 +8,7 @@ from ....order.models import Order, OrderLine
 from ....payment.models import Payment, Transaction
 from ....product.models import Product, ProductVariant
 from ....shipping.models import ShippingMethod
+from ....shipping.utils import invalidate_shipping_methods_index
 
 
 class Command(BaseCommand):
@@ -51,3 +52,4 @@ class Command(BaseCommand):
         Product.objects.update(currency=currency)
         ProductVariant.objects.update(currency=currency)
         ShippingMethod.objects.update(currency=currency)
+        invalidate_shipping_methods_index()
@@ -1,29 +1,47 @@
 import logging
 
 from django.core.management.base import BaseCommand
-from versatileimagefield.image_warmer import VersatileImageFieldWarmer
 
-from ....product.models import ProductImage
+from ....account.models import User
+from ....product.models import Category, Collection, ProductImage
+from ...thumbnails import warm_thumbnails_in_processes
 
 logger = logging.getLogger(__name__)
 
+# Models with images, their rendition key sets and image fields
+THUMBNAIL_SOURCES = [
+    ("Products", ProductImage, "products", "image"),
+    ("Categories", Category, "background_images", "background_image"),
+    ("Collections", Collection, "background_images", "background_image"),
+    ("User avatars", User, "user_avatars", "avatar"),
+]
+
 
 class Command(BaseCommand):
     help = "Generate thumbnails for all images"
 
-    def handle(self, *args, **options):
-        self.warm_products()
-
-    def warm_products(self):
-        self.stdout.write("Products thumbnails generation:")
-        warmer = VersatileImageFieldWarmer(
-            instance_or_queryset=ProductImage.objects.all(),
-            rendition_key_set="products",
-            image_attr="image",
-            verbose=True,
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes generating thumbnails",
         )
-        num_created, failed_to_create = warmer.warm()
-        self.log_failed_images(failed_to_create)
+
+    def handle(self, *args, **options):
+        for name, model, size_set, image_attr in THUMBNAIL_SOURCES:
+            self.stdout.write(f"{name} thumbnails generation:")
+            pks = (
+                model.objects.exclude(**{image_attr: ""})
+                .exclude(**{f"{image_attr}__isnull": True})
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            num_created, failed_to_create = warm_thumbnails_in_processes(
+                model, pks, size_set, image_attr, workers=options["workers"]
+            )
+            self.stdout.write(f"Warmed {num_created} image(s).")
+            self.log_failed_images(failed_to_create)
 
     def log_failed_images(self, failed_to_create):
         if failed_to_create:
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ....warehouse.management import reconcile_stocks_quantity_allocated
+
+
+class Command(BaseCommand):
+    help = "Recalculate allocated quantity of all stocks from their allocations."
+
+    def handle(self, *args, **options):
+        fixed_stocks = reconcile_stocks_quantity_allocated()
+        self.stdout.write(f"Fixed allocated quantity of {fixed_stocks} stock(s).")
@@ -0,0 +1,11 @@
+from typing import List
+
+from ..celeryconf import app
+from .thumbnails import warm_queued_thumbnails
+
+
+@app.task
+def create_thumbnails_batch_task(
+    model_label: str, pks: List, size_set: str, image_attr: str
+):
+    warm_queued_thumbnails(model_label, pks, size_set, image_attr)
@@ -1,20 +1,27 @@
+from unittest.mock import patch
+
 import jwt
 import pytest
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
 from freezegun import freeze_time
 from jwt import ExpiredSignatureError, InvalidSignatureError, InvalidTokenError
 
+from ...account.models import User
 from ..auth_backend import JSONWebTokenBackend
 from ..jwt import (
     JWT_ACCESS_TYPE,
     JWT_ALGORITHM,
+    USER_CACHED_FIELDS,
+    USER_UNCACHED_FIELDS,
+    _get_user_auth_cache_key,
     create_access_token,
     create_access_token_for_app,
     create_refresh_token,
     jwt_encode,
     jwt_user_payload,
 )
-from ..permissions import get_permissions_from_names
+from ..permissions import AccountPermissions, get_permissions_from_names
 
 
 def test_user_authenticated(rf, staff_user):
@@ -175,3 +182,89 @@ def test_user_has_old_token_type(rf, staff_user, settings):
     backend = JSONWebTokenBackend()
     with pytest.raises(InvalidTokenError):
         backend.authenticate(request)
+
+
+def test_user_authenticated_from_cache(
+    rf, staff_user, permission_manage_users, settings, django_assert_num_queries
+):
+    settings.JWT_USER_CACHE_TIMEOUT = 60
+    cache.clear()
+    staff_user.user_permissions.add(permission_manage_users)
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+
+    with django_assert_num_queries(0):
+        user = backend.authenticate(request)
+        assert user.has_perm(AccountPermissions.MANAGE_USERS)
+
+    assert user == staff_user
+    assert user.email == staff_user.email
+
+
+def test_user_cache_holds_no_sensitive_fields(
+    rf, staff_user, settings, django_assert_num_queries
+):
+    settings.JWT_USER_CACHE_TIMEOUT = 60
+    cache.clear()
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+
+    with django_assert_num_queries(0):
+        user = backend.authenticate(request)
+        assert user.first_name == staff_user.first_name
+        assert user.date_joined == staff_user.date_joined
+
+    data = cache.get(_get_user_auth_cache_key(staff_user.pk))
+    assert set(data["fields"]) == set(USER_CACHED_FIELDS)
+    assert user.get_deferred_fields() == USER_UNCACHED_FIELDS
+
+
+def test_saving_cached_user_updates_only_loaded_fields(
+    rf, staff_user, settings, django_assert_num_queries
+):
+    settings.JWT_USER_CACHE_TIMEOUT = 60
+    cache.clear()
+    staff_user.note = "Staff note"
+    staff_user.save()
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+    user = backend.authenticate(request)
+    user.first_name = "Updated"
+
+    with django_assert_num_queries(1):
+        user.save()
+
+    staff_user.refresh_from_db()
+    assert staff_user.first_name == "Updated"
+    assert staff_user.note == "Staff note"
+
+
+def test_user_cache_not_used_for_token_with_other_email(rf, staff_user, settings):
+    settings.JWT_USER_CACHE_TIMEOUT = 60
+    cache.clear()
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+    staff_user.email = "new@example.com"
+    User.objects.filter(pk=staff_user.pk).update(email=staff_user.email)
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    user = backend.authenticate(request)
+
+    assert user.email == "new@example.com"
+
+
+@patch("saleor.core.jwt.invalidate_user_auth_cache")
+def test_saving_user_invalidates_auth_cache(mocked_invalidate, staff_user):
+    staff_user.is_active = False
+    staff_user.save()
+
+    mocked_invalidate.assert_called_once_with(staff_user.pk)
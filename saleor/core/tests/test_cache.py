@@ -0,0 +1,75 @@
+from unittest.mock import Mock
+
+from ...tests.utils import flush_post_commit_hooks
+from ..utils import cache as cache_utils
+from ..utils.cache import ProcessCache
+
+VERSION_CACHE_KEY = "test_process_cache_version"
+
+
+def test_process_cache_reuses_data(settings):
+    settings.TEST_PROCESS_CACHE_TIMEOUT = 60
+    load = Mock(side_effect=dict)
+    process_cache = ProcessCache(VERSION_CACHE_KEY, "TEST_PROCESS_CACHE_TIMEOUT", load)
+
+    data = process_cache.get()
+
+    assert process_cache.get() is data
+    assert load.call_count == 1
+
+
+def test_process_cache_loads_data_without_timeout(settings):
+    settings.TEST_PROCESS_CACHE_TIMEOUT = 0
+    load = Mock(side_effect=dict)
+    process_cache = ProcessCache(VERSION_CACHE_KEY, "TEST_PROCESS_CACHE_TIMEOUT", load)
+
+    process_cache.get()
+    process_cache.get()
+
+    assert load.call_count == 2
+
+
+def test_process_cache_reloads_invalidated_data(settings):
+    settings.TEST_PROCESS_CACHE_TIMEOUT = 60
+    load = Mock(side_effect=dict)
+    process_cache = ProcessCache(VERSION_CACHE_KEY, "TEST_PROCESS_CACHE_TIMEOUT", load)
+    other_process_cache = ProcessCache(
+        VERSION_CACHE_KEY, "TEST_PROCESS_CACHE_TIMEOUT", load
+    )
+    data = process_cache.get()
+    other_process_cache.get()
+
+    other_process_cache.invalidate()
+    assert process_cache.get() is data
+    flush_post_commit_hooks()
+
+    assert process_cache.get() is not data
+    assert load.call_count == 3
+
+
+def test_process_cache_reloads_expired_data(settings, monkeypatch):
+    settings.TEST_PROCESS_CACHE_TIMEOUT = 60
+    load = Mock(side_effect=dict)
+    process_cache = ProcessCache(VERSION_CACHE_KEY, "TEST_PROCESS_CACHE_TIMEOUT", load)
+    data = process_cache.get()
+
+    monkeypatch.setattr(cache_utils.time, "monotonic", Mock(return_value=10 ** 9))
+
+    assert process_cache.get() is not data
+    assert load.call_count == 2
+
+
+class DayCache(ProcessCache[int]):
+    def is_valid(self, data, *args):
+        return args == (data,)
+
+
+def test_process_cache_reloads_data_not_valid_for_arguments(settings):
+    settings.TEST_PROCESS_CACHE_TIMEOUT = 60
+    load = Mock(side_effect=lambda day: day)
+    process_cache = DayCache(VERSION_CACHE_KEY, "TEST_PROCESS_CACHE_TIMEOUT", load)
+
+    assert process_cache.get(1) == 1
+    assert process_cache.get(1) == 1
+    assert process_cache.get(2) == 2
+    assert load.call_count == 2
@@ -0,0 +1,140 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+
+from ...product.models import Product
+from ...search.backends.memory import (
+    INDEX_CHANGE_CACHE_KEY,
+    InMemorySearchBackend,
+    get_index_sequence,
+)
+from ...tests.utils import flush_post_commit_hooks
+
+
+@pytest.fixture
+def search_backend():
+    return InMemorySearchBackend()
+
+
+def test_memory_search_ranks_name_above_description(
+    search_backend, product, product_with_single_variant
+):
+    product.description = "Available in a single variant."
+    product.save(update_fields=["description"])
+    search_backend.update([product.pk])
+    flush_post_commit_hooks()
+
+    results = search_backend.search("single")
+
+    assert results == [product_with_single_variant.pk, product.pk]
+
+
+def test_memory_search_matches_all_words(
+    search_backend, product, product_with_single_variant
+):
+    assert search_backend.search("test single") == [product_with_single_variant.pk]
+
+
+def test_memory_search_by_sku_and_attribute_value(search_backend, product):
+    value = product.attributes.first().values.first()
+
+    assert search_backend.search(product.variants.first().sku) == [product.pk]
+    assert search_backend.search(value.name) == [product.pk]
+
+
+def test_memory_search_pagination(search_backend, product_list):
+    results = search_backend.search("test", limit=2, offset=1)
+
+    assert len(results) == 2
+    assert results == search_backend.search("test")[1:3]
+
+
+def test_memory_search_update_and_delete(search_backend, product):
+    search_backend.search("test")
+    Product.objects.filter(pk=product.pk).update(name="Renamed")
+
+    search_backend.update([product.pk])
+    flush_post_commit_hooks()
+    assert search_backend.search("renamed") == [product.pk]
+
+    search_backend.delete([product.pk])
+    flush_post_commit_hooks()
+    assert search_backend.search("renamed") == []
+
+
+def test_memory_search_by_word_prefix(search_backend, product):
+    assert search_backend.search("tes") == [product.pk]
+    Product.objects.filter(pk=product.pk).update(name="Renamed")
+
+    search_backend.update([product.pk])
+    flush_post_commit_hooks()
+
+    assert search_backend.search("ren") == [product.pk]
+    assert search_backend.search("tes") == []
+
+
+def test_memory_search_applies_changes_of_other_processes(search_backend, product):
+    other_process_backend = InMemorySearchBackend()
+    other_process_backend.search("test")
+    sequence = get_index_sequence()
+    Product.objects.filter(pk=product.pk).update(name="Renamed")
+
+    search_backend.update([product.pk])
+    flush_post_commit_hooks()
+
+    assert get_index_sequence() == sequence + 1
+    with patch.object(
+        other_process_backend,
+        "_index_products",
+        wraps=other_process_backend._index_products,
+    ) as mocked_index_products:
+        assert other_process_backend.search("renamed") == [product.pk]
+    mocked_index_products.assert_called_once_with({product.pk})
+
+
+def test_memory_search_rebuilds_index_after_missed_changes(
+    search_backend, product_list
+):
+    other_process_backend = InMemorySearchBackend()
+    other_process_backend.search("test")
+    product = product_list[0]
+    Product.objects.filter(pk=product.pk).update(name="Renamed")
+    search_backend.update([product.pk])
+    flush_post_commit_hooks()
+    cache.delete(INDEX_CHANGE_CACHE_KEY.format(get_index_sequence()))
+
+    with patch.object(
+        other_process_backend,
+        "_index_products",
+        wraps=other_process_backend._index_products,
+    ) as mocked_index_products:
+        assert other_process_backend.search("renamed") == [product.pk]
+    mocked_index_products.assert_called_once()
+    (product_pks,), _ = mocked_index_products.call_args
+    assert set(product_pks) == {listed.pk for listed in product_list}
+
+
+def test_memory_search_skips_rolled_back_update(search_backend, product):
+    search_backend.search("test")
+    sequence = get_index_sequence()
+
+    with pytest.raises(DatabaseError):
+        with transaction.atomic():
+            Product.objects.filter(pk=product.pk).update(name="Renamed")
+            search_backend.update([product.pk])
+            raise DatabaseError()
+    flush_post_commit_hooks()
+
+    assert get_index_sequence() == sequence
+    assert search_backend.search("renamed") == []
+    assert search_backend.search("test") == [product.pk]
+
+
+def test_memory_search_filter_products(search_backend, product_list):
+    sku = product_list[1].variants.first().sku
+
+    qs = search_backend.filter_products(Product.objects.all(), sku)
+
+    assert list(qs) == [product_list[1]]
@@ -1,9 +1,12 @@
 import pytest
+from django.db import connection
 from django.utils.text import slugify
 
 from ...account.models import Address
 from ...product.models import Product
-from ...search.backends.postgresql import search_storefront
+from ...search.backends.postgresql import PostgreSQLSearchBackend, search_storefront
+from ...search.backends.postgresql_storefront import NAME_SIMILARITY_THRESHOLD
+from ...search.documents import update_product_search_documents
 
 PRODUCTS = [
     ("Arabica Coffee", "The best grains in galactic"),
@@ -78,3 +81,57 @@ def gen_address_for_user(first_name, last_name):
         postal_code="53-601",
         country="PL",
     )
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_storefront_search_by_sku(product):
+    results = execute_search(product.variants.first().sku)
+    assert list(results) == [product]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_storefront_search_by_attribute_value(product):
+    value = product.attributes.first().values.first()
+    results = execute_search(value.name)
+    assert list(results) == [product]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_storefront_search_by_translation(product, product_translation_fr):
+    update_product_search_documents([product.pk])
+    results = execute_search("French")
+    assert list(results) == [product]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_storefront_search_deleted_variant_sku(product):
+    variant = product.variants.first()
+    variant.delete()
+    results = execute_search(variant.sku)
+    assert not results.exists()
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_postgresql_backend_search_ranks_and_paginates(named_products):
+    backend = PostgreSQLSearchBackend()
+    named_products[1].description = "Cool coffee"
+    named_products[1].save(update_fields=["description"])
+
+    results = backend.search("coffee")
+
+    assert results == [named_products[0].pk, named_products[1].pk]
+    assert backend.search("coffee", limit=1, offset=1) == [named_products[1].pk]
+
+
+def test_storefront_search_sets_similarity_threshold(named_products):
+    list(execute_search("Coffee"))
+
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW pg_trgm.similarity_threshold")
+        threshold = cursor.fetchone()[0]
+    assert float(threshold) == NAME_SIMILARITY_THRESHOLD
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from ...product.models import ProductImage
+from ..thumbnails import queue_thumbnails, warm_queued_thumbnails, warm_thumbnails
+
+
+@patch("saleor.core.thumbnails.VersatileImageFieldWarmer")
+def test_warm_thumbnails_skips_instances_without_image(mock_warmer, product_with_image):
+    mock_warmer.return_value.warm.return_value = (1, [])
+    image = product_with_image.images.first()
+    empty_image = ProductImage.objects.create(product=product_with_image, image="")
+
+    result = warm_thumbnails(ProductImage, [image.pk, empty_image.pk], "products")
+
+    assert result == (1, [])
+    _, kwargs = mock_warmer.call_args
+    assert list(kwargs["instance_or_queryset"]) == [image]
+    assert kwargs["rendition_key_set"] == "products"
+
+
+@patch("saleor.core.tasks.create_thumbnails_batch_task.delay")
+def test_queue_thumbnails_skips_pending_images(mock_delay, product_with_image):
+    cache.clear()
+    image = product_with_image.images.first()
+
+    queue_thumbnails(ProductImage, [image.pk], "products")
+    queue_thumbnails(ProductImage, [image.pk], "products")
+
+    mock_delay.assert_called_once_with(
+        "product.ProductImage", [image.pk], "products", "image"
+    )
+
+
+@patch("saleor.core.thumbnails.warm_thumbnails")
+@patch("saleor.core.tasks.create_thumbnails_batch_task.delay")
+def test_warm_queued_thumbnails_releases_pending_images(
+    mock_delay, mock_warm_thumbnails, product_with_image
+):
+    cache.clear()
+    image = product_with_image.images.first()
+    queue_thumbnails(ProductImage, [image.pk], "products")
+
+    warm_queued_thumbnails("product.ProductImage", [image.pk], "products", "image")
+    queue_thumbnails(ProductImage, [image.pk], "products")
+
+    mock_warm_thumbnails.assert_called_once_with(
+        ProductImage, [image.pk], "products", "image"
+    )
+    assert mock_delay.call_count == 2
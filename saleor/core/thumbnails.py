@@ -0,0 +1,124 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Tuple, Type
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Model, Q
+from versatileimagefield.image_warmer import VersatileImageFieldWarmer
+
+logger = logging.getLogger(__name__)
+
+# Number of images handled by a single task or worker process call
+THUMBNAILS_BATCH_SIZE = 100
+
+# Images queued for warming are marked in the cache, so images queued again
+# before their task runs are skipped, the mark expires if the task is lost
+THUMBNAILS_PENDING_CACHE_KEY = "thumbnails_pending:{model}:{image_attr}:{pk}"
+THUMBNAILS_PENDING_TIMEOUT = 60 * 60
+
+
+def _get_pending_key(model_label: str, image_attr: str, pk) -> str:
+    return THUMBNAILS_PENDING_CACHE_KEY.format(
+        model=model_label, image_attr=image_attr, pk=pk
+    )
+
+
+def _batches(pks: List, batch_size: int) -> Iterable[List]:
+    for start in range(0, len(pks), batch_size):
+        end = start + batch_size
+        yield pks[start:end]
+
+
+def warm_thumbnails(
+    model: Type[Model], pks: Iterable, size_set: str, image_attr: str = "image"
+) -> Tuple[int, List[str]]:
+    """Create missing thumbnails of images of the given instances.
+
+    Renditions which already exist in the storage are not created again.
+    Return the number of warmed images and paths of images that failed.
+    """
+    instances = model.objects.filter(pk__in=list(pks)).exclude(
+        Q(**{image_attr: ""}) | Q(**{f"{image_attr}__isnull": True})
+    )
+    warmer = VersatileImageFieldWarmer(
+        instance_or_queryset=instances,
+        rendition_key_set=size_set,
+        image_attr=image_attr,
+    )
+    num_created, failed_to_create = warmer.warm()
+    if num_created:
+        logger.info("Created thumbnails for %d images", num_created)
+    if failed_to_create:
+        logger.error("Failed to generate thumbnails", extra={"paths": failed_to_create})
+    return num_created, failed_to_create
+
+
+def _warm_thumbnails_batch(
+    model_label: str, pks: List, size_set: str, image_attr: str
+) -> Tuple[int, List[str]]:
+    return warm_thumbnails(apps.get_model(model_label), pks, size_set, image_attr)
+
+
+def warm_thumbnails_in_processes(
+    model: Type[Model],
+    pks: Iterable,
+    size_set: str,
+    image_attr: str = "image",
+    workers: int = 1,
+    batch_size: int = THUMBNAILS_BATCH_SIZE,
+) -> Tuple[int, List[str]]:
+    """Create missing thumbnails of images in batches spread over processes."""
+    pks = list(pks)
+    if workers <= 1:
+        return warm_thumbnails(model, pks, size_set, image_attr)
+
+    model_label = model._meta.label
+    num_created = 0
+    failed_to_create: List[str] = []
+    # Forked processes can't share connections of the parent process
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = [
+            executor.submit(
+                _warm_thumbnails_batch, model_label, batch, size_set, image_attr
+            )
+            for batch in _batches(pks, batch_size)
+        ]
+        for result in results:
+            batch_created, batch_failed = result.result()
+            num_created += batch_created
+            failed_to_create.extend(batch_failed)
+    return num_created, failed_to_create
+
+
+def warm_queued_thumbnails(model_label: str, pks: List, size_set: str, image_attr: str):
+    """Create thumbnails of a batch queued with `queue_thumbnails`."""
+    try:
+        _warm_thumbnails_batch(model_label, pks, size_set, image_attr)
+    finally:
+        cache.delete_many([_get_pending_key(model_label, image_attr, pk) for pk in pks])
+
+
+def queue_thumbnails(
+    model: Type[Model], pks: Iterable, size_set: str, image_attr: str = "image"
+):
+    """Schedule creating thumbnails of many images with a few tasks.
+
+    Images which are already waiting for their thumbnails are skipped.
+    """
+    from .tasks import create_thumbnails_batch_task
+
+    model_label = model._meta.label
+    pending_pks = [
+        pk
+        for pk in pks
+        if cache.add(
+            _get_pending_key(model_label, image_attr, pk),
+            True,
+            timeout=THUMBNAILS_PENDING_TIMEOUT,
+        )
+    ]
+    for batch in _batches(pending_pks, THUMBNAILS_BATCH_SIZE):
+        create_thumbnails_batch_task.delay(model_label, batch, size_set, image_attr)
@@ -1,4 +1,3 @@
-import logging
 import socket
 from typing import TYPE_CHECKING, Optional, Type, Union
 from urllib.parse import urljoin
@@ -14,10 +13,10 @@ from django_countries.fields import Country
 from django_prices_openexchangerates import exchange_currency
 from geolite2 import geolite2
 from prices import MoneyRange
-from versatileimagefield.image_warmer import VersatileImageFieldWarmer
+
+from ..thumbnails import warm_thumbnails
 
 georeader = geolite2.reader()
-logger = logging.getLogger(__name__)
 
 
 if TYPE_CHECKING:
@@ -114,22 +113,7 @@ def to_local_currency(price, currency):
 
 
 def create_thumbnails(pk, model, size_set, image_attr=None):
-    instance = model.objects.get(pk=pk)
-    if not image_attr:
-        image_attr = "image"
-    image_instance = getattr(instance, image_attr)
-    if image_instance.name == "":
-        # There is no file, skip processing
-        return
-    warmer = VersatileImageFieldWarmer(
-        instance_or_queryset=instance, rendition_key_set=size_set, image_attr=image_attr
-    )
-    logger.info("Creating thumbnails for  %s", pk)
-    num_created, failed_to_create = warmer.warm()
-    if num_created:
-        logger.info("Created %d thumbnails", num_created)
-    if failed_to_create:
-        logger.error("Failed to generate thumbnails", extra={"paths": failed_to_create})
+    warm_thumbnails(model, [pk], size_set, image_attr or "image")
 
 
 def generate_unique_slug(
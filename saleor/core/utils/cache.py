@@ -0,0 +1,80 @@
+import time
+from typing import Callable, Generic, Optional, TypeVar
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+T = TypeVar("T")
+
+
+def get_cache_version(key: str) -> str:
+    """Return the current version token stored under the given cache key.
+
+    The token is shared by all processes using the same cache, so it can be
+    compared with the version of data cached in process memory to find out
+    if the data became stale.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key: str) -> str:
+    """Invalidate data cached under the given version key in all processes.
+
+    Return the new version token.
+    """
+    version = uuid4().hex
+    cache.set(key, version, timeout=None)
+    return version
+
+
+class ProcessCache(Generic[T]):
+    """Data loaded once and reused by the process.
+
+    The data is loaded again after any process invalidates it and after the
+    number of seconds given by the `timeout_setting`, with no timeout it is
+    loaded on every call. It is shared between callers and must not be modified.
+    """
+
+    def __init__(self, version_key: str, timeout_setting: str, load: Callable[..., T]):
+        self.version_key = version_key
+        self.timeout_setting = timeout_setting
+        self.load = load
+        self._data: Optional[T] = None
+        self._version: Optional[str] = None
+        self._expire_at = 0.0
+
+    def is_valid(self, data: T, *args) -> bool:
+        """Return True if the loaded data can be reused for the given arguments."""
+        return True
+
+    def get(self, *args) -> T:
+        """Return the data, loading it with the given arguments when stale."""
+        timeout = getattr(settings, self.timeout_setting)
+        if not timeout:
+            return self.load(*args)
+        version = get_cache_version(self.version_key)
+        data = self._data
+        if (
+            data is None
+            or self._version != version
+            or time.monotonic() >= self._expire_at
+            or not self.is_valid(data, *args)
+        ):
+            data = self._data = self.load(*args)
+            self._version = version
+            self._expire_at = time.monotonic() + timeout
+        return data
+
+    def invalidate(self):
+        """Drop the data in all processes once the transaction is committed."""
+        transaction.on_commit(self._invalidate)
+
+    def _invalidate(self):
+        self._data = None
+        bump_cache_version(self.version_key)
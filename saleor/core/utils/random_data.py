@@ -31,6 +31,7 @@ from ...core.permissions import (
     OrderPermissions,
     get_permissions,
 )
+from ...core.thumbnails import queue_thumbnails
 from ...core.utils import build_absolute_uri
 from ...core.weight import zero_weight
 from ...discount import DiscountValueType, VoucherType
@@ -63,9 +64,14 @@ from ...product.tasks import update_products_minimal_variant_prices_of_discount_
 from ...product.thumbnails import (
     create_category_background_image_thumbnails,
     create_collection_background_image_thumbnails,
-    create_product_thumbnails,
 )
+from ...product.utils.attributes import (
+    update_product_attributes_sort_keys,
+    update_products_attribute_value_ids,
+)
+from ...search.utils import rebuild_search_index
 from ...shipping.models import ShippingMethod, ShippingMethodType, ShippingZone
+from ...shipping.utils import invalidate_shipping_methods_index
 from ...warehouse.management import increase_stock
 from ...warehouse.models import Stock, Warehouse
 
@@ -208,6 +214,7 @@ def create_attributes_values(values_data):
 
 
 def create_products(products_data, placeholder_dir, create_images):
+    image_pks = []
     for product in products_data:
         pk = product["pk"]
         # We are skipping products without images
@@ -224,7 +231,12 @@ def create_products(products_data, placeholder_dir, create_images):
         if create_images:
             images = IMAGES_MAPPING.get(pk, [])
             for image_name in images:
-                create_product_image(product, placeholder_dir, image_name)
+                product_image = create_product_image(
+                    product, placeholder_dir, image_name
+                )
+                if product_image:
+                    image_pks.append(product_image.pk)
+    queue_thumbnails(ProductImage, image_pks, size_set="products")
 
 
 def create_stocks(variant, warehouse_qs=None, **defaults):
@@ -336,6 +348,9 @@ def create_products_by_schema(placeholder_dir, create_images):
     assign_attributes_to_variants(
         variant_attributes=types["product.assignedvariantattribute"]
     )
+    update_products_attribute_value_ids(Product.objects.values_list("pk", flat=True))
+    update_product_attributes_sort_keys(AssignedProductAttribute.objects.all())
+    rebuild_search_index()
     create_collections(
         data=types["product.collection"], placeholder_dir=placeholder_dir
     )
@@ -369,7 +384,6 @@ def create_product_image(product, placeholder_dir, image_name):
         return None
     product_image = ProductImage(product=product, image=image)
     product_image.save()
-    create_product_thumbnails.delay(product_image.pk)
     return product_image
 
 
@@ -514,6 +528,9 @@ def create_fulfillments(order):
 
             allocation.quantity_allocated = F("quantity_allocated") - quantity
             allocation.save(update_fields=["quantity_allocated"])
+            stock = allocation.stock
+            stock.quantity_allocated = F("quantity_allocated") - quantity
+            stock.save(update_fields=["quantity_allocated"])
 
     update_order_status(order)
 
@@ -673,6 +690,7 @@ def create_shipping_zone(shipping_methods_names, countries, shipping_zone_name):
             for name in shipping_methods_names
         ]
     )
+    invalidate_shipping_methods_index()
     return "Shipping Zone: %s" % shipping_zone
 
 
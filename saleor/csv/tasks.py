@@ -47,6 +47,7 @@ def export_products_task(
     export_info: Dict[str, list],
     file_type: str,
     delimiter: str = ";",
+    compress: bool = False,
 ):
     export_file = ExportFile.objects.get(pk=export_file_id)
-    export_products(export_file, scope, export_info, file_type, delimiter)
+    export_products(export_file, scope, export_info, file_type, delimiter, compress)
@@ -1,9 +1,8 @@
+import gzip
 import shutil
-from tempfile import NamedTemporaryFile
 from unittest.mock import ANY, MagicMock, patch
 
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -13,8 +12,7 @@ from ....graphql.csv.enums import ProductFieldEnum
 from ....product.models import Product
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
-    create_file_with_headers,
+    create_file_with_rows,
     export_products,
     export_products_in_batches,
     get_filename,
@@ -26,7 +24,7 @@ from ...utils.export import (
 @pytest.mark.parametrize(
     "file_type", [FileTypes.CSV, FileTypes.XLSX],
 )
-@patch("saleor.csv.utils.export.create_file_with_headers")
+@patch("saleor.csv.utils.export.create_file_with_rows")
 @patch("saleor.csv.utils.export.export_products_in_batches")
 @patch("saleor.csv.utils.export.send_email_with_link_to_download_file")
 @patch("saleor.csv.utils.export.save_csv_file_in_export_file")
@@ -34,7 +32,7 @@ def test_export_products(
     save_file_mock,
     send_email_mock,
     export_products_in_batches_mock,
-    create_file_with_headers_mock,
+    create_file_with_rows_mock,
     product_list,
     user_export_file,
     file_type,
@@ -47,35 +45,32 @@ def test_export_products(
     }
 
     mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    create_file_with_rows_mock.return_value = mock_file
 
     # when
     export_products(user_export_file, {"all": ""}, export_info, file_type)
 
     # then
-    create_file_with_headers_mock.assert_called_once_with(
-        ["id", "name"], ";", file_type
+    create_file_with_rows_mock.assert_called_once_with(
+        ["id", "name"],
+        export_products_in_batches_mock.return_value,
+        ";",
+        file_type,
+        False,
     )
     assert export_products_in_batches_mock.call_count == 1
     args, kwargs = export_products_in_batches_mock.call_args
     assert set(args[0].values_list("pk", flat=True)) == set(
         Product.objects.all().values_list("pk", flat=True)
     )
-    assert args[1:] == (
-        export_info,
-        {"id", "name"},
-        ["id", "name"],
-        ";",
-        mock_file,
-        file_type,
-    )
+    assert args[1:] == (export_info, {"id", "name"}, ["id", "name"])
     send_email_mock.assert_called_once_with(
         user_export_file, user_export_file.user.email, "export_products_success"
     )
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
 
 
-@patch("saleor.csv.utils.export.create_file_with_headers")
+@patch("saleor.csv.utils.export.create_file_with_rows")
 @patch("saleor.csv.utils.export.export_products_in_batches")
 @patch("saleor.csv.utils.export.send_email_with_link_to_download_file")
 @patch("saleor.csv.utils.export.save_csv_file_in_export_file")
@@ -83,7 +78,7 @@ def test_export_products_ids(
     save_file_mock,
     send_email_mock,
     export_products_in_batches_mock,
-    create_file_with_headers_mock,
+    create_file_with_rows_mock,
     product_list,
     user_export_file,
 ):
@@ -96,27 +91,29 @@ def test_export_products_ids(
     assert not user_export_file.content_file
 
     mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    create_file_with_rows_mock.return_value = mock_file
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
 
     # then
-    create_file_with_headers_mock.assert_called_once_with(["id"], ";", file_type)
+    create_file_with_rows_mock.assert_called_once_with(
+        ["id"], export_products_in_batches_mock.return_value, ";", file_type, False
+    )
 
     assert export_products_in_batches_mock.call_count == 1
     args, kwargs = export_products_in_batches_mock.call_args
     assert set(args[0].values_list("pk", flat=True)) == set(
         Product.objects.filter(pk__in=pks).values_list("pk", flat=True)
     )
-    assert args[1:] == (export_info, {"id"}, ["id"], ";", mock_file, file_type,)
+    assert args[1:] == (export_info, {"id"}, ["id"])
     send_email_mock.assert_called_once_with(
         user_export_file, user_export_file.user.email, "export_products_success"
     )
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
 
 
-@patch("saleor.csv.utils.export.create_file_with_headers")
+@patch("saleor.csv.utils.export.create_file_with_rows")
 @patch("saleor.csv.utils.export.export_products_in_batches")
 @patch("saleor.csv.utils.export.send_email_with_link_to_download_file")
 @patch("saleor.csv.utils.export.save_csv_file_in_export_file")
@@ -124,7 +121,7 @@ def test_export_products_filter(
     save_file_mock,
     send_email_mock,
     export_products_in_batches_mock,
-    create_file_with_headers_mock,
+    create_file_with_rows_mock,
     product_list,
     user_export_file,
 ):
@@ -139,7 +136,7 @@ def test_export_products_filter(
     assert not user_export_file.content_file
 
     mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    create_file_with_rows_mock.return_value = mock_file
 
     # when
     export_products(
@@ -147,21 +144,23 @@ def test_export_products_filter(
     )
 
     # then
-    create_file_with_headers_mock.assert_called_once_with(["id"], ";", file_type)
+    create_file_with_rows_mock.assert_called_once_with(
+        ["id"], export_products_in_batches_mock.return_value, ";", file_type, False
+    )
 
     assert export_products_in_batches_mock.call_count == 1
     args, kwargs = export_products_in_batches_mock.call_args
     assert set(args[0].values_list("pk", flat=True)) == set(
         Product.objects.filter(is_published=True).values_list("pk", flat=True)
     )
-    assert args[1:] == (export_info, {"id"}, ["id"], ";", mock_file, file_type,)
+    assert args[1:] == (export_info, {"id"}, ["id"])
     send_email_mock.assert_called_once_with(
         user_export_file, user_export_file.user.email, "export_products_success"
     )
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
 
 
-@patch("saleor.csv.utils.export.create_file_with_headers")
+@patch("saleor.csv.utils.export.create_file_with_rows")
 @patch("saleor.csv.utils.export.export_products_in_batches")
 @patch("saleor.csv.utils.export.send_email_with_link_to_download_file")
 @patch("saleor.csv.utils.export.save_csv_file_in_export_file")
@@ -169,7 +168,7 @@ def test_export_products_by_app(
     save_file_mock,
     send_email_mock,
     export_products_in_batches_mock,
-    create_file_with_headers_mock,
+    create_file_with_rows_mock,
     product_list,
     app_export_file,
 ):
@@ -182,14 +181,18 @@ def test_export_products_by_app(
     file_type = FileTypes.CSV
 
     mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    create_file_with_rows_mock.return_value = mock_file
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
 
     # then
-    create_file_with_headers_mock.assert_called_once_with(
-        ["id", "name"], ";", file_type
+    create_file_with_rows_mock.assert_called_once_with(
+        ["id", "name"],
+        export_products_in_batches_mock.return_value,
+        ";",
+        file_type,
+        False,
     )
 
     assert export_products_in_batches_mock.call_count == 1
@@ -197,14 +200,7 @@ def test_export_products_by_app(
     assert set(args[0].values_list("pk", flat=True)) == set(
         Product.objects.all().values_list("pk", flat=True)
     )
-    assert args[1:] == (
-        export_info,
-        {"id", "name"},
-        ["id", "name"],
-        ";",
-        mock_file,
-        file_type,
-    )
+    assert args[1:] == (export_info, {"id", "name"}, ["id", "name"])
 
     send_email_mock.assert_not_called()
 
@@ -248,48 +244,6 @@ def get_product_queryset_filter(product_list):
     assert queryset.count() == len(product_list) - 1
 
 
-def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
-    # given
-    file_headers = ["id", "name", "collections"]
-
-    assert not user_export_file.content_file
-
-    # when
-    csv_file = create_file_with_headers(file_headers, ";", FileTypes.CSV)
-
-    # then
-    assert csv_file
-
-    file_content = csv_file.read().decode().split("\r\n")
-
-    assert ";".join(file_headers) in file_content
-
-    shutil.rmtree(tmpdir)
-
-
-def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
-    # given
-    file_headers = ["id", "name", "collections"]
-
-    assert not user_export_file.content_file
-
-    # when
-    xlsx_file = create_file_with_headers(file_headers, ";", FileTypes.XLSX)
-
-    # then
-    assert xlsx_file
-
-    wb_obj = openpyxl.load_workbook(xlsx_file)
-
-    sheet_obj = wb_obj.active
-    max_col = sheet_obj.max_column
-    headers = [sheet_obj.cell(row=1, column=i).value for i in range(1, max_col + 1)]
-
-    assert headers == file_headers
-
-    shutil.rmtree(tmpdir)
-
-
 def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     file_mock = MagicMock(spec=File)
     file_mock.name = "temp_file.csv"
@@ -305,86 +259,60 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
-    # given
-    export_data = [
-        {"id": "123", "name": "test1", "collections": "coll1"},
-        {"id": "345", "name": "test2"},
-    ]
-    headers = ["id", "name", "collections"]
-    delimiter = ";"
+def _read_xlsx_rows(file):
+    sheet_obj = openpyxl.load_workbook(file).active
+    return [list(row) for row in sheet_obj.iter_rows(values_only=True)]
 
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing=" ")
 
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
+def test_create_file_with_rows_csv():
+    # given
+    file_headers = ["id", "name", "collections"]
+    rows = iter([["123", "test1", "coll1"], ["345", "test2", " "]])
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    csv_file = create_file_with_rows(file_headers, rows, ";", FileTypes.CSV)
 
     # then
-    user_export_file.refresh_from_db()
-
-    file_content = temp_file.read().decode().split("\r\n")
-    assert ";".join(headers) in file_content
-    assert ";".join(export_data[0].values()) in file_content
-    assert (";".join(export_data[1].values()) + "; ") in file_content
-
-    temp_file.close()
-    shutil.rmtree(tmpdir)
+    file_content = csv_file.read().decode().split("\r\n")
+    assert file_content[:3] == ["id;name;collections", "123;test1;coll1", "345;test2; "]
+    csv_file.close()
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_create_file_with_rows_csv_compressed():
     # given
-    export_data = [
-        {"id": "123", "name": "test1", "collections": "coll1"},
-        {"id": "345", "name": "test2"},
-    ]
-    expected_headers = ["id", "name", "collections"]
-    delimiter = ";"
+    file_headers = ["id", "name"]
+    rows = iter([["123", "test1"]])
 
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=" "
+    # when
+    csv_file = create_file_with_rows(
+        file_headers, rows, ";", FileTypes.CSV, compress=True
     )
 
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    # then
+    file_content = gzip.decompress(csv_file.read()).decode().split("\r\n")
+    assert file_content[:2] == ["id;name", "123;test1"]
+    csv_file.close()
+
+
+def test_create_file_with_rows_xlsx():
+    # given
+    file_headers = ["id", "name", "collections"]
+    rows = iter([["123", "test1", "coll1"], ["345", "test2", " "]])
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, delimiter)
+    xlsx_file = create_file_with_rows(file_headers, rows, ";", FileTypes.XLSX)
 
     # then
-    user_export_file.refresh_from_db()
-
-    wb_obj = openpyxl.load_workbook(temp_file)
-
-    sheet_obj = wb_obj.active
-    max_col = sheet_obj.max_column
-    max_row = sheet_obj.max_row
-    expected_headers = expected_headers
-    headers = [sheet_obj.cell(row=1, column=i).value for i in range(1, max_col + 1)]
-    data = []
-    for i in range(2, max_row + 1):
-        row = []
-        for j in range(1, max_col + 1):
-            row.append(sheet_obj.cell(row=i, column=j).value)
-        data.append(row)
-
-    assert headers == expected_headers
-    assert list(export_data[0].values()) in data
-    row2 = list(export_data[1].values())
-    # add string with space for collections column
-    row2.append(" ")
-    assert row2 in data
-
-    temp_file.close()
-    shutil.rmtree(tmpdir)
+    assert _read_xlsx_rows(xlsx_file) == [
+        file_headers,
+        ["123", "test1", "coll1"],
+        ["345", "test2", " "],
+    ]
+    xlsx_file.close()
 
 
 @patch("saleor.csv.utils.export.BATCH_SIZE", 1)
-def test_export_products_in_batches_for_csv(
-    product_list, user_export_file, tmpdir, media_root,
-):
+def test_export_products_in_batches(product_list):
     # given
     qs = Product.objects.all()
     export_info = {
@@ -393,103 +321,39 @@ def test_export_products_in_batches_for_csv(
         "attributes": [],
     }
     export_fields = ["id", "name", "variants__sku"]
-    expected_headers = ["id", "name", "variant sku"]
-
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=";")
 
     # when
-    export_products_in_batches(
-        qs,
-        export_info,
-        set(export_fields),
-        export_fields,
-        ";",
-        temp_file,
-        FileTypes.CSV,
+    rows = export_products_in_batches(
+        qs, export_info, set(export_fields), export_fields
     )
 
     # then
-
     expected_data = []
     for product in qs.order_by("pk"):
-        product_data = []
-        product_data.append(str(product.pk))
-        product_data.append(product.name)
-
         for variant in product.variants.all():
-            product_data.append(str(variant.sku))
-            expected_data.append(product_data)
+            expected_data.append([product.pk, product.name, variant.sku])
 
-    file_content = temp_file.read().decode().split("\r\n")
-
-    # ensure headers are in file
-    assert ";".join(expected_headers) in file_content
-
-    for row in expected_data:
-        assert ";".join(row) in file_content
-
-    shutil.rmtree(tmpdir)
+    assert list(rows) == expected_data
 
 
 @patch("saleor.csv.utils.export.BATCH_SIZE", 1)
-def test_export_products_in_batches_for_xlsx(
-    product_list, user_export_file, tmpdir, media_root,
-):
+def test_export_products_to_xlsx(product_list, user_export_file, tmpdir, media_root):
     # given
-    qs = Product.objects.all()
     export_info = {
         "fields": [ProductFieldEnum.NAME.value, ProductFieldEnum.VARIANT_SKU.value],
         "warehouses": [],
         "attributes": [],
     }
-    export_fields = ["id", "name", "variants__sku"]
-    expected_headers = ["id", "name", "variant sku"]
-
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
 
     # when
-    export_products_in_batches(
-        qs,
-        export_info,
-        set(export_fields),
-        export_fields,
-        ";",
-        temp_file,
-        FileTypes.XLSX,
-    )
+    export_products(user_export_file, {"all": ""}, export_info, FileTypes.XLSX)
 
     # then
-    expected_data = []
-    for product in qs.order_by("pk"):
-        product_data = []
-        product_data.append(product.pk)
-        product_data.append(product.name)
-
+    user_export_file.refresh_from_db()
+    rows = _read_xlsx_rows(user_export_file.content_file)
+    assert rows[0] == ["id", "name", "variant sku"]
+    for product in Product.objects.order_by("pk"):
         for variant in product.variants.all():
-            product_data.append(variant.sku)
-            expected_data.append(product_data)
-
-    wb_obj = openpyxl.load_workbook(temp_file)
-
-    sheet_obj = wb_obj.active
-    max_col = sheet_obj.max_column
-    max_row = sheet_obj.max_row
-    headers = [sheet_obj.cell(row=1, column=i).value for i in range(1, max_col + 1)]
-    data = []
-    for i in range(2, max_row + 1):
-        row = []
-        for j in range(1, max_col + 1):
-            row.append(sheet_obj.cell(row=i, column=j).value)
-        data.append(row)
-
-    assert headers == expected_headers
-    for row in expected_data:
-        assert row in data
+            assert [product.pk, product.name, variant.sku] in rows[1:]
 
     shutil.rmtree(tmpdir)
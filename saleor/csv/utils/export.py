@@ -1,7 +1,10 @@
+import csv
+import gzip
+import io
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Set, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Set, Union
 
-import petl as etl
+import openpyxl
 from django.utils import timezone
 
 from ...product.models import Product
@@ -16,6 +19,8 @@ if TYPE_CHECKING:
 
 
 BATCH_SIZE = 10000
+# Value of the cells for which a product has no data
+MISSING_VALUE = " "
 
 
 def export_products(
@@ -24,24 +29,26 @@ def export_products(
     export_info: Dict[str, list],
     file_type: str,
     delimiter: str = ";",
+    compress: bool = False,
 ):
-    file_name = get_filename("product", file_type)
+    """Export products to a file of the given type.
+
+    Rows are streamed from the database in batches straight into a single open
+    writer. CSV files can be gzipped on the fly by passing `compress`.
+    """
+    compress = compress and file_type == FileTypes.CSV
+    file_name = get_filename("product", file_type, compress)
     queryset = get_product_queryset(scope)
 
     export_fields, file_headers, data_headers = get_export_fields_and_headers_info(
         export_info
     )
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
-
-    export_products_in_batches(
-        queryset,
-        export_info,
-        set(export_fields),
-        data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
+    rows = export_products_in_batches(
+        queryset, export_info, set(export_fields), data_headers
+    )
+    temporary_file = create_file_with_rows(
+        file_headers, rows, delimiter, file_type, compress
     )
 
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
@@ -53,10 +60,13 @@ def export_products(
         )
 
 
-def get_filename(model_name: str, file_type: str) -> str:
-    return "{}_data_{}.{}".format(
+def get_filename(model_name: str, file_type: str, compress: bool = False) -> str:
+    file_name = "{}_data_{}.{}".format(
         model_name, timezone.now().strftime("%d_%m_%Y"), file_type
     )
+    if compress:
+        file_name += ".gz"
+    return file_name
 
 
 def get_product_queryset(scope: Dict[str, Union[str, dict]]) -> "QuerySet":
@@ -99,10 +109,8 @@ def export_products_in_batches(
     export_info: Dict[str, list],
     export_fields: Set[str],
     headers: List[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
-):
+) -> Iterator[List[Any]]:
+    """Yield rows of exported products, fetching products in batches."""
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
 
@@ -120,35 +128,57 @@ def export_products_in_batches(
             product_batch, export_fields, attributes, warehouses
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
-
+        for data in export_data:
+            yield [data.get(header, MISSING_VALUE) for header in headers]
 
-def create_file_with_headers(file_headers: List[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
 
+def create_file_with_rows(
+    file_headers: List[str],
+    rows: Iterable[List[Any]],
+    delimiter: str,
+    file_type: str,
+    compress: bool = False,
+) -> IO[bytes]:
+    """Write headers and all rows to a temporary file and return it rewound."""
     if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
+        temporary_file = NamedTemporaryFile(suffix=".csv")
+        write_csv(temporary_file, file_headers, rows, delimiter, compress)
     else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
+        temporary_file = NamedTemporaryFile(suffix=".xlsx")
+        write_xlsx(temporary_file, file_headers, rows)
+    temporary_file.seek(0)
+    return temporary_file
 
-    return temp_file
 
-
-def append_to_file(
-    export_data: List[Dict[str, Union[str, bool]]],
+def write_csv(
+    file: IO[bytes],
     headers: List[str],
-    temporary_file: Any,
-    file_type: str,
+    rows: Iterable[List[Any]],
     delimiter: str,
+    compress: bool = False,
 ):
-    table = etl.fromdicts(export_data, header=headers, missing=" ")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+    stream: IO[bytes] = file
+    if compress:
+        stream = gzip.GzipFile(fileobj=file, mode="wb")
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    writer = csv.writer(text_stream, delimiter=delimiter)
+    writer.writerow(headers)
+    writer.writerows(rows)
+    text_stream.flush()
+    # Don't let the wrapper close the underlying file
+    text_stream.detach()
+    if compress:
+        stream.close()
+
+
+def write_xlsx(file: IO[bytes], headers: List[str], rows: Iterable[List[Any]]):
+    # Write-only workbooks don't keep the rows in memory
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(headers)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(file)
 
 
 def save_csv_file_in_export_file(
@@ -1,11 +1,18 @@
 import csv
+import datetime
 import gzip
-from typing import Iterable
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Iterable, Iterator, List, Optional
 
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.contrib.syndication.views import add_domain
+from django.core.cache import cache
 from django.core.files.storage import default_storage
+from django.db import connection
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 from django.utils.encoding import smart_text
 from django_countries.fields import Country
@@ -21,6 +28,17 @@ CATEGORY_SEPARATOR = " > "
 
 FILE_PATH = "google-feed.csv.gz"
 
+# Supplemental feed with variants changed since the full feed was generated
+UPDATES_FILE_PATH = "google-feed-updates.csv.gz"
+
+FEED_GENERATED_AT_CACHE_KEY = "google_feed_generated_at"
+
+# Number of variants fetched with their related objects at once
+CHUNK_SIZE = 1000
+
+# Attributes which values are used as brands of items
+BRAND_ATTRIBUTES = ["brand", "publisher"]
+
 ATTRIBUTES = [
     "id",
     "title",
@@ -47,9 +65,13 @@ def get_feed_file_url():
     return default_storage.url(FILE_PATH)
 
 
+def get_feed_updates_file_url():
+    return default_storage.url(UPDATES_FILE_PATH)
+
+
 def get_feed_items():
     items = ProductVariant.objects.all()
-    items = items.select_related("product")
+    items = items.select_related("product", "product__product_type")
     items = items.prefetch_related(
         "images",
         "product__category",
@@ -60,6 +82,25 @@ def get_feed_items():
     return items
 
 
+def iterate_feed_items(
+    items: QuerySet, chunk_size: int = CHUNK_SIZE
+) -> Iterator[ProductVariant]:
+    """Yield feed items fetching them in chunks ordered by primary key.
+
+    Chunks are selected by the last seen key instead of an offset, so every
+    chunk is read from the index and only one chunk is kept in memory.
+    """
+    items = items.order_by("pk")
+    last_pk = None
+    while True:
+        chunk_items = items if last_pk is None else items.filter(pk__gt=last_pk)
+        chunk = list(chunk_items[:chunk_size])
+        if not chunk:
+            return
+        yield from chunk
+        last_pk = chunk[-1].pk
+
+
 def item_id(item: ProductVariant):
     return item.sku
 
@@ -228,20 +269,31 @@ def item_attributes(
     return product_data
 
 
-def write_feed(file_obj):
-    """Write feed contents info provided file object."""
+def write_feed(file_obj, items: Optional[QuerySet] = None, write_header=True):
+    """Write feed contents info provided file object.
+
+    All variants are written unless other items are given.
+    """
+    if items is None:
+        items = get_feed_items()
     is_charge_taxes_on_shipping = charge_taxes_on_shipping()
     writer = csv.DictWriter(file_obj, ATTRIBUTES, dialect=csv.excel_tab)
-    writer.writeheader()
+    if write_header:
+        writer.writeheader()
     categories = Category.objects.all()
     discounts = fetch_discounts(timezone.now())
-    attributes_dict = {a.slug: a.pk for a in Attribute.objects.all()}
+    attributes_dict = {
+        a.slug: a.pk for a in Attribute.objects.filter(slug__in=BRAND_ATTRIBUTES)
+    }
     attribute_values_dict = {
-        smart_text(a.pk): smart_text(a) for a in AttributeValue.objects.all()
+        smart_text(a.pk): smart_text(a)
+        for a in AttributeValue.objects.filter(
+            attribute_id__in=attributes_dict.values()
+        )
     }
     category_paths = {}
     current_site = Site.objects.get_current()
-    for item in get_feed_items():
+    for item in iterate_feed_items(items):
         item_data = item_attributes(
             item,
             categories,
@@ -255,12 +307,95 @@ def write_feed(file_obj):
         writer.writerow(item_data)
 
 
-def update_feed(file_path=FILE_PATH):
+def _get_shards_first_pks(items: QuerySet, shards: int) -> List[int]:
+    """Return primary keys splitting items into shards of similar size."""
+    count = items.count()
+    pks = items.order_by("pk").values_list("pk", flat=True)
+    offsets = sorted({count * shard // shards for shard in range(shards)})
+    return [pks[offset] for offset in offsets if offset < count]
+
+
+def _write_feed_shard(
+    items: QuerySet, first_pk: int, next_pk: Optional[int], write_header: bool
+) -> IO[bytes]:
+    """Write items of a shard to a temporary file as a separate gzip member."""
+    items = items.filter(pk__gte=first_pk)
+    if next_pk is not None:
+        items = items.filter(pk__lt=next_pk)
+    part = tempfile.TemporaryFile()
+    output = gzip.open(part, "wt")
+    write_feed(output, items, write_header=write_header)
+    output.close()
+    part.seek(0)
+    return part
+
+
+def _write_feed_shard_in_thread(*args) -> IO[bytes]:
+    try:
+        return _write_feed_shard(*args)
+    finally:
+        # Every worker thread opens its own database connection
+        connection.close()
+
+
+def _write_feed_in_shards(output_file, items: QuerySet, shards: int):
+    first_pks = _get_shards_first_pks(items, shards)
+    if not first_pks:
+        with gzip.open(output_file, "wt") as output:
+            write_feed(output, items)
+        return
+    next_pks = first_pks[1:] + [None]
+    write_headers = [shard == 0 for shard in range(len(first_pks))]
+    with ThreadPoolExecutor(max_workers=len(first_pks)) as executor:
+        parts = executor.map(
+            _write_feed_shard_in_thread,
+            [items] * len(first_pks),
+            first_pks,
+            next_pks,
+            write_headers,
+        )
+        # Concatenated gzip members are read as a single file
+        for part in parts:
+            with part:
+                shutil.copyfileobj(part, output_file)
+
+
+def update_feed(
+    file_path=FILE_PATH,
+    shards: int = 1,
+    changed_since: Optional[datetime.datetime] = None,
+):
     """Save updated feed into path provided as argument.
 
-    Default path is defined in module as FILE_PATH.
+    Default path is defined in module as FILE_PATH. With more than one
+    shard, items are split by primary key and written in parallel. With
+    `changed_since`, only variants updated after the date are written,
+    otherwise the time of the generation is stored for incremental feeds.
     """
+    generated_at = timezone.now()
+    items = get_feed_items()
+    if changed_since is not None:
+        items = items.filter(
+            Q(updated_at__gt=changed_since) | Q(product__updated_at__gt=changed_since)
+        )
     with default_storage.open(file_path, "wb") as output_file:
-        output = gzip.open(output_file, "wt")
-        write_feed(output)
-        output.close()
+        if shards > 1:
+            _write_feed_in_shards(output_file, items, shards)
+        else:
+            output = gzip.open(output_file, "wt")
+            write_feed(output, items)
+            output.close()
+    if changed_since is None:
+        cache.set(FEED_GENERATED_AT_CACHE_KEY, generated_at, timeout=None)
+
+
+def update_feed_changes(file_path=UPDATES_FILE_PATH, shards: int = 1) -> bool:
+    """Save variants changed since the full feed was generated.
+
+    Return False without writing the file if there is no full feed to update.
+    """
+    changed_since = cache.get(FEED_GENERATED_AT_CACHE_KEY)
+    if changed_since is None:
+        return False
+    update_feed(file_path, shards=shards, changed_since=changed_since)
+    return True
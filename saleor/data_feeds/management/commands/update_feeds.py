@@ -1,10 +1,28 @@
 from django.core.management import BaseCommand
 
-from ...google_merchant import update_feed
+from ...google_merchant import update_feed, update_feed_changes
 
 
 class Command(BaseCommand):
     help = "Update Google merchant feed"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=1,
+            help="Number of parts of the feed generated in parallel",
+        )
+        parser.add_argument(
+            "--changes",
+            action="store_true",
+            default=False,
+            help="Only write variants changed since the full feed was generated",
+        )
+
     def handle(self, *args, **options):
-        update_feed()
+        if options["changes"]:
+            if update_feed_changes(shards=options["shards"]):
+                return
+            self.stdout.write("No full feed to update, generating the full feed.")
+        update_feed(shards=options["shards"])
@@ -1,18 +1,26 @@
 import csv
-from io import StringIO
-from unittest.mock import Mock
+import gzip
+from io import BytesIO, StringIO
+from unittest.mock import Mock, patch
 
+from django.core.cache import cache
+from django.utils import timezone
 from django.utils.encoding import smart_text
 from django_prices_vatlayer.models import VAT
 
 from ...core.taxes import charge_taxes_on_shipping
 from ...product.models import AttributeValue, Category
 from ..google_merchant import (
+    FEED_GENERATED_AT_CACHE_KEY,
+    _get_shards_first_pks,
+    _write_feed_shard,
     get_feed_items,
     item_attributes,
     item_availability,
     item_google_product_category,
     item_tax,
+    iterate_feed_items,
+    update_feed_changes,
     write_feed,
 )
 
@@ -93,3 +101,48 @@ def test_write_feed(product, monkeypatch):
     ]
     for field in google_required_fields:
         assert field in header
+
+
+def test_iterate_feed_items_in_chunks(product_list):
+    variants = list(get_feed_items().order_by("pk"))
+
+    items = iterate_feed_items(get_feed_items(), chunk_size=2)
+
+    assert list(items) == variants
+
+
+def test_write_feed_shards_concatenated(product_list, site_settings):
+    items = get_feed_items()
+    first_pks = _get_shards_first_pks(items, shards=2)
+    output_file = BytesIO()
+
+    for first_pk, next_pk, write_header in zip(
+        first_pks, first_pks[1:] + [None], [True, False]
+    ):
+        with _write_feed_shard(items, first_pk, next_pk, write_header) as part:
+            output_file.write(part.read())
+
+    content = gzip.decompress(output_file.getvalue()).decode()
+    rows = list(csv.DictReader(StringIO(content), dialect=csv.excel_tab))
+    assert [row["id"] for row in rows] == [
+        variant.sku for variant in get_feed_items().order_by("pk")
+    ]
+
+
+@patch("saleor.data_feeds.google_merchant.write_feed")
+@patch("saleor.data_feeds.google_merchant.default_storage")
+def test_update_feed_changes(mock_storage, mock_write_feed, product_list):
+    cache.set(FEED_GENERATED_AT_CACHE_KEY, timezone.now(), timeout=None)
+    variant = product_list[0].variants.get()
+    variant.save()
+
+    assert update_feed_changes()
+
+    (_, items), _ = mock_write_feed.call_args
+    assert list(items) == [variant]
+
+
+def test_update_feed_changes_without_full_feed(product_list):
+    cache.delete(FEED_GENERATED_AT_CACHE_KEY)
+
+    assert not update_feed_changes()
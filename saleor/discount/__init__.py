@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Set, Union
+from typing import TYPE_CHECKING, FrozenSet, List, Set, Union
 
 from django.conf import settings
 
@@ -33,6 +33,6 @@ class VoucherType:
 @dataclass
 class DiscountInfo:
     sale: Union["Sale", "Voucher"]
-    product_ids: Union[List[int], Set[int]]
-    category_ids: Union[List[int], Set[int]]
-    collection_ids: Union[List[int], Set[int]]
+    product_ids: Union[List[int], Set[int], FrozenSet[int]]
+    category_ids: Union[List[int], Set[int], FrozenSet[int]]
+    collection_ids: Union[List[int], Set[int], FrozenSet[int]]
@@ -7,14 +7,17 @@ from prices import Money
 
 from ...checkout.utils import get_voucher_discount_for_checkout
 from ...product.models import Product, ProductVariant
-from .. import DiscountInfo, DiscountValueType, VoucherType
+from ...tests.utils import flush_post_commit_hooks
+from .. import DiscountInfo, DiscountValueType, VoucherType, utils
 from ..models import NotApplicable, Sale, Voucher, VoucherCustomer
 from ..templatetags.voucher import discount_as_negative
 from ..utils import (
     add_voucher_usage_by_customer,
     decrease_voucher_usage,
+    fetch_cached_discounts,
     get_product_discount_on_sale,
     increase_voucher_usage,
+    invalidate_discounts_snapshot,
     remove_voucher_usage_by_customer,
     validate_voucher,
 )
@@ -346,3 +349,55 @@ def test_discount_as_negative_for_html():
     discount = Money(10, "USD")
     result = discount_as_negative(discount, True)
     assert result == '-<span class="currency">$</span>10.00'
+
+
+@pytest.fixture
+def discounts_snapshot_enabled(enable_process_cache):
+    enable_process_cache(utils._discounts_snapshot)
+
+
+def test_fetch_cached_discounts_reuses_snapshot(
+    sale, product, discounts_snapshot_enabled, django_assert_num_queries
+):
+    now = timezone.now()
+    discounts = fetch_cached_discounts(now)
+
+    with django_assert_num_queries(0):
+        cached_discounts = fetch_cached_discounts(now + timedelta(minutes=1))
+
+    assert cached_discounts == discounts
+    assert [discount.sale for discount in discounts] == [sale]
+    assert discounts[0].product_ids == frozenset({product.pk})
+
+
+def test_fetch_cached_discounts_rebuilt_after_sale_ends(
+    sale, discounts_snapshot_enabled
+):
+    now = timezone.now()
+    sale.end_date = now + timedelta(minutes=1)
+    sale.save()
+
+    assert fetch_cached_discounts(now)
+    assert fetch_cached_discounts(now + timedelta(minutes=2)) == []
+
+
+def test_fetch_cached_discounts_rebuilt_when_sale_starts(
+    sale, discounts_snapshot_enabled
+):
+    now = timezone.now()
+    sale.start_date = now + timedelta(minutes=1)
+    sale.save()
+
+    assert fetch_cached_discounts(now) == []
+    assert fetch_cached_discounts(now + timedelta(minutes=2))
+
+
+def test_invalidate_discounts_snapshot(sale, discounts_snapshot_enabled):
+    now = timezone.now()
+    assert fetch_cached_discounts(now)
+
+    sale.delete()
+    invalidate_discounts_snapshot()
+    flush_post_commit_hooks()
+
+    assert fetch_cached_discounts(now) == []
@@ -1,13 +1,16 @@
 import datetime
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
 
-from django.db.models import F
+from django.conf import settings
+from django.db.models import F, Max, Min, Q
 from django.utils import timezone
 from prices import Money
 
 from ..checkout import calculations
 from ..core.taxes import zero_money
+from ..core.utils.cache import ProcessCache
 from . import DiscountInfo
 from .models import NotApplicable, Sale, VoucherCustomer
 
@@ -220,3 +223,87 @@ def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
 
 def fetch_active_discounts() -> List[DiscountInfo]:
     return fetch_discounts(timezone.now())
+
+
+DISCOUNTS_VERSION_CACHE_KEY = "discounts_snapshot_version"
+
+# Sales become inactive right after their end date
+SALE_END_PRECISION = datetime.timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class DiscountsSnapshot:
+    """Active discounts shared by all requests handled by the process.
+
+    The snapshot is valid for dates from `valid_from` to `valid_until`, which are
+    the closest moments when any sale starts or ends.
+    """
+
+    discounts: List[DiscountInfo]
+    valid_from: Optional[datetime.datetime]
+    valid_until: Optional[datetime.datetime]
+
+    def is_valid_for(self, date: datetime.datetime) -> bool:
+        if self.valid_from is not None and date < self.valid_from:
+            return False
+        return self.valid_until is None or date < self.valid_until
+
+
+class DiscountsSnapshotCache(ProcessCache[DiscountsSnapshot]):
+    def is_valid(self, data: DiscountsSnapshot, *args) -> bool:
+        return data.is_valid_for(*args)
+
+
+def _build_discounts_snapshot(date: datetime.datetime) -> DiscountsSnapshot:
+    discounts = [
+        DiscountInfo(
+            sale=discount.sale,
+            product_ids=frozenset(discount.product_ids),
+            category_ids=frozenset(discount.category_ids),
+            collection_ids=frozenset(discount.collection_ids),
+        )
+        for discount in fetch_discounts(date)
+    ]
+    boundaries = Sale.objects.aggregate(
+        next_start_date=Min("start_date", filter=Q(start_date__gt=date)),
+        last_end_date=Max("end_date", filter=Q(end_date__lt=date)),
+    )
+
+    starts = [discount.sale.start_date for discount in discounts]
+    if boundaries["last_end_date"]:
+        starts.append(boundaries["last_end_date"] + SALE_END_PRECISION)
+    ends = [
+        discount.sale.end_date + SALE_END_PRECISION
+        for discount in discounts
+        if discount.sale.end_date
+    ]
+    if boundaries["next_start_date"]:
+        ends.append(boundaries["next_start_date"])
+
+    return DiscountsSnapshot(
+        discounts=discounts,
+        valid_from=max(starts, default=None),
+        valid_until=min(ends, default=None),
+    )
+
+
+_discounts_snapshot = DiscountsSnapshotCache(
+    DISCOUNTS_VERSION_CACHE_KEY, "DISCOUNTS_SNAPSHOT_TIMEOUT", _build_discounts_snapshot
+)
+
+
+def fetch_cached_discounts(date: datetime.datetime) -> List[DiscountInfo]:
+    """Return discounts active at the given date, reusing the process snapshot.
+
+    The snapshot is rebuilt when a sale starts or ends, when it is invalidated
+    with `invalidate_discounts_snapshot` and after `DISCOUNTS_SNAPSHOT_TIMEOUT`
+    seconds, which bounds staleness when processes do not share a cache.
+    """
+    if not settings.DISCOUNTS_SNAPSHOT_TIMEOUT:
+        return fetch_discounts(date)
+    return list(_discounts_snapshot.get(date).discounts)
+
+
+def invalidate_discounts_snapshot():
+    """Drop snapshots of active discounts once the transaction is committed."""
+    _discounts_snapshot.invalidate()
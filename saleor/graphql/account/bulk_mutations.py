@@ -5,6 +5,7 @@ from django.core.exceptions import ValidationError
 
 from ...account import models
 from ...account.error_codes import AccountErrorCode
+from ...core.jwt import invalidate_users_auth_cache
 from ...core.permissions import AccountPermissions
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
 from ..core.types.common import AccountError, StaffError
@@ -21,6 +22,11 @@ class UserBulkDelete(ModelBulkDeleteMutation):
     class Meta:
         abstract = True
 
+    @classmethod
+    def bulk_action(cls, queryset):
+        queryset.delete()
+        invalidate_users_auth_cache()
+
 
 class CustomerBulkDelete(CustomerDeleteMixin, UserBulkDelete):
     class Meta:
@@ -110,3 +116,4 @@ class UserBulkSetActive(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, queryset, is_active):
         queryset.update(is_active=is_active)
+        invalidate_users_auth_cache()
@@ -106,6 +106,9 @@ class CreateToken(BaseMutation):
         refresh_token = create_refresh_token(user, {"csrfToken": csrf_token})
         info.context.refresh_token = refresh_token
         info.context._cached_user = user
+        # Permissions resolved before logging in belong to the anonymous user
+        if hasattr(info.context, "_cached_permissions"):
+            del info.context._cached_permissions
         user.last_login = timezone.now()
         user.save(update_fields=["last_login"])
         return cls(
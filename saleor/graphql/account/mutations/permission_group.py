@@ -7,6 +7,7 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from ....account.error_codes import PermissionGroupErrorCode
+from ....core.jwt import invalidate_users_auth_cache
 from ....core.permissions import AccountPermissions, get_permissions
 from ...account.utils import (
     can_user_manage_group,
@@ -65,6 +66,7 @@ class PermissionGroupCreate(ModelMutation):
         users = cleaned_data.get("add_users")
         if users:
             instance.user_set.add(*users)
+        invalidate_users_auth_cache()
 
     @classmethod
     def clean_input(
@@ -201,6 +203,7 @@ class PermissionGroupUpdate(PermissionGroupCreate):
         remove_permissions = cleaned_data.get("remove_permissions")
         if remove_permissions:
             instance.permissions.remove(*remove_permissions)
+        invalidate_users_auth_cache()
 
     @classmethod
     def clean_input(
@@ -411,6 +414,12 @@ class PermissionGroupDelete(ModelDeleteMutation):
         error_type_class = PermissionGroupError
         error_type_field = "permission_group_errors"
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        invalidate_users_auth_cache()
+        return response
+
     @classmethod
     def clean_instance(cls, info, instance):
         requestor = info.context.user
@@ -12,6 +12,7 @@ from ....account.thumbnails import create_user_avatar_thumbnails
 from ....account.utils import remove_staff_member
 from ....checkout import AddressType
 from ....core.exceptions import PermissionDenied
+from ....core.jwt import invalidate_user_auth_cache
 from ....core.permissions import AccountPermissions
 from ....core.utils.url import validate_storefront_url
 from ...account.enums import AddressTypeEnum
@@ -252,6 +253,7 @@ class StaffCreate(ModelMutation):
         groups = cleaned_data.get("add_groups")
         if groups:
             instance.groups.add(*groups)
+        invalidate_user_auth_cache(instance.pk)
 
 
 class StaffUpdate(StaffCreate):
@@ -390,6 +392,7 @@ class StaffUpdate(StaffCreate):
         remove_groups = cleaned_data.get("remove_groups")
         if remove_groups:
             instance.groups.remove(*remove_groups)
+        invalidate_user_auth_cache(instance.pk)
 
 
 class StaffDelete(StaffDeleteMixin, UserDelete):
@@ -10,7 +10,12 @@ from ...core.exceptions import PermissionDenied
 from ...core.permissions import AccountPermissions
 from ...payment import gateway
 from ...payment.utils import fetch_customer_id
-from ..utils import format_permissions_for_display, get_user_or_app_from_context
+from ..utils import (
+    format_permissions_for_display,
+    get_context_permissions,
+    get_user_or_app_from_context,
+    has_context_permissions,
+)
 from ..utils.filters import filter_by_query_param
 from .types import AddressValidationData, ChoiceValue
 from .utils import (
@@ -54,13 +59,14 @@ def resolve_user(info, id):
     requester = get_user_or_app_from_context(info.context)
     if requester:
         _model, user_pk = graphene.Node.from_global_id(id)
-        if requester.has_perms(
-            [AccountPermissions.MANAGE_STAFF, AccountPermissions.MANAGE_USERS]
-        ):
+        permissions = get_context_permissions(info.context)
+        can_manage_staff = AccountPermissions.MANAGE_STAFF.value in permissions
+        can_manage_users = AccountPermissions.MANAGE_USERS.value in permissions
+        if can_manage_staff and can_manage_users:
             return models.User.objects.filter(pk=user_pk).first()
-        if requester.has_perm(AccountPermissions.MANAGE_STAFF):
+        if can_manage_staff:
             return models.User.objects.staff().filter(pk=user_pk).first()
-        if requester.has_perm(AccountPermissions.MANAGE_USERS):
+        if can_manage_users:
             return models.User.objects.customers().filter(pk=user_pk).first()
     return PermissionDenied()
 
@@ -146,7 +152,7 @@ def resolve_address(info, id):
     user = info.context.user
     app = info.context.app
     _model, address_pk = graphene.Node.from_global_id(id)
-    if app and app.has_perm(AccountPermissions.MANAGE_USERS):
+    if app and has_context_permissions(info.context, [AccountPermissions.MANAGE_USERS]):
         return models.Address.objects.filter(pk=address_pk).first()
     if user and not user.is_anonymous:
         return user.addresses.filter(id=address_pk).first()
@@ -8,6 +8,7 @@ from django.core.validators import URLValidator
 from ...app import models
 from ...app.error_codes import AppErrorCode
 from ...app.tasks import install_app_task
+from ...app.utils import invalidate_app_tokens_cache
 from ...core import JobStatus
 from ...core.permissions import (
     AppPermission,
@@ -219,6 +220,11 @@ class AppUpdate(ModelMutation):
             ensure_can_manage_permissions(requestor, permissions)
         return cleaned_input
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        # Permissions are saved after the app, drop apps cached in the meantime
+        invalidate_app_tokens_cache()
+
 
 class AppDelete(ModelDeleteMutation):
     class Arguments:
@@ -1005,6 +1005,33 @@ def test_checkout_lines_add_empty_checkout(user_api_client, checkout, stock):
     assert line.quantity == 1
 
 
+def test_checkout_lines_add_many_lines(
+    user_api_client, checkout_with_item, product_list
+):
+    checkout = checkout_with_item
+    line = checkout.lines.get()
+    variants = [line.variant] + [product.variants.get() for product in product_list]
+    checkout_id = graphene.Node.to_global_id("Checkout", checkout.pk)
+
+    variables = {
+        "checkoutId": checkout_id,
+        "lines": [
+            {
+                "variantId": graphene.Node.to_global_id("ProductVariant", variant.pk),
+                "quantity": 2,
+            }
+            for variant in variants
+        ],
+    }
+    response = user_api_client.post_graphql(MUTATION_CHECKOUT_LINES_ADD, variables)
+    content = get_graphql_content(response)
+    data = content["data"]["checkoutLinesAdd"]
+    assert not data["checkoutErrors"]
+    assert [line["quantity"] for line in data["checkout"]["lines"]] == [5, 2, 2, 2]
+    checkout.refresh_from_db()
+    assert checkout.quantity == 11
+
+
 def test_checkout_lines_add_variant_without_inventory_tracking(
     user_api_client, checkout, variant_without_inventory_tracking
 ):
@@ -67,18 +67,33 @@ class CheckoutLine(CountableDjangoObjectType):
         filter_fields = ["id"]
 
     @staticmethod
-    def resolve_total_price(self, info):
-        def calculate_total_price(discounts):
+    def resolve_total_price(root: models.CheckoutLine, info):
+        checkout = root.checkout
+
+        def calculate_total_price(data):
+            lines, discounts = data
+            # Price all lines of the checkout at once, the result is memoized on
+            # the checkout and reused by the remaining lines
+            lines = [root if line.pk == root.pk else line for line in lines]
+            prices = calculations.checkout_prices(
+                checkout=checkout,
+                lines=lines,
+                discounts=discounts,
+                manager=info.context.plugins,
+            )
+            if root.pk in prices.line_totals:
+                return prices.line_totals[root.pk]
             return info.context.plugins.calculate_checkout_line_total(
-                checkout_line=self, discounts=discounts
+                checkout_line=root, discounts=discounts
             )
 
-        return (
-            DiscountsByDateTimeLoader(info.context)
-            .load(info.context.request_time)
-            .then(calculate_total_price)
+        lines = CheckoutLinesByCheckoutTokenLoader(info.context).load(checkout.token)
+        discounts = DiscountsByDateTimeLoader(info.context).load(
+            info.context.request_time
         )
 
+        return Promise.all([lines, discounts]).then(calculate_total_price)
+
     @staticmethod
     def resolve_requires_shipping(root: models.CheckoutLine, *_args):
         return root.is_shipping_required()
@@ -163,12 +178,13 @@ class Checkout(CountableDjangoObjectType):
     def resolve_total_price(root: models.Checkout, info):
         def calculate_total_price(data):
             lines, discounts = data
-            taxed_total = (
-                calculations.checkout_total(
-                    checkout=root, lines=lines, discounts=discounts
-                )
-                - root.get_total_gift_cards_balance()
+            prices = calculations.checkout_prices(
+                checkout=root,
+                lines=lines,
+                discounts=discounts,
+                manager=info.context.plugins,
             )
+            taxed_total = prices.total - root.get_total_gift_cards_balance()
             return max(taxed_total, zero_taxed_money())
 
         lines = CheckoutLinesByCheckoutTokenLoader(info.context).load(root.token)
@@ -182,9 +198,12 @@ class Checkout(CountableDjangoObjectType):
     def resolve_subtotal_price(root: models.Checkout, info):
         def calculate_subtotal_price(data):
             lines, discounts = data
-            return calculations.checkout_subtotal(
-                checkout=root, lines=lines, discounts=discounts
-            )
+            return calculations.checkout_prices(
+                checkout=root,
+                lines=lines,
+                discounts=discounts,
+                manager=info.context.plugins,
+            ).subtotal
 
         lines = CheckoutLinesByCheckoutTokenLoader(info.context).load(root.token)
         discounts = DiscountsByDateTimeLoader(info.context).load(
@@ -197,9 +216,12 @@ class Checkout(CountableDjangoObjectType):
     def resolve_shipping_price(root: models.Checkout, info):
         def calculate_shipping_price(data):
             lines, discounts = data
-            return calculations.checkout_shipping_price(
-                checkout=root, lines=lines, discounts=discounts
-            )
+            return calculations.checkout_prices(
+                checkout=root,
+                lines=lines,
+                discounts=discounts,
+                manager=info.context.plugins,
+            ).shipping_price
 
         lines = CheckoutLinesByCheckoutTokenLoader(info.context).load(root.token)
         discounts = DiscountsByDateTimeLoader(info.context).load(
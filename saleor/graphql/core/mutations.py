@@ -15,7 +15,7 @@ from graphql.error import GraphQLError
 
 from ...core.exceptions import PermissionDenied
 from ...core.permissions import AccountPermissions
-from ..utils import get_nodes
+from ..utils import get_nodes, has_context_permissions
 from .types import Error, Upload
 from .utils import from_global_id_strict_type, snake_to_camel_case
 from .utils.error_codes import get_error_code_from_error
@@ -256,14 +256,14 @@ class BaseMutation(graphene.Mutation):
         permissions = permissions or cls._meta.permissions
         if not permissions:
             return True
-        if context.user.has_perms(permissions):
-            return True
+        if context.user.is_authenticated:
+            return has_context_permissions(context, permissions)
         app = getattr(context, "app", None)
         if app:
             # for now MANAGE_STAFF permission for app is not supported
             if AccountPermissions.MANAGE_STAFF in permissions:
                 return False
-            return app.has_perms(permissions)
+            return has_context_permissions(context, permissions)
         return False
 
     @classmethod
@@ -1,7 +1,9 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from django.core.cache import cache
 from django.urls import reverse
 
+from ....core.permissions import AppPermission
 from ...middleware import app_middleware
 
 
@@ -15,3 +17,30 @@ def test_app_middleware_accepts_api_requests(app, rf):
     app_middleware(lambda root, info: info.context, Mock(), Mock(context=request))
 
     assert request.app == app
+
+
+def test_app_middleware_uses_cached_app(
+    app, permission_manage_apps, rf, settings, django_assert_num_queries
+):
+    settings.APP_TOKEN_CACHE_TIMEOUT = 60
+    cache.clear()
+    app.permissions.add(permission_manage_apps)
+    token = app.tokens.first().auth_token
+    request = rf.get(reverse("api"))
+    request.META = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    app_middleware(lambda root, info: info.context, Mock(), Mock(context=request))
+    assert request.app == app
+
+    request = rf.get(reverse("api"))
+    request.META = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    with django_assert_num_queries(0):
+        app_middleware(lambda root, info: info.context, Mock(), Mock(context=request))
+        assert request.app == app
+        assert request.app.has_perm(AppPermission.MANAGE_APPS)
+
+
+@patch("saleor.app.utils.invalidate_app_tokens_cache")
+def test_deleting_app_token_invalidates_cached_apps(mocked_invalidate, app):
+    app.tokens.first().delete()
+
+    mocked_invalidate.assert_called_once_with()
@@ -0,0 +1,102 @@
+import graphene
+import pytest
+
+from ...query_cache import CachedGraphQLBackend, get_query_hash, persisted_queries
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_SHOP_NAME = "{ shop { name } }"
+
+
+@pytest.fixture
+def persisted_queries_enabled(settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    persisted_queries.clear_stats()
+
+
+def _persisted_query_data(query_hash, query=None):
+    data = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}}
+    if query is not None:
+        data["query"] = query
+    return data
+
+
+class Query(graphene.ObjectType):
+    hello = graphene.String()
+
+    def resolve_hello(self, info):
+        return "world"
+
+
+def test_cached_backend_reuses_documents():
+    schema = graphene.Schema(query=Query)
+    backend = CachedGraphQLBackend(max_size=10)
+
+    document = backend.document_from_string(schema, "{ hello }")
+    assert backend.document_from_string(schema, "{ hello }") is document
+
+    assert document.execute().data == {"hello": "world"}
+    assert backend.get_stats()["hits"] == 1
+    assert backend.get_stats()["misses"] == 1
+
+
+def test_cached_backend_caches_validation_errors():
+    schema = graphene.Schema(query=Query)
+    backend = CachedGraphQLBackend(max_size=10)
+
+    result = backend.document_from_string(schema, "{ invalid }").execute()
+
+    assert result.invalid
+    assert result.errors
+
+
+def test_cached_backend_evicts_least_recently_used_document():
+    schema = graphene.Schema(query=Query)
+    backend = CachedGraphQLBackend(max_size=1)
+
+    backend.document_from_string(schema, "{ hello }")
+    backend.document_from_string(schema, "query Hello { hello }")
+
+    assert backend.get_document(schema, get_query_hash("{ hello }")) is None
+    assert backend.get_document(schema, get_query_hash("query Hello { hello }"))
+
+
+def test_persisted_query_not_supported(api_client, settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    response = api_client.post(_persisted_query_data(get_query_hash(QUERY_SHOP_NAME)))
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_not_found(api_client, persisted_queries_enabled):
+    response = api_client.post(_persisted_query_data(get_query_hash("{ unknown }")))
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert persisted_queries.get_stats()["misses"] == 1
+
+
+def test_persisted_query_registered_and_resolved_by_hash(
+    api_client, site_settings, persisted_queries_enabled
+):
+    query_hash = get_query_hash(QUERY_SHOP_NAME)
+
+    response = api_client.post(_persisted_query_data(query_hash, QUERY_SHOP_NAME))
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+    response = api_client.post(_persisted_query_data(query_hash))
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert persisted_queries.get_stats()["hits"] == 1
+
+
+def test_persisted_query_hash_mismatch(api_client, persisted_queries_enabled):
+    response = api_client.post(
+        _persisted_query_data(get_query_hash("{ other }"), QUERY_SHOP_NAME)
+    )
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match the query."
+    )
@@ -1,8 +1,11 @@
+import threading
 from unittest import mock
 
 import graphene
 import pytest
 from django.test import override_settings
+from django.utils.functional import SimpleLazyObject
+from graphql import GraphQLDocument
 
 from ....demo.views import EXAMPLE_QUERY
 from ...product.types import Product
@@ -14,6 +17,7 @@ from ...tests.fixtures import (
     API_PATH,
 )
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ...views import GraphQLView
 
 
 def test_batch_queries(category, product, api_client):
@@ -289,3 +293,82 @@ def test_example_query(api_client, product):
     response = api_client.post_graphql(EXAMPLE_QUERY)
     content = get_graphql_content(response)
     assert content["data"]["products"]["edges"][0]["node"]["name"] == product.name
+
+
+@mock.patch("saleor.graphql.views.GraphQLView.get_response")
+def test_batch_queries_executed_concurrently(mocked_get_response, api_client, settings):
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 4
+    query = "query Shop%s { shop { name } }"
+    mutation = "mutation { checkoutCreate(input: {}) { checkout { id } } }"
+    data = [
+        {"query": query % 1},
+        {"query": query % 2},
+        {"query": mutation},
+        {"query": query % 3},
+    ]
+    main_thread = threading.current_thread()
+    threads = {}
+
+    def get_response(request, entry, document=None):
+        threads[entry["query"]] = threading.current_thread()
+        return {"data": {"query": entry["query"]}}, 200
+
+    mocked_get_response.side_effect = get_response
+
+    response = api_client.post(data)
+
+    content = get_graphql_content(response)
+    assert [entry["data"]["query"] for entry in content] == [
+        entry["query"] for entry in data
+    ]
+    assert threads[query % 1] is not main_thread
+    assert threads[query % 2] is not main_thread
+    assert threads[mutation] is main_thread
+    assert threads[query % 3] is main_thread
+
+
+@mock.patch("saleor.graphql.views.GraphQLView.get_response")
+def test_batch_queries_parsed_once(mocked_get_response, api_client, settings):
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 4
+    mocked_get_response.return_value = {"data": {}}, 200
+    data = [
+        {"query": "query Shop1 { shop { name } }"},
+        {"query": "query Shop2 { shop { name } }"},
+    ]
+
+    with mock.patch.object(
+        GraphQLView, "parse_query", autospec=True, side_effect=GraphQLView.parse_query
+    ) as mocked_parse_query:
+        api_client.post(data)
+
+    assert mocked_parse_query.call_count == 2
+    # The parsed documents are executed, so they are not parsed again
+    documents = [args[2] for args, _ in mocked_get_response.call_args_list]
+    assert len(documents) == 2
+    assert all(isinstance(document, GraphQLDocument) for document in documents)
+
+
+def test_resolve_lazy_request_attributes(rf):
+    request = rf.post(API_PATH)
+    request._cached_user = None
+    load_discounts = mock.Mock(return_value=[])
+    request.discounts = SimpleLazyObject(load_discounts)
+
+    GraphQLView.resolve_lazy_request_attributes(request)
+
+    assert request.discounts == []
+    assert not isinstance(request.discounts, SimpleLazyObject)
+    load_discounts.assert_called_once_with()
+
+
+@mock.patch("saleor.graphql.views.GraphQLView.get_response")
+def test_batch_queries_executed_sequentially_by_default(
+    mocked_get_response, api_client, settings
+):
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 0
+    mocked_get_response.return_value = {"data": {}}, 200
+    data = [{"query": "{ shop { name } }"}, {"query": "{ shop { name } }"}]
+
+    api_client.post(data)
+
+    assert mocked_get_response.call_count == 2
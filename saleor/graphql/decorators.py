@@ -6,6 +6,7 @@ from graphql.execution.base import ResolveInfo
 
 from ..core.exceptions import PermissionDenied
 from ..core.permissions import AccountPermissions
+from .utils import has_context_permissions
 
 
 def context(f):
@@ -36,14 +37,14 @@ def account_passes_test(test_func):
 
 
 def _permission_required(perms: Iterable[Enum], context):
-    if context.user.has_perms(perms):
-        return True
+    if context.user.is_authenticated:
+        return has_context_permissions(context, perms)
     app = getattr(context, "app", None)
     if app:
         # for now MANAGE_STAFF permission for app is not supported
         if AccountPermissions.MANAGE_STAFF in perms:
             return False
-        return app.has_perms(perms)
+        return has_context_permissions(context, perms)
     return False
 
 
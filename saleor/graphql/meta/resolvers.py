@@ -7,7 +7,7 @@ from ...core.exceptions import PermissionDenied
 from ...core.models import ModelWithMetadata
 from ...order import models as order_models
 from ...product import models as product_models
-from ..utils import get_user_or_app_from_context
+from ..utils import has_context_permissions
 from .permissions import PRIVATE_META_PERMISSION_MAP
 
 
@@ -61,8 +61,7 @@ def resolve_private_metadata(root: ModelWithMetadata, info):
     if not required_permission:
         raise PermissionDenied()
 
-    requester = get_user_or_app_from_context(info.context)
-    if not requester.has_perms(required_permission):
+    if not has_context_permissions(info.context, required_permission):
         raise PermissionDenied()
 
     return resolve_metadata(root.private_metadata)
@@ -9,6 +9,7 @@ from django.utils.functional import SimpleLazyObject
 from graphql import ResolveInfo
 
 from ..app.models import App
+from ..app.utils import get_active_app_by_token
 from ..core.exceptions import ReadOnlyException
 from ..core.tracing import should_trace
 from .views import API_PATH, GraphQLView
@@ -46,8 +47,7 @@ class OpentracingGrapheneMiddleware:
 
 
 def get_app(auth_token) -> Optional[App]:
-    qs = App.objects.filter(tokens__auth_token=auth_token, is_active=True)
-    return qs.first()
+    return get_active_app_by_token(auth_token)
 
 
 def app_middleware(next, root, info, **kwargs):
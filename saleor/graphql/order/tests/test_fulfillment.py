@@ -10,6 +10,7 @@ from ....order import OrderStatus
 from ....order.error_codes import OrderErrorCode
 from ....order.events import OrderEvents
 from ....order.models import FulfillmentStatus
+from ....warehouse.management import reconcile_stocks_quantity_allocated
 from ....warehouse.models import Allocation, Stock
 from ...tests.utils import assert_no_permission, get_graphql_content
 
@@ -699,6 +700,7 @@ def test_create_digital_fulfillment(
     Allocation.objects.create(
         order_line=order_line, stock=stock, quantity_allocated=order_line.quantity
     )
+    reconcile_stocks_quantity_allocated()
 
     second_line = order.lines.last()
     first_line_id = graphene.Node.to_global_id("OrderLine", order_line.id)
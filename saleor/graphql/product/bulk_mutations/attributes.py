@@ -1,7 +1,14 @@
 import graphene
+from django.db import transaction
 
 from ....core.permissions import ProductPermissions
 from ....product import models
+from ....product.utils.attributes import (
+    invalidate_attribute_slug_map,
+    update_attribute_value_ids_of_products_with_values,
+    update_product_attributes_sort_keys,
+)
+from ....search.utils import update_products_search_index
 from ...core.mutations import ModelBulkDeleteMutation
 from ...core.types.common import ProductError
 
@@ -19,6 +26,19 @@ class AttributeBulkDelete(ModelBulkDeleteMutation):
         error_type_class = ProductError
         error_type_field = "product_errors"
 
+    @classmethod
+    @transaction.atomic
+    def bulk_action(cls, queryset):
+        value_pks = list(
+            models.AttributeValue.objects.filter(attribute__in=queryset).values_list(
+                "pk", flat=True
+            )
+        )
+        queryset.delete()
+        index = update_attribute_value_ids_of_products_with_values(value_pks)
+        update_products_search_index(index.keys())
+        invalidate_attribute_slug_map()
+
 
 class AttributeValueBulkDelete(ModelBulkDeleteMutation):
     class Arguments:
@@ -34,3 +54,20 @@ class AttributeValueBulkDelete(ModelBulkDeleteMutation):
         permissions = (ProductPermissions.MANAGE_PRODUCTS,)
         error_type_class = ProductError
         error_type_field = "product_errors"
+
+    @classmethod
+    @transaction.atomic
+    def bulk_action(cls, queryset):
+        value_pks = list(queryset.values_list("pk", flat=True))
+        assignment_pks = list(
+            models.AssignedProductAttribute.objects.filter(values__pk__in=value_pks)
+            .values_list("pk", flat=True)
+            .distinct()
+        )
+        queryset.delete()
+        index = update_attribute_value_ids_of_products_with_values(value_pks)
+        update_products_search_index(index.keys())
+        update_product_attributes_sort_keys(
+            models.AssignedProductAttribute.objects.filter(pk__in=assignment_pks)
+        )
+        invalidate_attribute_slug_map()
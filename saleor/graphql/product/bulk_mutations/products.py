@@ -10,7 +10,14 @@ from ....product import models
 from ....product.error_codes import ProductErrorCode
 from ....product.tasks import update_product_minimal_variant_price_task
 from ....product.utils import delete_categories
-from ....product.utils.attributes import generate_name_for_variant
+from ....product.utils.attributes import (
+    generate_name_for_variant,
+    update_products_attribute_value_ids,
+)
+from ....search.utils import (
+    delete_products_from_search_index,
+    update_products_search_index,
+)
 from ....warehouse import models as warehouse_models
 from ....warehouse.error_codes import StockErrorCode
 from ...core.mutations import (
@@ -125,6 +132,8 @@ class ProductBulkDelete(ModelBulkDeleteMutation):
         # delete order lines for deleted variants
         order_models.OrderLine.objects.filter(pk__in=order_line_pks).delete()
 
+        delete_products_from_search_index(pks)
+
         return response
 
 
@@ -248,7 +257,7 @@ class ProductVariantBulkCreate(BaseMutation):
 
         attributes = cleaned_input.get("attributes")
         if attributes:
-            AttributeAssignmentMixin.save(instance, attributes)
+            AttributeAssignmentMixin.save_values(instance, attributes)
             instance.name = generate_name_for_variant(instance)
             instance.save(update_fields=["name"])
 
@@ -315,6 +324,9 @@ class ProductVariantBulkCreate(BaseMutation):
         for instance, cleaned_input in zip(instances, cleaned_inputs):
             cls.save(info, instance, cleaned_input)
             cls.create_variant_stocks(instance, cleaned_input)
+        product_ids = {instance.product_id for instance in instances}
+        update_products_attribute_value_ids(product_ids)
+        update_products_search_index(product_ids)
 
     @classmethod
     def create_variant_stocks(cls, variant, cleaned_input):
@@ -370,12 +382,20 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
                 variant__pk__in=pks, order__status=OrderStatus.DRAFT
             ).values_list("pk", flat=True)
         )
+        product_pks = set(
+            models.ProductVariant.objects.filter(pk__in=pks).values_list(
+                "product_id", flat=True
+            )
+        )
 
         response = super().perform_mutation(_root, info, ids, **data)
 
         # delete order lines for deleted variants
         order_models.OrderLine.objects.filter(pk__in=order_line_pks).delete()
 
+        update_products_attribute_value_ids(product_pks)
+        update_products_search_index(product_pks)
+
         return response
 
 
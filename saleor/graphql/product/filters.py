@@ -16,6 +16,7 @@ from ...product.models import (
     ProductType,
     ProductVariant,
 )
+from ...product.utils.attributes import get_attribute_slug_map
 from ...search.backends import picker
 from ...warehouse.models import Stock
 from ..core.filters import EnumFilter, ListObjectTypeFilter, ObjectTypeFilter
@@ -51,25 +52,16 @@ def filter_fields_containing_value(*search_fields: str):
 def _clean_product_attributes_filter_input(
     filter_value,
 ) -> Dict[int, List[Optional[int]]]:
-    attributes = Attribute.objects.prefetch_related("values")
-    attributes_map: Dict[str, int] = {
-        attribute.slug: attribute.pk for attribute in attributes
-    }
-    values_map: Dict[str, Dict[str, int]] = {
-        attr.slug: {value.slug: value.pk for value in attr.values.all()}
-        for attr in attributes
-    }
+    slug_map = get_attribute_slug_map()
     queries: Dict[int, List[Optional[int]]] = defaultdict(list)
     # Convert attribute:value pairs into a dictionary where
     # attributes are keys and values are grouped in lists
     for attr_name, val_slugs in filter_value:
-        if attr_name not in attributes_map:
+        if attr_name not in slug_map:
             raise ValueError("Unknown attribute name: %r" % (attr_name,))
-        attr_pk = attributes_map[attr_name]
+        attr_pk, values_map = slug_map[attr_name]
         attr_val_pk = [
-            values_map[attr_name][val_slug]
-            for val_slug in val_slugs
-            if val_slug in values_map[attr_name]
+            values_map[val_slug] for val_slug in val_slugs if val_slug in values_map
         ]
         queries[attr_pk] += attr_val_pk
 
@@ -115,9 +107,7 @@ def filter_products_by_stock_availability(qs, stock_availability):
     total_stock = (
         Stock.objects.select_related("product_variant")
         .values("product_variant__product_id")
-        .annotate(
-            total_quantity_allocated=Coalesce(Sum("allocations__quantity_allocated"), 0)
-        )
+        .annotate(total_quantity_allocated=Coalesce(Sum("quantity_allocated"), 0))
         .annotate(total_quantity=Coalesce(Sum("quantity"), 0))
         .annotate(total_available=F("total_quantity") - F("total_quantity_allocated"))
         .filter(total_available__lte=0)
@@ -181,8 +171,7 @@ def filter_stock_availability(qs, _, value):
 
 def filter_search(qs, _, value):
     if value:
-        search = picker.pick_backend()
-        qs = qs.distinct() & search(value).distinct()
+        qs = picker.pick_backend().filter_products(qs, value)
     return qs
 
 
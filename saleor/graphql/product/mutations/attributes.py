@@ -9,6 +9,15 @@ from django.utils.text import slugify
 from ....core.permissions import ProductPermissions
 from ....product import AttributeInputType, models
 from ....product.error_codes import ProductErrorCode
+from ....product.utils.attributes import (
+    get_product_ids_with_values,
+    invalidate_attribute_slug_map,
+    update_attribute_value_ids_of_products_with_values,
+    update_attributes_sort_keys,
+    update_product_attributes_sort_keys,
+    update_products_attribute_value_ids,
+)
+from ....search.utils import update_products_search_index
 from ...core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
 from ...core.types.common import ProductAttributeError, ProductError
 from ...core.utils import (
@@ -183,6 +192,7 @@ class AttributeMixin:
         values = cleaned_data.get(cls.ATTRIBUTE_VALUES_FIELD) or []
         for value in values:
             attribute.values.create(**value)
+        invalidate_attribute_slug_map()
 
 
 class AttributeCreate(AttributeMixin, ModelMutation):
@@ -264,8 +274,24 @@ class AttributeUpdate(AttributeMixin, ModelMutation):
     @classmethod
     def _save_m2m(cls, info, instance, cleaned_data):
         super()._save_m2m(info, instance, cleaned_data)
-        for attribute_value in cleaned_data.get("remove_values", []):
+        remove_values = cleaned_data.get("remove_values", [])
+        if not remove_values:
+            return
+        # Deleted values lose their primary keys
+        value_pks = [value.pk for value in remove_values]
+        product_ids = get_product_ids_with_values(value_pks)
+        assignment_pks = list(
+            models.AssignedProductAttribute.objects.filter(values__pk__in=value_pks)
+            .values_list("pk", flat=True)
+            .distinct()
+        )
+        for attribute_value in remove_values:
             attribute_value.delete()
+        update_products_attribute_value_ids(product_ids)
+        update_products_search_index(product_ids)
+        update_product_attributes_sort_keys(
+            models.AssignedProductAttribute.objects.filter(pk__in=assignment_pks)
+        )
 
     @classmethod
     def perform_mutation(cls, _root, info, id, input):
@@ -501,6 +527,9 @@ class AttributeUnassign(BaseMutation):
         # Commit
         cls.save_field_values(product_type, "product_attributes", attribute_pks)
         cls.save_field_values(product_type, "variant_attributes", attribute_pks)
+        update_products_attribute_value_ids(
+            product_type.products.values_list("pk", flat=True)
+        )
 
         return cls(product_type=product_type)
 
@@ -516,6 +545,19 @@ class AttributeDelete(ModelDeleteMutation):
         error_type_class = ProductError
         error_type_field = "product_errors"
 
+    @classmethod
+    @transaction.atomic
+    def perform_mutation(cls, _root, info, **data):
+        node_id = data.get("id")
+        attribute_pk = from_global_id_strict_type(node_id, Attribute, field="pk")
+        values = models.AttributeValue.objects.filter(attribute_id=attribute_pk)
+        value_pks = list(values.values_list("pk", flat=True))
+        response = super().perform_mutation(_root, info, **data)
+        index = update_attribute_value_ids_of_products_with_values(value_pks)
+        update_products_search_index(index.keys())
+        invalidate_attribute_slug_map()
+        return response
+
 
 class AttributeUpdateMeta(UpdateMetaBaseMutation):
     class Meta:
@@ -612,6 +654,7 @@ class AttributeValueCreate(ModelMutation):
 
         instance.save()
         cls._save_m2m(info, instance, cleaned_input)
+        invalidate_attribute_slug_map()
         return AttributeValueCreate(attribute=attribute, attributeValue=instance)
 
 
@@ -645,6 +688,15 @@ class AttributeValueUpdate(ModelMutation):
         validate_value_is_unique(instance.attribute, instance)
         super().clean_instance(info, instance)
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        invalidate_attribute_slug_map()
+        # Only assignments using the renamed value change their sort keys
+        update_product_attributes_sort_keys(
+            models.AssignedProductAttribute.objects.filter(values=instance)
+        )
+        update_products_search_index(get_product_ids_with_values([instance.pk]))
+
     @classmethod
     def success_response(cls, instance):
         response = super().success_response(instance)
@@ -665,6 +717,25 @@ class AttributeValueDelete(ModelDeleteMutation):
         error_type_class = ProductError
         error_type_field = "product_errors"
 
+    @classmethod
+    @transaction.atomic
+    def perform_mutation(cls, _root, info, **data):
+        node_id = data.get("id")
+        value_pk = from_global_id_strict_type(node_id, AttributeValue, field="pk")
+        assignment_pks = list(
+            models.AssignedProductAttribute.objects.filter(
+                values__pk=value_pk
+            ).values_list("pk", flat=True)
+        )
+        response = super().perform_mutation(_root, info, **data)
+        index = update_attribute_value_ids_of_products_with_values([value_pk])
+        update_products_search_index(index.keys())
+        update_product_attributes_sort_keys(
+            models.AssignedProductAttribute.objects.filter(pk__in=assignment_pks)
+        )
+        invalidate_attribute_slug_map()
+        return response
+
     @classmethod
     def success_response(cls, instance):
         response = super().success_response(instance)
@@ -811,5 +882,6 @@ class AttributeReorderValues(BaseMutation):
 
         with transaction.atomic():
             perform_reordering(values_m2m, operations)
+            update_attributes_sort_keys([attribute.pk])
         attribute.refresh_from_db(fields=["values"])
         return AttributeReorderValues(attribute=attribute)
@@ -12,6 +12,7 @@ from graphql_relay import from_global_id
 
 from ....core.exceptions import PermissionDenied
 from ....core.permissions import ProductPermissions
+from ....discount.utils import invalidate_discounts_snapshot
 from ....order import OrderStatus, models as order_models
 from ....product import models
 from ....product.error_codes import ProductErrorCode
@@ -29,7 +30,10 @@ from ....product.utils import delete_categories
 from ....product.utils.attributes import (
     associate_attribute_values_to_instance,
     generate_name_for_variant,
+    invalidate_attribute_slug_map,
+    update_products_attribute_value_ids,
 )
+from ....search.utils import update_products_search_index
 from ...core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
 from ...core.scalars import PositiveDecimal, WeightScalar
 from ...core.types import SeoInput, Upload
@@ -122,9 +126,21 @@ class CategoryCreate(ModelMutation):
 
     @classmethod
     def save(cls, info, instance, cleaned_input):
+        # Search documents of the category products keep its name as keywords
+        name_changed = (
+            instance.pk
+            and "name" in cleaned_input
+            and not models.Category.objects.filter(
+                pk=instance.pk, name=instance.name
+            ).exists()
+        )
         instance.save()
+        if name_changed:
+            update_products_search_index(instance.products.values_list("pk", flat=True))
         if cleaned_input.get("background_image"):
             create_category_background_image_thumbnails.delay(instance.pk)
+        # Sales applied to a category apply to its whole subtree
+        invalidate_discounts_snapshot()
 
 
 class CategoryUpdate(CategoryCreate):
@@ -665,14 +681,17 @@ class AttributeAssignmentMixin:
     def _pre_save_values(cls, attribute: models.Attribute, values: List[str]):
         """Lazy-retrieve or create the database objects from the supplied raw values."""
         get_or_create = attribute.values.get_or_create
-        return tuple(
-            get_or_create(
+        attribute_values = []
+        for value in values:
+            attribute_value, created = get_or_create(
                 attribute=attribute,
                 slug=slugify(value, allow_unicode=True),
                 defaults={"name": value},
-            )[0]
-            for value in values
-        )
+            )
+            if created:
+                invalidate_attribute_slug_map()
+            attribute_values.append(attribute_value)
+        return tuple(attribute_values)
 
     @classmethod
     def _check_input_for_product(cls, cleaned_input: T_INPUT_MAP, qs: QuerySet):
@@ -794,6 +813,21 @@ class AttributeAssignmentMixin:
         :param instance: the product or variant to associate the attribute against.
         :param cleaned_input: the cleaned user input (refer to clean_attributes)
         """
+        cls.save_values(instance, cleaned_input)
+        if isinstance(instance, models.Product):
+            product_id = instance.pk
+        else:
+            product_id = instance.product_id
+        update_products_attribute_value_ids([product_id])
+        update_products_search_index([product_id])
+
+    @classmethod
+    def save_values(cls, instance: T_INSTANCE, cleaned_input: T_INPUT_MAP):
+        """Associate the values without refreshing the product's indexes.
+
+        Used when saving attributes of many variants of a product, the caller
+        refreshes the indexes of the product once.
+        """
         for attribute, values in cleaned_input:
             attribute_values = cls._pre_save_values(attribute, values)
             associate_attribute_values_to_instance(
@@ -1397,6 +1431,7 @@ class ProductVariantDelete(ModelDeleteMutation):
     def success_response(cls, instance):
         # Update the "minimal_variant_prices" of the parent product
         update_product_minimal_variant_price_task.delay(instance.product_id)
+        update_products_attribute_value_ids([instance.product_id])
         return super().success_response(instance)
 
     @classmethod
@@ -1,10 +1,18 @@
+import json
+from collections import defaultdict
+
 from django.db.models import Sum
+from graphql.error import GraphQLError
 
 from ...order import OrderStatus
 from ...product import models
+from ...product.utils.facets import (
+    count_products_by_attribute_values,
+    count_products_in_price_ranges,
+)
 from ..utils import get_database_id, get_user_or_app_from_context
 from ..utils.filters import filter_by_period
-from .filters import filter_products_by_stock_availability
+from .filters import ProductFilter, filter_products_by_stock_availability
 
 
 def resolve_attributes(info, qs=None, **_kwargs):
@@ -58,6 +66,89 @@ def resolve_products(info, stock_availability=None, **_kwargs):
     return qs.distinct()
 
 
+def _filter_products(info, qs, filter_input):
+    filterset = ProductFilter(data=filter_input, queryset=qs, request=info.context)
+    if not filterset.is_valid():
+        raise GraphQLError(json.dumps(filterset.errors.get_json_data()))
+    return filterset.qs
+
+
+def _exclude_filter(filter_input, name):
+    return {key: value for key, value in filter_input.items() if key != name}
+
+
+def resolve_product_facets(info, filter=None, price_ranges=None):
+    """Count products matching the filter by attribute values and price ranges.
+
+    Counts of an attribute used in the filter are calculated without the
+    attribute's own condition, so all of its values can still be offered.
+    """
+    requestor = get_user_or_app_from_context(info.context)
+    qs = resolve_products(info)
+    filter_input = dict(filter or {})
+    products = _filter_products(info, qs, filter_input)
+
+    value_counts = count_products_by_attribute_values(products)
+    counts_by_attribute = {}
+    attribute_filters = filter_input.get("attributes") or []
+    for slug in {attribute_filter["slug"] for attribute_filter in attribute_filters}:
+        attribute_input = _exclude_filter(filter_input, "attributes")
+        other_attribute_filters = [
+            attribute_filter
+            for attribute_filter in attribute_filters
+            if attribute_filter["slug"] != slug
+        ]
+        if other_attribute_filters:
+            attribute_input["attributes"] = other_attribute_filters
+        counts_by_attribute[slug] = count_products_by_attribute_values(
+            _filter_products(info, qs, attribute_input)
+        )
+
+    attributes = models.Attribute.objects.get_visible_to_user(requestor).filter(
+        filterable_in_storefront=True
+    )
+    counted_value_ids = set(value_counts).union(
+        *[counts.keys() for counts in counts_by_attribute.values()]
+    )
+    values_by_attribute = defaultdict(list)
+    values = models.AttributeValue.objects.filter(
+        attribute__in=attributes, pk__in=counted_value_ids
+    )
+    for value in values:
+        values_by_attribute[value.attribute_id].append(value)
+
+    attribute_facets = []
+    for attribute in attributes:
+        counts = counts_by_attribute.get(attribute.slug, value_counts)
+        value_facets = [
+            {"value": value, "count": counts[value.pk]}
+            for value in values_by_attribute[attribute.pk]
+            if counts.get(value.pk)
+        ]
+        if value_facets:
+            attribute_facets.append({"attribute": attribute, "values": value_facets})
+
+    price_ranges = [
+        (price_range.get("gte"), price_range.get("lte"))
+        for price_range in price_ranges or []
+    ]
+    if filter_input.get("minimal_price"):
+        price_input = _exclude_filter(filter_input, "minimal_price")
+        price_products = _filter_products(info, qs, price_input)
+    else:
+        price_products = products
+    price_counts = count_products_in_price_ranges(price_products, price_ranges)
+
+    return {
+        "total_count": products.count(),
+        "attributes": attribute_facets,
+        "price_ranges": [
+            {"gte": gte, "lte": lte, "count": count}
+            for (gte, lte), count in zip(price_ranges, price_counts)
+        ],
+    }
+
+
 def resolve_product_types(info, **_kwargs):
     return models.ProductType.objects.all()
 
@@ -3,6 +3,7 @@ import graphene
 from ...core.permissions import ProductPermissions
 from ..core.enums import ReportingPeriod
 from ..core.fields import FilterInputConnectionField, PrefetchingConnectionField
+from ..core.types.common import PriceRangeInput
 from ..core.validators import validate_one_of_args_is_in_query
 from ..decorators import permission_required
 from ..translations.mutations import (
@@ -113,6 +114,7 @@ from .resolvers import (
     resolve_collections,
     resolve_digital_contents,
     resolve_product_by_slug,
+    resolve_product_facets,
     resolve_product_types,
     resolve_product_variants,
     resolve_products,
@@ -131,6 +133,7 @@ from .types import (
     Collection,
     DigitalContent,
     Product,
+    ProductFacets,
     ProductType,
     ProductVariant,
 )
@@ -207,6 +210,18 @@ class ProductQueries(graphene.ObjectType):
         ),
         description="List of the shop's products.",
     )
+    product_facets = graphene.Field(
+        ProductFacets,
+        filter=ProductFilterInput(description="Filtering options for products."),
+        price_ranges=graphene.List(
+            graphene.NonNull(PriceRangeInput),
+            description="Minimal price ranges to count products in.",
+        ),
+        description=(
+            "Numbers of products matching the filter by attribute values and "
+            "price ranges."
+        ),
+    )
     product_type = graphene.Field(
         ProductType,
         id=graphene.Argument(
@@ -288,6 +303,9 @@ class ProductQueries(graphene.ObjectType):
     def resolve_products(self, info, **kwargs):
         return resolve_products(info, **kwargs)
 
+    def resolve_product_facets(self, info, **kwargs):
+        return resolve_product_facets(info, **kwargs)
+
     def resolve_product_type(self, info, id):
         return graphene.Node.get_node_from_global_id(info, id, ProductType)
 
@@ -680,6 +680,54 @@ def test_update_attribute_remove_and_add_values(
     assert attribute.values.filter(name=attribute_value_name).exists()
 
 
+def test_update_attribute_remove_values_updates_products_index(
+    staff_api_client, product, permission_manage_products
+):
+    attribute = product.attributes.first().attribute
+    value = product.attributes.first().values.get()
+    assert value.pk in product.attribute_index.value_ids
+    assert value.name in product.search_document.keywords
+    variables = {
+        "name": attribute.name,
+        "id": graphene.Node.to_global_id("Attribute", attribute.id),
+        "addValues": [],
+        "removeValues": [graphene.Node.to_global_id("AttributeValue", value.id)],
+    }
+
+    response = staff_api_client.post_graphql(
+        UPDATE_ATTRIBUTE_MUTATION, variables, permissions=[permission_manage_products]
+    )
+
+    get_graphql_content(response)
+    product.refresh_from_db()
+    assert value.pk not in product.attribute_index.value_ids
+    assert product.attribute_index.value_ids
+    product.search_document.refresh_from_db()
+    assert value.name not in product.search_document.keywords
+
+
+def test_update_attribute_remove_values_updates_products_sort_key(
+    staff_api_client, product, permission_manage_products
+):
+    assignment = product.attributes.first()
+    value = assignment.values.get()
+    assert assignment.values_sort_key == value.name
+    variables = {
+        "name": assignment.attribute.name,
+        "id": graphene.Node.to_global_id("Attribute", assignment.attribute.id),
+        "addValues": [],
+        "removeValues": [graphene.Node.to_global_id("AttributeValue", value.id)],
+    }
+
+    response = staff_api_client.post_graphql(
+        UPDATE_ATTRIBUTE_MUTATION, variables, permissions=[permission_manage_products]
+    )
+
+    get_graphql_content(response)
+    assignment.refresh_from_db()
+    assert assignment.values_sort_key == ""
+
+
 def test_update_empty_attribute_and_add_values(
     staff_api_client, color_attribute_without_values, permission_manage_products
 ):
@@ -1103,6 +1151,51 @@ def test_update_attribute_value(
     assert name in [value["name"] for value in data["attribute"]["values"]]
 
 
+def test_update_attribute_value_updates_products_sort_key(
+    staff_api_client, product, permission_manage_products
+):
+    assignment = product.attributes.first()
+    value = assignment.values.get()
+    assert assignment.values_sort_key == value.name
+    node_id = graphene.Node.to_global_id("AttributeValue", value.id)
+    variables = {"name": "Crimson name", "id": node_id}
+
+    query = UPDATE_ATTRIBUTE_VALUE_QUERY
+
+    response = staff_api_client.post_graphql(
+        query, variables, permissions=[permission_manage_products]
+    )
+
+    get_graphql_content(response)
+    assignment.refresh_from_db()
+    assert assignment.values_sort_key == "Crimson name"
+
+
+def test_delete_attribute_value_updates_products_sort_key(
+    staff_api_client, product, permission_manage_products
+):
+    assignment = product.attributes.first()
+    value = assignment.values.get()
+    node_id = graphene.Node.to_global_id("AttributeValue", value.id)
+    query = """
+    mutation deleteValue($id: ID!) {
+        attributeValueDelete(id: $id) {
+            attributeValue {
+                slug
+            }
+        }
+    }
+    """
+
+    response = staff_api_client.post_graphql(
+        query, {"id": node_id}, permissions=[permission_manage_products]
+    )
+
+    get_graphql_content(response)
+    assignment.refresh_from_db()
+    assert assignment.values_sort_key == ""
+
+
 def test_update_attribute_value_name_not_unique(
     staff_api_client, pink_attribute_value, permission_manage_products
 ):
@@ -1145,6 +1238,30 @@ def test_delete_attribute_value(
         value.refresh_from_db()
 
 
+def test_delete_attribute_value_updates_products_index(
+    staff_api_client, product, permission_manage_products
+):
+    value = product.attributes.first().values.get()
+    assert value.pk in product.attribute_index.value_ids
+    query = """
+    mutation deleteValue($id: ID!) {
+        attributeValueDelete(id: $id) {
+            attributeValue {
+                slug
+            }
+        }
+    }
+    """
+    node_id = graphene.Node.to_global_id("AttributeValue", value.id)
+    staff_api_client.post_graphql(
+        query, {"id": node_id}, permissions=[permission_manage_products]
+    )
+
+    product.refresh_from_db()
+    assert value.pk not in product.attribute_index.value_ids
+    assert product.attribute_index.value_ids
+
+
 @pytest.mark.parametrize(
     "raw_value, expected_type",
     [
@@ -479,6 +479,28 @@ def test_category_update_mutation(
     assert data["category"]["backgroundImage"]["alt"] == image_alt
 
 
+def test_category_update_mutation_updates_products_search_documents(
+    staff_api_client, product, permission_manage_products
+):
+    category = product.category
+    variables = {
+        "id": graphene.Node.to_global_id("Category", category.pk),
+        "name": "Updated name",
+    }
+
+    response = staff_api_client.post_graphql(
+        MUTATION_CATEGORY_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    content = get_graphql_content(response)
+    assert content["data"]["categoryUpdate"]["errors"] == []
+    product.search_document.refresh_from_db()
+    assert "Updated name" in product.search_document.keywords
+    assert category.name not in product.search_document.keywords
+
+
 def test_category_update_mutation_invalid_background_image(
     staff_api_client, category, permission_manage_products
 ):
@@ -735,6 +757,22 @@ def test_category_delete_mutation(
         category.refresh_from_db()
 
 
+def test_category_delete_mutation_updates_products_search_documents(
+    staff_api_client, product, permission_manage_products
+):
+    category = product.category
+    assert category.name in product.search_document.keywords
+    variables = {"id": graphene.Node.to_global_id("Category", category.id)}
+
+    response = staff_api_client.post_graphql(
+        MUTATION_CATEGORY_DELETE, variables, permissions=[permission_manage_products]
+    )
+
+    get_graphql_content(response)
+    product.search_document.refresh_from_db()
+    assert category.name not in product.search_document.keywords
+
+
 @patch("saleor.product.utils.update_products_minimal_variant_prices_task")
 def test_category_delete_mutation_for_categories_tree(
     mock_update_products_minimal_variant_prices_task,
@@ -31,7 +31,10 @@ from ....product.models import (
 )
 from ....product.tasks import update_variants_names
 from ....product.tests.utils import create_image, create_pdf_file_with_image_ext
-from ....product.utils.attributes import associate_attribute_values_to_instance
+from ....product.utils.attributes import (
+    associate_attribute_values_to_instance,
+    update_products_attribute_value_ids,
+)
 from ....warehouse.models import Allocation, Stock, Warehouse
 from ...core.enums import ReportingPeriod
 from ...tests.utils import (
@@ -585,6 +588,7 @@ def test_products_query_with_filter_attributes(
     second_product.slug = "second-product"
     second_product.save()
     associate_attribute_values_to_instance(second_product, attribute, attr_value)
+    update_products_attribute_value_ids([second_product.pk])
 
     variables = {
         "filter": {"attributes": [{"slug": attribute.slug, "value": attr_value.slug}]}
@@ -827,6 +831,8 @@ def test_products_query_with_filter_stock_availability(
     Allocation.objects.create(
         order_line=order_line, stock=stock, quantity_allocated=stock.quantity
     )
+    stock.quantity_allocated = stock.quantity
+    stock.save(update_fields=["quantity_allocated"])
     variables = {"filter": {"stockAvailability": "OUT_OF_STOCK"}}
     staff_api_client.user.user_permissions.add(permission_manage_products)
     response = staff_api_client.post_graphql(query_products_with_filter, variables)
@@ -2383,6 +2389,27 @@ def test_update_product_with_existing_attribute_value(
     ), "A new attribute value shouldn't have been created"
 
 
+def test_update_product_attributes_updates_product_indexes(
+    staff_api_client, product, permission_manage_products, color_attribute
+):
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    color_attribute_id = graphene.Node.to_global_id("Attribute", color_attribute.id)
+    color = color_attribute.values.last()
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product.pk),
+        "attributes": [{"id": color_attribute_id, "values": [color.name]}],
+    }
+
+    data = get_graphql_content(
+        staff_api_client.post_graphql(SET_ATTRIBUTES_TO_PRODUCT_QUERY, variables)
+    )["data"]["productUpdate"]
+    assert not data["productErrors"]
+
+    product.refresh_from_db()
+    assert color.pk in product.attribute_index.value_ids
+    assert color.name in product.search_document.keywords
+
+
 def test_update_product_without_supplying_required_product_attribute(
     staff_api_client, product, permission_manage_products, color_attribute
 ):
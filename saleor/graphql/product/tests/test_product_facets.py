@@ -0,0 +1,101 @@
+from decimal import Decimal
+
+from ....product.models import Product
+from ....product.utils.attributes import (
+    associate_attribute_values_to_instance,
+    update_products_attribute_value_ids,
+)
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCT_FACETS = """
+    query ProductFacets(
+        $filter: ProductFilterInput, $priceRanges: [PriceRangeInput!]
+    ) {
+        productFacets(filter: $filter, priceRanges: $priceRanges) {
+            totalCount
+            attributes {
+                attribute {
+                    slug
+                }
+                values {
+                    value {
+                        slug
+                    }
+                    count
+                }
+            }
+            priceRanges {
+                gte
+                lte
+                count
+            }
+        }
+    }
+"""
+
+
+def test_product_facets_count_attribute_values(
+    user_api_client, product_list, color_attribute
+):
+    red = color_attribute.values.get(slug="red")
+    blue = color_attribute.values.get(slug="blue")
+    associate_attribute_values_to_instance(product_list[2], color_attribute, blue)
+    update_products_attribute_value_ids([product_list[2].pk])
+
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS)
+
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["totalCount"] == 3
+    assert data["attributes"] == [
+        {
+            "attribute": {"slug": color_attribute.slug},
+            "values": [
+                {"value": {"slug": red.slug}, "count": 2},
+                {"value": {"slug": blue.slug}, "count": 1},
+            ],
+        }
+    ]
+
+
+def test_product_facets_ignore_own_attribute_filter(
+    user_api_client, product_list, color_attribute
+):
+    blue = color_attribute.values.get(slug="blue")
+    associate_attribute_values_to_instance(product_list[2], color_attribute, blue)
+    update_products_attribute_value_ids([product_list[2].pk])
+    variables = {
+        "filter": {"attributes": [{"slug": color_attribute.slug, "values": ["blue"]}]}
+    }
+
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["totalCount"] == 1
+    counts = {
+        value["value"]["slug"]: value["count"]
+        for value in data["attributes"][0]["values"]
+    }
+    assert counts == {"red": 2, "blue": 1}
+
+
+def test_product_facets_count_price_ranges(user_api_client, product_list):
+    for product, price in zip(product_list, [5, 15, 25]):
+        product.minimal_variant_price_amount = Decimal(price)
+    Product.objects.bulk_update(product_list, ["minimal_variant_price_amount"])
+    variables = {
+        "filter": {"minimalPrice": {"gte": 20}},
+        "priceRanges": [{"lte": 10}, {"gte": 10, "lte": 20}, {"gte": 10}],
+    }
+
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["totalCount"] == 1
+    assert data["priceRanges"] == [
+        {"gte": None, "lte": 10.0, "count": 1},
+        {"gte": 10.0, "lte": 20.0, "count": 1},
+        {"gte": 10.0, "lte": None, "count": 2},
+    ]
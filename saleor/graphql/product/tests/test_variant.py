@@ -1329,6 +1329,8 @@ def test_product_variant_bulk_create_by_attribute_id(
     assert attribute_value_count == size_attribute.values.count()
     product_variant = ProductVariant.objects.get(sku=sku)
     assert not product_variant.cost_price
+    product.refresh_from_db()
+    assert attribute_value.pk in product.attribute_index.value_ids
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,66 @@
+import graphene
+
+from .attributes import Attribute, AttributeValue
+
+
+class AttributeValueFacet(graphene.ObjectType):
+    value = graphene.Field(
+        AttributeValue, description="The attribute value.", required=True
+    )
+    count = graphene.Int(
+        description="Number of products having the value.", required=True
+    )
+
+    class Meta:
+        description = "Represents the number of products having an attribute value."
+
+
+class AttributeFacet(graphene.ObjectType):
+    attribute = graphene.Field(
+        Attribute, description="The filterable attribute.", required=True
+    )
+    values = graphene.List(
+        graphene.NonNull(AttributeValueFacet),
+        description="Values of the attribute assigned to matching products.",
+        required=True,
+    )
+
+    class Meta:
+        description = "Represents product counts by values of an attribute."
+
+
+class PriceRangeFacet(graphene.ObjectType):
+    gte = graphene.Float(description="Price greater than or equal to.")
+    lte = graphene.Float(description="Price less than or equal to.")
+    count = graphene.Int(
+        description="Number of products with a minimal price in the range.",
+        required=True,
+    )
+
+    class Meta:
+        description = "Represents the number of products in a price range."
+
+
+class ProductFacets(graphene.ObjectType):
+    total_count = graphene.Int(
+        description="Number of products matching the filter.", required=True
+    )
+    attributes = graphene.List(
+        graphene.NonNull(AttributeFacet),
+        description=(
+            "Product counts by values of attributes filterable in the storefront. "
+            "Counts of an attribute used in the filter ignore its own condition."
+        ),
+        required=True,
+    )
+    price_ranges = graphene.List(
+        graphene.NonNull(PriceRangeFacet),
+        description=(
+            "Product counts in the requested price ranges, ignoring the "
+            "minimal price condition of the filter."
+        ),
+        required=True,
+    )
+
+    class Meta:
+        description = "Represents product counts used to render storefront filters."
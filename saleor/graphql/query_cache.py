@@ -0,0 +1,218 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLDocument, parse, validate
+from graphql.backend import GraphQLCoreBackend, core
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
+
+if TYPE_CHECKING:
+    # flake8: noqa
+    from graphql import GraphQLSchema
+
+
+PERSISTED_QUERY_CACHE_KEY = "graphql_persisted_query_{}"
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        # Message matches the one expected by Apollo's persisted queries link
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+class PersistedQueryHashMismatch(GraphQLError):
+    def __init__(self):
+        super().__init__("Provided sha256Hash does not match the query.")
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _invalid_result(errors: List[Exception], *args, **kwargs) -> ExecutionResult:
+    return ExecutionResult(errors=errors, invalid=True)
+
+
+def _execute_validated(schema: "GraphQLSchema", document_ast, *args, **kwargs):
+    # The document was validated once when it was added to the cache
+    kwargs["validate"] = False
+    return core.execute_and_validate(schema, document_ast, *args, **kwargs)
+
+
+class CachedGraphQLBackend(GraphQLCoreBackend):
+    """GraphQL backend keeping parsed and validated documents in an LRU cache.
+
+    Documents are keyed by the schema and the sha256 hash of the query string,
+    which is also the key used by automatic persisted queries. Validation is run
+    once, when the document enters the cache, instead of on every execution.
+    """
+
+    def __init__(self, max_size: int, executor=None):
+        super().__init__(executor=executor)
+        # Least recently used documents come first
+        self._documents: "OrderedDict[Hashable, GraphQLDocument]" = OrderedDict()
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(schema: "GraphQLSchema", query_hash: str) -> Hashable:
+        return hash(schema), query_hash
+
+    def get_document(
+        self, schema: "GraphQLSchema", query_hash: str
+    ) -> Optional[GraphQLDocument]:
+        """Return a cached document for the given hash without building it."""
+        with self._lock:
+            document = self._get(self.get_key(schema, query_hash))
+            if document is not None:
+                self.hits += 1
+        return document
+
+    def document_from_string(
+        self, schema: "GraphQLSchema", document_string: str
+    ) -> GraphQLDocument:
+        key = self.get_key(schema, get_query_hash(document_string))
+        with self._lock:
+            document = self._get(key)
+            if document is not None:
+                self.hits += 1
+                return document
+            self.misses += 1
+        document = self.build_document(schema, document_string)
+        with self._lock:
+            self._set(key, document)
+        return document
+
+    def _get(self, key: Hashable) -> Optional[GraphQLDocument]:
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+        return document
+
+    def _set(self, key: Hashable, document: GraphQLDocument):
+        self._documents[key] = document
+        self._documents.move_to_end(key)
+        while len(self._documents) > self.max_size:
+            self._documents.popitem(last=False)
+
+    def build_document(
+        self, schema: "GraphQLSchema", document_string: str
+    ) -> GraphQLDocument:
+        document_ast = parse(document_string)
+        validation_errors = validate(schema, document_ast)
+        if validation_errors:
+            execute_document = partial(_invalid_result, validation_errors)
+        else:
+            execute_document = partial(
+                _execute_validated, schema, document_ast, **self.execute_params
+            )
+        return GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=execute_document,
+        )
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._documents),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class PersistedQueryStore:
+    """Store of query strings registered with automatic persisted queries.
+
+    Query strings are kept in the Django cache so a hash registered in one
+    worker can be resolved by every other one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query_hash: str) -> Optional[str]:
+        query = cache.get(PERSISTED_QUERY_CACHE_KEY.format(query_hash))
+        self.record(found=query is not None)
+        return query
+
+    def record(self, found: bool):
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def set(self, query_hash: str, query: str):
+        cache.set(
+            PERSISTED_QUERY_CACHE_KEY.format(query_hash),
+            query,
+            timeout=settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT,
+        )
+
+    def clear_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+_backend: Optional[CachedGraphQLBackend] = None
+_backend_lock = threading.Lock()
+
+persisted_queries = PersistedQueryStore()
+
+
+def get_cached_backend() -> CachedGraphQLBackend:
+    """Return the process-wide backend caching parsed documents."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = CachedGraphQLBackend(
+                    max_size=settings.GRAPHQL_QUERY_CACHE_SIZE
+                )
+    return _backend
+
+
+def get_persisted_query_hash(data: dict) -> Optional[str]:
+    extensions = data.get("extensions") or {}
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery") or {}
+    if not isinstance(persisted_query, dict):
+        return None
+    return persisted_query.get("sha256Hash")
+
+
+def get_stats() -> Dict[str, Dict[str, int]]:
+    backend_stats = _backend.get_stats() if _backend is not None else {}
+    return {
+        "documents": backend_stats,
+        "persisted_queries": persisted_queries.get_stats(),
+    }
@@ -1,7 +1,9 @@
 import graphene
+from django.db import transaction
 
 from ...core.permissions import ShippingPermissions
 from ...shipping import models
+from ...shipping.utils import invalidate_shipping_methods_index
 from ..core.mutations import ModelBulkDeleteMutation
 from ..core.types.common import ShippingError
 
@@ -21,6 +23,12 @@ class ShippingZoneBulkDelete(ModelBulkDeleteMutation):
         error_type_class = ShippingError
         error_type_field = "shipping_errors"
 
+    @classmethod
+    @transaction.atomic
+    def bulk_action(cls, queryset):
+        queryset.delete()
+        invalidate_shipping_methods_index()
+
 
 class ShippingPriceBulkDelete(ModelBulkDeleteMutation):
     class Arguments:
@@ -36,3 +44,9 @@ class ShippingPriceBulkDelete(ModelBulkDeleteMutation):
         permissions = (ShippingPermissions.MANAGE_SHIPPING,)
         error_type_class = ShippingError
         error_type_field = "shipping_errors"
+
+    @classmethod
+    @transaction.atomic
+    def bulk_action(cls, queryset):
+        queryset.delete()
+        invalidate_shipping_methods_index()
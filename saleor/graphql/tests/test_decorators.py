@@ -1,7 +1,8 @@
 import pytest
-from django.contrib.auth.models import Permission
+from django.contrib.auth.models import AnonymousUser, Permission
 
 from ...core.permissions import (
+    AccountPermissions,
     AppPermission,
     CheckoutPermissions,
     OrderPermissions,
@@ -77,3 +78,25 @@ def test_permission_required(
     request.user = staff_user
     has_perms = _permission_required(permissions_required, request)
     assert has_perms == access_granted
+
+
+def test_permission_required_resolves_permissions_once_per_request(
+    staff_user, permission_manage_orders, rf, django_assert_num_queries
+):
+    staff_user.user_permissions.add(permission_manage_orders)
+    request = rf.request()
+    request.user = staff_user
+    assert _permission_required([OrderPermissions.MANAGE_ORDERS], request)
+
+    with django_assert_num_queries(0):
+        assert _permission_required([OrderPermissions.MANAGE_ORDERS], request)
+        assert not _permission_required([AppPermission.MANAGE_APPS], request)
+
+
+def test_permission_required_app_cannot_manage_staff(app, permission_manage_staff, rf):
+    app.permissions.add(permission_manage_staff)
+    request = rf.request()
+    request.user = AnonymousUser()
+    request.app = app
+
+    assert not _permission_required([AccountPermissions.MANAGE_STAFF], request)
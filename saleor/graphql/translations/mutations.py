@@ -6,6 +6,7 @@ from ...discount import models as discount_models
 from ...menu import models as menu_models
 from ...page import models as page_models
 from ...product import models as product_models
+from ...search.utils import update_products_search_index
 from ...shipping import models as shipping_models
 from ..core.mutations import BaseMutation, ModelMutation, registry
 from ..core.types.common import TranslationError
@@ -82,6 +83,12 @@ class ProductTranslate(BaseTranslateMutation):
         error_type_class = TranslationError
         error_type_field = "translation_errors"
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        update_products_search_index([response.product.pk])
+        return response
+
 
 class CollectionTranslate(BaseTranslateMutation):
     class Arguments:
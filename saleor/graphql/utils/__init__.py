@@ -1,4 +1,4 @@
-from typing import Union
+from typing import FrozenSet, Iterable, Union
 
 import graphene
 from django.db.models import Value
@@ -7,6 +7,7 @@ from graphene_django.registry import get_global_registry
 from graphql.error import GraphQLError
 from graphql_relay import from_global_id
 
+from ...core.permissions import get_permissions_enum_dict
 from ..core.enums import PermissionEnum
 from ..core.types import Permission
 
@@ -128,6 +129,40 @@ def get_user_or_app_from_context(context):
     return context.app or context.user
 
 
+def _resolve_context_permissions(context) -> FrozenSet[str]:
+    user = context.user
+    if user.is_authenticated:
+        # Superusers have all permissions unless their token limits them
+        if user.is_active and user.is_superuser and not user._effective_permissions:
+            permissions = get_permissions_enum_dict().values()
+            return frozenset(permission.value for permission in permissions)
+        return frozenset(user.get_all_permissions())
+    app = getattr(context, "app", None)
+    if app:
+        return frozenset(app.get_permissions())
+    return frozenset()
+
+
+def get_context_permissions(context) -> FrozenSet[str]:
+    """Return names of permissions of the user or app making the request.
+
+    Permissions are resolved once per request and shared by all permission
+    checks of the operation.
+    """
+    if not hasattr(context, "_cached_permissions"):
+        context._cached_permissions = _resolve_context_permissions(context)
+    return context._cached_permissions
+
+
+def has_context_permissions(context, permissions: Iterable) -> bool:
+    """Return True if the user or app making the request has all permissions."""
+    context_permissions = get_context_permissions(context)
+    return all(
+        getattr(permission, "value", permission) in context_permissions
+        for permission in permissions
+    )
+
+
 def requestor_is_superuser(requestor):
     """Return True if requestor is superuser."""
     return getattr(requestor, "is_superuser", False)
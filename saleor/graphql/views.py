@@ -1,18 +1,22 @@
+import copy
 import fnmatch
 import json
 import logging
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import opentracing
 import opentracing.tags
 from django.conf import settings
-from django.db import connection
+from django.contrib.auth import authenticate
+from django.db import close_old_connections, connection
 from django.db.backends.postgresql.base import DatabaseWrapper
 from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import render
 from django.urls import reverse
-from django.utils.functional import SimpleLazyObject
+from django.utils.functional import SimpleLazyObject, empty
 from django.views.generic import View
 from graphene_django.settings import graphene_settings
 from graphene_django.views import instantiate_middleware
@@ -23,10 +27,21 @@ from graphql.error import (
     format_error as format_graphql_error,
 )
 from graphql.execution import ExecutionResult
+from graphql.utils.get_operation_ast import get_operation_ast
 from jwt.exceptions import PyJWTError
 
 from ..core.exceptions import PermissionDenied, ReadOnlyException
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
+from .query_cache import (
+    CachedGraphQLBackend,
+    PersistedQueryHashMismatch,
+    PersistedQueryNotFound,
+    PersistedQueryNotSupported,
+    get_cached_backend,
+    get_persisted_query_hash,
+    get_query_hash,
+    persisted_queries,
+)
 
 API_PATH = SimpleLazyObject(lambda: reverse("api"))
 
@@ -34,6 +49,23 @@ unhandled_errors_logger = logging.getLogger("saleor.graphql.errors.unhandled")
 handled_errors_logger = logging.getLogger("saleor.graphql.errors.handled")
 
 
+_batch_executor: Optional[ThreadPoolExecutor] = None
+_batch_executor_lock = threading.Lock()
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    """Return the worker pool shared by all concurrently executed batches."""
+    global _batch_executor
+    if _batch_executor is None:
+        with _batch_executor_lock:
+            if _batch_executor is None:
+                _batch_executor = ThreadPoolExecutor(
+                    max_workers=settings.GRAPHQL_BATCH_MAX_WORKERS,
+                    thread_name_prefix="graphql-batch",
+                )
+    return _batch_executor
+
+
 def tracing_wrapper(execute, sql, params, many, context):
     conn: DatabaseWrapper = context["connection"]
     operation = f"{conn.alias} {conn.display_name}"
@@ -51,8 +83,11 @@ class GraphQLView(View):
     # - Playground as default the API explorer (see
     # https://github.com/prisma/graphql-playground)
     # - file upload (https://github.com/lmcgartland/graphene-file-upload)
-    # - query batching
+    # - query batching (optionally executing queries of a batch concurrently)
     # - CORS
+    # - caching of parsed and validated documents
+    # - automatic persisted queries (see
+    # https://www.apollographql.com/docs/apollo-server/performance/apq/)
 
     schema = None
     executor = None
@@ -69,7 +104,10 @@ class GraphQLView(View):
         if schema is None:
             schema = graphene_settings.SCHEMA
         if backend is None:
-            backend = get_default_backend()
+            if settings.GRAPHQL_QUERY_CACHE_SIZE:
+                backend = get_cached_backend()
+            else:
+                backend = get_default_backend()
         if middleware is None:
             middleware = graphene_settings.MIDDLEWARE
         self.schema = self.schema or schema
@@ -119,7 +157,7 @@ class GraphQLView(View):
             )
 
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            responses = self.get_batch_responses(request, data)
             result: Union[list, Optional[dict]] = [
                 response for response, code in responses
             ]
@@ -161,9 +199,12 @@ class GraphQLView(View):
             return response
 
     def get_response(
-        self, request: HttpRequest, data: dict
+        self,
+        request: HttpRequest,
+        data: dict,
+        document: Optional[GraphQLDocument] = None,
     ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
-        execution_result = self.execute_graphql_request(request, data)
+        execution_result = self.execute_graphql_request(request, data, document)
         status_code = 200
         if execution_result:
             response = {}
@@ -181,6 +222,112 @@ class GraphQLView(View):
 
         return result, status_code
 
+    def get_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> List[Tuple[Optional[Dict[str, List[Any]]], int]]:
+        """Execute all operations of a batch and return responses in order.
+
+        When `GRAPHQL_BATCH_MAX_WORKERS` is set, consecutive query operations are
+        executed concurrently. Any other operation, like a mutation, waits for the
+        preceding ones to finish and is executed on its own, so the order of side
+        effects is the same as in the sequential mode.
+        """
+        if settings.GRAPHQL_BATCH_MAX_WORKERS < 2 or len(data) < 2:
+            return [self.get_response(request, entry) for entry in data]
+
+        responses: List[Tuple[Optional[Dict[str, List[Any]]], int]] = []
+        pending_queries: List[Tuple[dict, Optional[GraphQLDocument]]] = []
+        for entry in data:
+            document, is_query = self.parse_batch_entry(request, entry)
+            if is_query:
+                pending_queries.append((entry, document))
+                continue
+            responses.extend(self.get_concurrent_responses(request, pending_queries))
+            pending_queries = []
+            responses.append(self.get_response(request, entry, document))
+        responses.extend(self.get_concurrent_responses(request, pending_queries))
+        return responses
+
+    def get_concurrent_responses(
+        self,
+        request: HttpRequest,
+        entries: List[Tuple[dict, Optional[GraphQLDocument]]],
+    ) -> List[Tuple[Optional[Dict[str, List[Any]]], int]]:
+        if len(entries) < 2:
+            return [
+                self.get_response(request, data, document) for data, document in entries
+            ]
+        self.resolve_lazy_request_attributes(request)
+        span = opentracing.global_tracer().active_span
+        executor = get_batch_executor()
+        futures = [
+            executor.submit(self.get_isolated_response, request, data, document, span)
+            for data, document in entries
+        ]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def resolve_lazy_request_attributes(request: HttpRequest):
+        """Evaluate lazy objects of the request before it is copied to threads.
+
+        Copies of the request share its attributes, so lazy objects like the
+        user, app, discounts or plugins would be evaluated concurrently.
+        """
+        if not hasattr(request, "_cached_user"):
+            request._cached_user = authenticate(request=request)  # type: ignore
+        for name, value in list(vars(request).items()):
+            if isinstance(value, SimpleLazyObject):
+                if value._wrapped is empty:
+                    value._setup()
+                setattr(request, name, value._wrapped)
+
+    def get_isolated_response(
+        self,
+        request: HttpRequest,
+        data: dict,
+        document: Optional[GraphQLDocument] = None,
+        parent_span=None,
+    ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
+        # Each operation gets its own copy of the request, so data loaders and
+        # other objects cached on the request are not shared between threads.
+        request = copy.copy(request)
+        request.dataloaders = {}  # type: ignore
+        try:
+            if parent_span is None:
+                return self.get_response(request, data, document)
+            scope_manager = opentracing.global_tracer().scope_manager
+            with scope_manager.activate(parent_span, finish_on_close=False):
+                return self.get_response(request, data, document)
+        finally:
+            # Pool threads keep their connections between operations, drop only
+            # the ones which are broken or older than CONN_MAX_AGE
+            close_old_connections()
+
+    def parse_batch_entry(
+        self, request: HttpRequest, data: dict
+    ) -> Tuple[Optional[GraphQLDocument], bool]:
+        """Return the document of a batch entry and whether it is a query.
+
+        The document is passed on to the execution so the entry is not parsed
+        twice. Persisted queries are resolved again when executed, which
+        registers their hashes, so their documents are not returned.
+        """
+        if not isinstance(data, dict):
+            return None, False
+        query, _, operation_name = self.get_graphql_params(request, data)
+        query_hash = get_persisted_query_hash(data)
+        if query_hash and not query:
+            if not isinstance(self.backend, CachedGraphQLBackend):
+                return None, False
+            document = self.backend.get_document(self.schema, query_hash)
+        else:
+            document, _ = self.parse_query(query)
+        if document is None:
+            return None, False
+        operation = get_operation_ast(document.document_ast, operation_name)
+        is_query = operation is not None and operation.operation == "query"
+        return (None if query_hash else document), is_query
+
     def get_root_value(self):
         return self.root_value
 
@@ -212,16 +359,70 @@ class GraphQLView(View):
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
-    def execute_graphql_request(self, request: HttpRequest, data: dict):
+    def parse_persisted_query(
+        self, query_hash: str, query: Optional[str]
+    ) -> Tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
+        """Resolve a document of an automatic persisted query.
+
+        If the query string is sent along with its hash, it is registered under
+        that hash. Otherwise the hash is looked up in the documents cache and then
+        in the persisted queries store; unknown hashes return an error telling
+        the client to retry with the full query.
+        """
+        if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+            return (
+                None,
+                ExecutionResult(errors=[PersistedQueryNotSupported()], invalid=True),
+            )
+
+        if query:
+            if not isinstance(query, str) or get_query_hash(query) != query_hash:
+                return (
+                    None,
+                    ExecutionResult(
+                        errors=[PersistedQueryHashMismatch()], invalid=True
+                    ),
+                )
+            document, error = self.parse_query(query)
+            if document is not None:
+                persisted_queries.set(query_hash, query)
+            return document, error
+
+        if isinstance(self.backend, CachedGraphQLBackend):
+            document = self.backend.get_document(self.schema, query_hash)
+            if document is not None:
+                persisted_queries.record(found=True)
+                return document, None
+
+        query = persisted_queries.get(query_hash)
+        if query is None:
+            return (
+                None,
+                ExecutionResult(errors=[PersistedQueryNotFound()], invalid=True),
+            )
+        return self.parse_query(query)
+
+    def execute_graphql_request(
+        self,
+        request: HttpRequest,
+        data: dict,
+        document: Optional[GraphQLDocument] = None,
+    ):
         with opentracing.global_tracer().start_active_span("graphql_query") as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "GraphQL")
 
             query, variables, operation_name = self.get_graphql_params(request, data)
 
-            document, error = self.parse_query(query)
-            if error:
-                return error
+            # The document may have been parsed already, e.g. to plan a batch
+            if document is None:
+                query_hash = get_persisted_query_hash(data)
+                if query_hash:
+                    document, error = self.parse_persisted_query(query_hash, query)
+                else:
+                    document, error = self.parse_query(query)
+                if error:
+                    return error
 
             if document is not None:
                 raw_query_string = document.document_string[
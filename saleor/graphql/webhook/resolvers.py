@@ -4,6 +4,7 @@ from ...core.exceptions import PermissionDenied
 from ...core.permissions import AppPermission
 from ...webhook import models, payloads
 from ...webhook.event_types import WebhookEventType
+from ..utils import has_context_permissions
 from .types import Webhook, WebhookEvent
 
 
@@ -12,8 +13,7 @@ def resolve_webhooks(info, **_kwargs):
     if app:
         qs = models.Webhook.objects.filter(app=app)
     else:
-        user = info.context.user
-        if not user.has_perm(AppPermission.MANAGE_APPS):
+        if not has_context_permissions(info.context, [AppPermission.MANAGE_APPS]):
             raise PermissionDenied()
         qs = models.Webhook.objects.all()
     return qs
@@ -24,8 +24,7 @@ def resolve_webhook(info, webhook_id):
     if app:
         _, webhook_id = graphene.Node.from_global_id(webhook_id)
         return app.webhooks.filter(id=webhook_id).first()
-    user = info.context.user
-    if user.has_perm(AppPermission.MANAGE_APPS):
+    if has_context_permissions(info.context, [AppPermission.MANAGE_APPS]):
         return graphene.Node.get_node_from_global_id(info, webhook_id, Webhook)
     raise PermissionDenied()
 
@@ -38,11 +37,8 @@ def resolve_webhook_events():
 
 
 def resolve_sample_payload(info, event_name):
-    app = info.context.app
     required_permission = WebhookEventType.PERMISSIONS.get(event_name)
     if required_permission:
-        if app and app.has_perm(required_permission):
-            return payloads.generate_sample_payload(event_name)
-        if info.context.user.has_perm(required_permission):
+        if has_context_permissions(info.context, [required_permission]):
             return payloads.generate_sample_payload(event_name)
     raise PermissionDenied()
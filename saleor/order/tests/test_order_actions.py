@@ -52,6 +52,8 @@ def order_with_digital_line(order, digital_content, stock, site_settings):
     )
 
     Allocation.objects.create(order_line=line, stock=stock, quantity_allocated=quantity)
+    stock.quantity_allocated = quantity
+    stock.save(update_fields=["quantity_allocated"])
 
     return order
 
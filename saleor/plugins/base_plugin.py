@@ -145,6 +145,21 @@ class BasePlugin:
         """
         return NotImplemented
 
+    def calculate_checkout_line_totals(
+        self,
+        checkout: "Checkout",
+        lines: List["CheckoutLine"],
+        discounts: List["DiscountInfo"],
+        previous_value: List[TaxedMoney],
+    ) -> List[TaxedMoney]:
+        """Calculate totals of all checkout lines at once.
+
+        Overwrite this method if the prices of all lines can be calculated in a single
+        call, e.g. with one request to an external service. Return a list of
+        TaxedMoney in the order of lines.
+        """
+        return NotImplemented
+
     def calculate_order_line_unit(
         self, order_line: "OrderLine", previous_value: TaxedMoney
     ) -> TaxedMoney:
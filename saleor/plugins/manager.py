@@ -1,5 +1,17 @@
+from copy import deepcopy
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 import opentracing
 from django.conf import settings
@@ -9,16 +21,17 @@ from django.utils.module_loading import import_string
 from django_countries.fields import Country
 from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
-from ..checkout import base_calculations
+from ..checkout import CheckoutPrices, base_calculations
 from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxType, zero_taxed_money
+from ..core.utils.cache import ProcessCache
 from ..discount import DiscountInfo
+from .base_plugin import BasePlugin
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
     # flake8: noqa
-    from .base_plugin import BasePlugin
     from ..checkout.models import Checkout, CheckoutLine
     from ..product.models import Product, ProductType
     from ..account.models import Address, User
@@ -33,19 +46,83 @@ if TYPE_CHECKING:
     )
 
 
+PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY = "plugin_configurations_version"
+
+_plugin_classes: Dict[str, Type[BasePlugin]] = {}
+
+
+def get_plugin_class(plugin_path: str) -> Type[BasePlugin]:
+    """Import the plugin class once per process."""
+    if plugin_path not in _plugin_classes:
+        _plugin_classes[plugin_path] = import_string(plugin_path)
+    return _plugin_classes[plugin_path]
+
+
+def _load_plugin_configurations() -> Dict[str, PluginConfiguration]:
+    return {pc.identifier: pc for pc in PluginConfiguration.objects.all()}
+
+
+_plugin_configurations = ProcessCache(
+    PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY,
+    "PLUGINS_CONFIGURATION_CACHE_TIMEOUT",
+    _load_plugin_configurations,
+)
+
+
+def get_plugin_configurations() -> Dict[str, PluginConfiguration]:
+    """Return plugin configurations stored in the database by plugin identifier.
+
+    Configurations are reused by all managers created by the process until they
+    are changed with `invalidate_plugin_configurations` or for
+    `PLUGINS_CONFIGURATION_CACHE_TIMEOUT` seconds.
+    """
+    return dict(_plugin_configurations.get())
+
+
+def is_hook_overridden(plugin: BasePlugin, method_name: str) -> bool:
+    """Check if the plugin provides its own implementation of the given hook."""
+    if method_name in vars(plugin):
+        return True
+    for klass in type(plugin).__mro__:
+        if method_name in vars(klass):
+            return klass is not BasePlugin
+    return False
+
+
+def _calculate_line_totals_with_line_hook(
+    line_hook: Callable, checkout, lines, discounts, previous_value
+):
+    line_totals = []
+    for line, line_total in zip(lines, previous_value):
+        returned_value = line_hook(line, discounts, previous_value=line_total)
+        if returned_value != NotImplemented:
+            line_total = returned_value
+        line_totals.append(line_total)
+    return line_totals
+
+
+def invalidate_plugin_configurations():
+    """Drop cached plugin configurations once the transaction is committed."""
+    _plugin_configurations.invalidate()
+
+
 class PluginsManager(PaymentInterface):
     """Base manager for handling plugins logic."""
 
-    plugins: List["BasePlugin"] = []
+    plugins: List[BasePlugin] = []
 
     def __init__(self, plugins: List[str]):
         self.plugins = []
+        self._hooks: Dict[str, List[Callable]] = {}
+        self._line_totals_hooks: Optional[List[Callable]] = None
         all_configs = self._get_all_plugin_configs()
         for plugin_path in plugins:
-            PluginClass = import_string(plugin_path)
+            PluginClass = get_plugin_class(plugin_path)
             if PluginClass.PLUGIN_ID in all_configs:
                 existing_config = all_configs[PluginClass.PLUGIN_ID]
-                plugin_config = existing_config.configuration
+                # Plugins update their configuration in place, the stored one may
+                # be shared with other managers
+                plugin_config = deepcopy(existing_config.configuration)
                 active = existing_config.active
             else:
                 plugin_config = PluginClass.DEFAULT_CONFIGURATION
@@ -56,19 +133,38 @@ class PluginsManager(PaymentInterface):
         self, method_name: str, default_value: Any, *args, **kwargs
     ):
         """Try to run a method with the given name on each declared plugin."""
+        hooks = self.get_hooks(method_name)
+        if not hooks:
+            return default_value
         with opentracing.global_tracer().start_active_span(
             f"ExtensionsManager.{method_name}"
         ):
             value = default_value
-            for plugin in self.plugins:
-                value = self.__run_method_on_single_plugin(
-                    plugin, method_name, value, *args, **kwargs
-                )
+            for hook in hooks:
+                returned_value = hook(*args, **kwargs, previous_value=value)
+                if returned_value != NotImplemented:
+                    value = returned_value
             return value
 
+    def get_hooks(self, method_name: str) -> List[Callable]:
+        """Return methods of plugins that implement the given hook.
+
+        The list is built once per hook, plugins relying on the default
+        implementation from `BasePlugin` are skipped.
+        """
+        hooks = self._hooks.get(method_name)
+        if hooks is None:
+            hooks = [
+                getattr(plugin, method_name)
+                for plugin in self.plugins
+                if is_hook_overridden(plugin, method_name)
+            ]
+            self._hooks[method_name] = hooks
+        return hooks
+
     def __run_method_on_single_plugin(
         self,
-        plugin: Optional["BasePlugin"],
+        plugin: Optional[BasePlugin],
         method_name: str,
         previous_value: Any,
         *args,
@@ -97,16 +193,60 @@ class PluginsManager(PaymentInterface):
             "change_user_address", default_value, address, address_type, user
         )
 
+    def calculate_checkout_prices(
+        self,
+        checkout: "Checkout",
+        lines: Iterable["CheckoutLine"],
+        discounts: Iterable[DiscountInfo],
+    ) -> CheckoutPrices:
+        """Calculate prices of the lines, subtotal, shipping and total at once.
+
+        Every hook is run once per checkout, prices calculated in the previous
+        steps are reused as default values of the following ones.
+        """
+        lines = list(lines)
+        line_totals = self.calculate_checkout_line_totals(checkout, lines, discounts)
+        subtotal = self._calculate_checkout_subtotal(
+            checkout, lines, discounts, line_totals
+        )
+        shipping_price = self.calculate_checkout_shipping(checkout, lines, discounts)
+        total = self._calculate_checkout_total(
+            checkout, lines, discounts, subtotal, shipping_price
+        )
+        return CheckoutPrices(
+            line_totals={line.pk: price for line, price in zip(lines, line_totals)},
+            subtotal=subtotal,
+            shipping_price=shipping_price,
+            discount=checkout.discount,
+            total=total,
+        )
+
     def calculate_checkout_total(
         self,
         checkout: "Checkout",
         lines: Iterable["CheckoutLine"],
         discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
+        lines = list(lines)
+        return self._calculate_checkout_total(
+            checkout,
+            lines,
+            discounts,
+            self.calculate_checkout_subtotal(checkout, lines, discounts),
+            self.calculate_checkout_shipping(checkout, lines, discounts),
+        )
 
+    def _calculate_checkout_total(
+        self,
+        checkout: "Checkout",
+        lines: List["CheckoutLine"],
+        discounts: Iterable[DiscountInfo],
+        subtotal: TaxedMoney,
+        shipping_price: TaxedMoney,
+    ) -> TaxedMoney:
         default_value = base_calculations.base_checkout_total(
-            subtotal=self.calculate_checkout_subtotal(checkout, lines, discounts),
-            shipping_price=self.calculate_checkout_shipping(checkout, lines, discounts),
+            subtotal=subtotal,
+            shipping_price=shipping_price,
             discount=checkout.discount,
             currency=checkout.currency,
         )
@@ -123,9 +263,19 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLine"],
         discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
-        line_totals = [
-            self.calculate_checkout_line_total(line, discounts) for line in lines
-        ]
+        lines = list(lines)
+        line_totals = self.calculate_checkout_line_totals(checkout, lines, discounts)
+        return self._calculate_checkout_subtotal(
+            checkout, lines, discounts, line_totals
+        )
+
+    def _calculate_checkout_subtotal(
+        self,
+        checkout: "Checkout",
+        lines: List["CheckoutLine"],
+        discounts: Iterable[DiscountInfo],
+        line_totals: List[TaxedMoney],
+    ) -> TaxedMoney:
         default_value = base_calculations.base_checkout_subtotal(
             line_totals, checkout.currency
         )
@@ -178,6 +328,56 @@ class PluginsManager(PaymentInterface):
             checkout_line.checkout.currency,
         )
 
+    def calculate_checkout_line_totals(
+        self,
+        checkout: "Checkout",
+        lines: List["CheckoutLine"],
+        discounts: Iterable[DiscountInfo],
+    ) -> List[TaxedMoney]:
+        """Return total prices of all checkout lines, in the order of lines.
+
+        Plugins may price all lines at once with the `calculate_checkout_line_totals`
+        hook, other plugins have their `calculate_checkout_line_total` hook run
+        on every line.
+        """
+        line_totals = [
+            base_calculations.base_checkout_line_total(line, discounts)
+            for line in lines
+        ]
+        hooks = self.get_checkout_line_totals_hooks()
+        if hooks:
+            with opentracing.global_tracer().start_active_span(
+                "ExtensionsManager.calculate_checkout_line_totals"
+            ):
+                for hook in hooks:
+                    returned_value = hook(
+                        checkout, lines, discounts, previous_value=line_totals
+                    )
+                    if returned_value != NotImplemented:
+                        line_totals = returned_value
+        return [quantize_price(price, checkout.currency) for price in line_totals]
+
+    def get_checkout_line_totals_hooks(self) -> List[Callable]:
+        """Return hooks pricing all checkout lines, one per plugin which prices them.
+
+        Plugins without the batch hook get their `calculate_checkout_line_total`
+        hook run on every line, in the same place of the chain.
+        """
+        if self._line_totals_hooks is None:
+            self._line_totals_hooks = []
+            for plugin in self.plugins:
+                if is_hook_overridden(plugin, "calculate_checkout_line_totals"):
+                    hook = plugin.calculate_checkout_line_totals
+                elif is_hook_overridden(plugin, "calculate_checkout_line_total"):
+                    hook = partial(
+                        _calculate_line_totals_with_line_hook,
+                        plugin.calculate_checkout_line_total,
+                    )
+                else:
+                    continue
+                self._line_totals_hooks.append(hook)
+        return self._line_totals_hooks
+
     def calculate_order_line_unit(self, order_line: "OrderLine") -> TaxedMoney:
         unit_price = order_line.unit_price
         default_value = quantize_price(unit_price, unit_price.currency)
@@ -379,12 +579,12 @@ class PluginsManager(PaymentInterface):
             )
         raise Exception(f"Payment plugin {gateway} is inaccessible!")
 
-    def get_active_plugins(self, plugins=None) -> List["BasePlugin"]:
+    def get_active_plugins(self, plugins=None) -> List[BasePlugin]:
         if plugins is None:
             plugins = self.plugins
         return [plugin for plugin in plugins if plugin.active]
 
-    def list_payment_plugin(self, active_only: bool = False) -> Dict[str, "BasePlugin"]:
+    def list_payment_plugin(self, active_only: bool = False) -> Dict[str, BasePlugin]:
         payment_method = "process_payment"
         plugins = self.plugins
         if active_only:
@@ -447,9 +647,7 @@ class PluginsManager(PaymentInterface):
 
     def _get_all_plugin_configs(self):
         if not hasattr(self, "_plugin_configs"):
-            self._plugin_configs = {
-                pc.identifier: pc for pc in PluginConfiguration.objects.all()
-            }
+            self._plugin_configs = get_plugin_configurations()
         return self._plugin_configs
 
     # FIXME these methods should be more generic
@@ -485,11 +683,13 @@ class PluginsManager(PaymentInterface):
                     identifier=plugin_id,
                     defaults={"configuration": plugin.configuration},
                 )
-                return plugin.save_plugin_configuration(
+                plugin_configuration = plugin.save_plugin_configuration(
                     plugin_configuration, cleaned_data
                 )
+                invalidate_plugin_configurations()
+                return plugin_configuration
 
-    def get_plugin(self, plugin_id: str) -> Optional["BasePlugin"]:
+    def get_plugin(self, plugin_id: str) -> Optional[BasePlugin]:
         for plugin in self.plugins:
             if plugin.PLUGIN_ID == plugin_id:
                 return plugin
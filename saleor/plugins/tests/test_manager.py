@@ -1,13 +1,17 @@
 import json
 from decimal import Decimal
+from unittest import mock
 
 import pytest
 from django.http import HttpResponseNotFound, JsonResponse
 from django_countries.fields import Country
 from prices import Money, TaxedMoney
 
+from ...checkout import base_calculations
 from ...core.taxes import TaxType
 from ...payment.interface import PaymentGateway
+from ...tests.utils import flush_post_commit_hooks
+from .. import manager as manager_module
 from ..manager import PluginsManager, get_plugins_manager
 from ..models import PluginConfiguration
 from ..tests.sample_plugins import (
@@ -109,6 +113,80 @@ def test_manager_calculates_checkout_line_total(
     assert TaxedMoney(expected_total, expected_total) == taxed_total
 
 
+def test_manager_calculates_checkout_line_totals_in_batch(
+    checkout_with_item, discount_info
+):
+    lines = list(checkout_with_item)
+    price = Money("2.0", checkout_with_item.currency)
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.PluginSample"]
+    )
+
+    with mock.patch.object(
+        PluginSample,
+        "calculate_checkout_line_totals",
+        return_value=[TaxedMoney(price, price)],
+        autospec=True,
+    ) as mocked_hook:
+        line_totals = manager.calculate_checkout_line_totals(
+            checkout_with_item, lines, [discount_info]
+        )
+
+    assert line_totals == [TaxedMoney(price, price)]
+    # The batch hook replaces the line hook of the plugin, it gets base prices
+    previous_value = mocked_hook.call_args[1]["previous_value"]
+    assert previous_value == [
+        base_calculations.base_checkout_line_total(line, [discount_info])
+        for line in lines
+    ]
+
+
+def test_manager_calculates_checkout_line_totals_with_line_hook(
+    checkout_with_item, discount_info
+):
+    lines = list(checkout_with_item)
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.PluginSample"]
+    )
+
+    line_totals = manager.calculate_checkout_line_totals(
+        checkout_with_item, lines, [discount_info]
+    )
+
+    one = Money("1.0", checkout_with_item.currency)
+    assert line_totals == [TaxedMoney(one, one)] * len(lines)
+
+
+@pytest.mark.parametrize(
+    "plugins, line_amount, shipping_amount, total_amount",
+    [
+        (["saleor.plugins.tests.sample_plugins.PluginSample"], "1.0", "1.0", "1.0"),
+        ([], "15.0", "0.0", "15.0"),
+    ],
+)
+def test_manager_calculates_checkout_prices(
+    checkout_with_item,
+    discount_info,
+    plugins,
+    line_amount,
+    shipping_amount,
+    total_amount,
+):
+    currency = checkout_with_item.currency
+    line = checkout_with_item.lines.first()
+
+    prices = PluginsManager(plugins=plugins).calculate_checkout_prices(
+        checkout_with_item, list(checkout_with_item), [discount_info]
+    )
+
+    line_price = Money(line_amount, currency)
+    shipping_price = Money(shipping_amount, currency)
+    total = Money(total_amount, currency)
+    assert prices.line_totals == {line.pk: TaxedMoney(line_price, line_price)}
+    assert prices.shipping_price == TaxedMoney(shipping_price, shipping_price)
+    assert prices.total == TaxedMoney(total, total)
+
+
 @pytest.mark.parametrize(
     "plugins, amount",
     [(["saleor.plugins.tests.sample_plugins.PluginSample"], "1.0"), ([], "12.30")],
@@ -215,6 +293,64 @@ def test_manager_save_plugin_configuration(plugin_configuration):
     assert not plugin_configuration.active
 
 
+def test_manager_get_hooks_skips_plugins_without_implementation(db):
+    plugins = [
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginInactive",
+    ]
+    manager = PluginsManager(plugins=plugins)
+    plugin_sample = manager.get_plugin(PluginSample.PLUGIN_ID)
+
+    assert manager.get_hooks("show_taxes_on_storefront") == [
+        plugin_sample.show_taxes_on_storefront
+    ]
+    assert manager.get_hooks("customer_created") == []
+
+
+def test_manager_skips_tracing_of_hooks_without_implementation(db, monkeypatch):
+    tracer = mock.Mock()
+    monkeypatch.setattr(
+        "saleor.plugins.manager.opentracing.global_tracer", lambda: tracer
+    )
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.PluginInactive"]
+    )
+
+    assert manager.show_taxes_on_storefront() is False
+    tracer.start_active_span.assert_not_called()
+
+
+@pytest.fixture
+def plugin_configurations_cache_enabled(enable_process_cache):
+    enable_process_cache(manager_module._plugin_configurations)
+
+
+def test_manager_reuses_cached_plugin_configurations(
+    plugin_configuration, plugin_configurations_cache_enabled, django_assert_num_queries
+):
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    PluginsManager(plugins=plugins)
+
+    with django_assert_num_queries(0):
+        manager = PluginsManager(plugins=plugins)
+
+    plugin = manager.get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.active == plugin_configuration.active
+
+
+def test_manager_save_plugin_configuration_invalidates_cache(
+    plugin_configuration, plugin_configurations_cache_enabled
+):
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = PluginsManager(plugins=plugins)
+
+    manager.save_plugin_configuration(PluginSample.PLUGIN_ID, {"active": False})
+    flush_post_commit_hooks()
+
+    manager = PluginsManager(plugins=plugins)
+    assert not manager.get_plugin(PluginSample.PLUGIN_ID).active
+
+
 def test_plugin_updates_configuration_shape(
     new_config, new_config_structure, plugin_configuration, monkeypatch,
 ):
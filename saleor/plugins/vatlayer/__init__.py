@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from typing import Dict, Optional
 
+from django.conf import settings
+from django_prices_vatlayer.models import VAT
 from django_prices_vatlayer.utils import get_tax_for_rate, get_tax_rates_for_country
 from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ...core.taxes import charge_taxes_on_shipping, include_taxes_in_prices
+from ...core.utils.cache import ProcessCache
 
 
 class TaxRateType:
@@ -64,6 +68,8 @@ class TaxRateType:
 
 DEFAULT_TAX_RATE_NAME = TaxRateType.STANDARD
 
+TAXES_VERSION_CACHE_KEY = "vatlayer_taxes_version"
+
 
 @dataclass
 class VatlayerConfiguration:
@@ -101,8 +107,7 @@ def apply_tax_to_price(taxes, rate_name, base):
     return tax_to_apply(base, keep_gross=keep_gross)
 
 
-def get_taxes_for_country(country):
-    tax_rates = get_tax_rates_for_country(country.code)
+def _prepare_taxes(tax_rates: Optional[dict]) -> Optional[dict]:
     if tax_rates is None:
         return None
 
@@ -125,6 +130,36 @@ def get_taxes_for_country(country):
     return taxes
 
 
+def _prepare_taxes_for_all_countries() -> Dict[str, Optional[dict]]:
+    return {vat.country_code: _prepare_taxes(vat.data) for vat in VAT.objects.all()}
+
+
+# Taxes prepared for countries by their codes, shared by all plugin instances
+_taxes_by_country = ProcessCache(
+    TAXES_VERSION_CACHE_KEY,
+    "VATLAYER_TAXES_CACHE_TIMEOUT",
+    _prepare_taxes_for_all_countries,
+)
+
+
+def get_taxes_for_country(country):
+    """Return tax rates of a country with functions applying them.
+
+    Taxes of all countries are prepared at once and reused by the process until
+    they are invalidated with `invalidate_taxes` or for
+    `VATLAYER_TAXES_CACHE_TIMEOUT` seconds. They are shared between callers and
+    must not be modified.
+    """
+    if not settings.VATLAYER_TAXES_CACHE_TIMEOUT:
+        return _prepare_taxes(get_tax_rates_for_country(country.code))
+    return _taxes_by_country.get().get(country.code)
+
+
+def invalidate_taxes():
+    """Drop prepared taxes once the transaction is committed."""
+    _taxes_by_country.invalidate()
+
+
 def get_tax_rate_by_name(rate_name, taxes=None):
     """Return value of tax rate for current taxes."""
     if not taxes or not rate_name:
@@ -11,7 +11,6 @@ from django_prices_vatlayer.utils import (
 )
 from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
-from ...checkout import calculations
 from ...core.taxes import TaxType
 from ...graphql.core.utils.error_codes import PluginErrorCode
 from ..base_plugin import BasePlugin, ConfigurationTypeField
@@ -22,6 +21,7 @@ from . import (
     apply_tax_to_price,
     get_taxed_shipping_price,
     get_taxes_for_country,
+    invalidate_taxes,
 )
 
 if TYPE_CHECKING:
@@ -70,26 +70,6 @@ class VatlayerPlugin(BasePlugin):
             return previous_value.net != previous_value.gross
         return False
 
-    def calculate_checkout_total(
-        self,
-        checkout: "Checkout",
-        lines: List["CheckoutLine"],
-        discounts: List["DiscountInfo"],
-        previous_value: TaxedMoney,
-    ) -> TaxedMoney:
-        if self._skip_plugin(previous_value):
-            return previous_value
-
-        return (
-            calculations.checkout_subtotal(
-                checkout=checkout, lines=lines, discounts=discounts
-            )
-            + calculations.checkout_shipping_price(
-                checkout=checkout, lines=lines, discounts=discounts
-            )
-            - checkout.discount
-        )
-
     def _get_taxes_for_country(self, country: Country):
         """Try to fetch cached taxes on the plugin level.
 
@@ -281,6 +261,7 @@ class VatlayerPlugin(BasePlugin):
         if not self.active:
             return previous_value
         fetch_rates(self.config.access_key)
+        invalidate_taxes()
         return True
 
     @classmethod
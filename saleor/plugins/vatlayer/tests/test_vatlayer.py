@@ -11,6 +11,7 @@ from ....checkout import calculations
 from ....checkout.utils import add_variant_to_checkout
 from ....core.prices import quantize_price
 from ....core.taxes import zero_taxed_money
+from ... import vatlayer as vatlayer_module
 from ...manager import get_plugins_manager
 from ...models import PluginConfiguration
 from ...vatlayer import (
@@ -483,3 +484,28 @@ def test_skip_diabled_plugin(settings):
         )
         is True
     )
+
+
+def test_get_taxes_for_country_reuses_prepared_taxes(
+    vatlayer, enable_process_cache, django_assert_num_queries
+):
+    enable_process_cache(vatlayer_module._taxes_by_country)
+    taxes = get_taxes_for_country(Country("PL"))
+
+    with django_assert_num_queries(0):
+        assert get_taxes_for_country(Country("PL")) is taxes
+        assert get_taxes_for_country(Country("DE"))
+        assert get_taxes_for_country(Country("US")) is None
+
+
+def test_vatlayer_plugin_fetch_taxes_data_invalidates_taxes(vatlayer, monkeypatch):
+    monkeypatch.setattr("saleor.plugins.vatlayer.plugin.fetch_rates", Mock())
+    mocked_invalidate = Mock()
+    monkeypatch.setattr(
+        "saleor.plugins.vatlayer.plugin.invalidate_taxes", mocked_invalidate
+    )
+
+    manager = get_plugins_manager()
+    manager.get_plugin(VatlayerPlugin.PLUGIN_ID).fetch_taxes_data(False)
+
+    mocked_invalidate.assert_called_once_with()
@@ -1,10 +1,19 @@
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from typing import List, Optional
 from urllib.parse import urlparse, urlunparse
 
 import boto3
 import requests
+from django.conf import settings
 from google.cloud import pubsub_v1
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from ...celeryconf import app
@@ -16,6 +25,8 @@ from . import signature_for_payload
 logger = logging.getLogger(__name__)
 
 WEBHOOK_TIMEOUT = 10
+# Number of seconds before the first retry of a failed delivery
+WEBHOOK_RETRY_COUNTDOWN = 60
 
 
 class WebhookSchemes(str, Enum):
@@ -25,6 +36,74 @@ class WebhookSchemes(str, Enum):
     GOOGLE_CLOUD_PUBSUB = "gcpubsub"
 
 
+@dataclass
+class WebhookDelivery:
+    webhook_id: int
+    target_url: str
+    duration: float
+    error: Optional[Exception] = None
+
+
+_delivery_executor: Optional[ThreadPoolExecutor] = None
+_delivery_executor_lock = threading.Lock()
+_clients_lock = threading.Lock()
+
+
+def get_delivery_max_workers() -> int:
+    # Deliveries need at least one thread, even if the setting is lower
+    return max(settings.WEBHOOK_DELIVERY_MAX_WORKERS, 1)
+
+
+def get_delivery_executor() -> ThreadPoolExecutor:
+    """Return the worker pool delivering events to webhooks concurrently."""
+    global _delivery_executor
+    if _delivery_executor is None:
+        with _delivery_executor_lock:
+            if _delivery_executor is None:
+                _delivery_executor = ThreadPoolExecutor(
+                    max_workers=get_delivery_max_workers(),
+                    thread_name_prefix="webhook-delivery",
+                )
+    return _delivery_executor
+
+
+@lru_cache(maxsize=None)
+def get_http_session() -> requests.Session:
+    """Return the HTTP session keeping connections to webhook targets alive."""
+    session = requests.Session()
+    # The session is shared by all webhooks, cookies set by one target must not
+    # be sent with deliveries to other targets
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_maxsize=get_delivery_max_workers())
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=128)
+def get_sqs_client(region: str, access_key_id: str, secret_access_key: str):
+    # Creating boto3 clients from the default session is not thread-safe
+    with _clients_lock:
+        return boto3.client(
+            "sqs",
+            region_name=region,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+        )
+
+
+@lru_cache(maxsize=None)
+def get_pubsub_client() -> pubsub_v1.PublisherClient:
+    return pubsub_v1.PublisherClient()
+
+
+def clear_webhook_clients():
+    """Drop the cached HTTP session and queue clients."""
+    get_http_session.cache_clear()
+    get_sqs_client.cache_clear()
+    get_pubsub_client.cache_clear()
+
+
 @app.task
 def trigger_webhooks_for_event(event_type, data):
     permissions = {}
@@ -40,14 +119,95 @@ def trigger_webhooks_for_event(event_type, data):
         events__event_type__in=[event_type, WebhookEventType.ANY],
         **permissions,
     )
-    webhooks = webhooks.select_related("app").prefetch_related(
-        "app__permissions__content_type"
+    webhooks = list(
+        webhooks.select_related("app").prefetch_related(
+            "app__permissions__content_type"
+        )
     )
 
-    for webhook in webhooks:
-        send_webhook_request.delay(
-            webhook.pk, webhook.target_url, webhook.secret_key, event_type, data
+    deliveries = deliver_webhooks(webhooks, event_type, data)
+
+    # Failed deliveries are retried one by one with a backoff
+    for delivery, webhook in zip(deliveries, webhooks):
+        if isinstance(delivery.error, RequestException):
+            send_webhook_request.apply_async(
+                (webhook.pk, webhook.target_url, webhook.secret_key, event_type, data),
+                countdown=WEBHOOK_RETRY_COUNTDOWN,
+            )
+
+
+def deliver_webhooks(
+    webhooks: List[Webhook], event_type: str, data: str
+) -> List[WebhookDelivery]:
+    """Send the event payload to all given webhooks concurrently.
+
+    Return the deliveries in the order of webhooks. Errors are logged and
+    returned instead of being raised, so one failing target doesn't stop others.
+    """
+    if not webhooks:
+        return []
+    domain = Site.objects.get_current().domain
+    message = data.encode("utf-8")
+    executor = get_delivery_executor()
+    futures = [
+        executor.submit(
+            deliver_webhook,
+            webhook.pk,
+            webhook.target_url,
+            signature_for_payload(message, webhook.secret_key),
+            event_type,
+            message,
+            domain,
         )
+        for webhook in webhooks
+    ]
+    return [future.result() for future in futures]
+
+
+def deliver_webhook(
+    webhook_id, target_url, signature, event_type, message, domain
+) -> WebhookDelivery:
+    start = time.monotonic()
+    error = None
+    try:
+        send_webhook(target_url, message, domain, signature, event_type)
+    except Exception as e:
+        error = e
+    duration = time.monotonic() - start
+    if error:
+        logger.warning(
+            "[Webhook ID:%r] Failed request to %r for event %r after %.3fs: %s",
+            webhook_id,
+            target_url,
+            event_type,
+            duration,
+            error,
+        )
+    else:
+        logger.debug(
+            "[Webhook ID:%r] Payload sent to %r for event %r in %.3fs",
+            webhook_id,
+            target_url,
+            event_type,
+            duration,
+        )
+    return WebhookDelivery(
+        webhook_id=webhook_id, target_url=target_url, duration=duration, error=error
+    )
+
+
+def send_webhook(target_url, message, domain, signature, event_type):
+    parts = urlparse(target_url)
+    if parts.scheme.lower() in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
+        send_webhook_using_http(target_url, message, domain, signature, event_type)
+    elif parts.scheme.lower() == WebhookSchemes.AWS_SQS:
+        send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type)
+    elif parts.scheme.lower() == WebhookSchemes.GOOGLE_CLOUD_PUBSUB:
+        send_webhook_using_google_cloud_pubsub(
+            target_url, message, domain, signature, event_type
+        )
+    else:
+        raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
 
 
 def send_webhook_using_http(target_url, message, domain, signature, event_type):
@@ -62,7 +222,7 @@ def send_webhook_using_http(target_url, message, domain, signature, event_type):
         # This header is depreceated and will be removed in Saleor3.0
         headers["X-Saleor-HMAC-SHA256"] = f"sha1={signature}"
 
-    response = requests.post(
+    response = get_http_session().post(
         target_url, data=message, headers=headers, timeout=WEBHOOK_TIMEOUT
     )
     response.raise_for_status()
@@ -74,12 +234,7 @@ def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_typ
     hostname_parts = parts.hostname.split(".")
     if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
         region = hostname_parts[1]
-    client = boto3.client(
-        "sqs",
-        region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=parts.password,
-    )
+    client = get_sqs_client(region, parts.username, parts.password)
     queue_url = urlunparse(
         ("https", parts.hostname, parts.path, parts.params, parts.query, parts.fragment)
     )
@@ -101,7 +256,7 @@ def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type
 ):
     parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    client = get_pubsub_client()
     topic_name = parts.path[1:]  # drop the leading slash
     client.publish(
         topic_name,
@@ -118,20 +273,10 @@ def send_webhook_using_google_cloud_pubsub(
     retry_kwargs={"max_retries": 15},
 )
 def send_webhook_request(webhook_id, target_url, secret, event_type, data):
-    parts = urlparse(target_url)
     domain = Site.objects.get_current().domain
     message = data.encode("utf-8")
     signature = signature_for_payload(message, secret)
-    if parts.scheme.lower() in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
-        send_webhook_using_http(target_url, message, domain, signature, event_type)
-    elif parts.scheme.lower() == WebhookSchemes.AWS_SQS:
-        send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type)
-    elif parts.scheme.lower() == WebhookSchemes.GOOGLE_CLOUD_PUBSUB:
-        send_webhook_using_google_cloud_pubsub(
-            target_url, message, domain, signature, event_type
-        )
-    else:
-        raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
+    send_webhook(target_url, message, domain, signature, event_type)
     logger.debug(
         "[Webhook ID:%r] Payload sent to %r for event %r",
         webhook_id,
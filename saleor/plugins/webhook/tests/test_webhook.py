@@ -1,6 +1,7 @@
 from unittest import mock
 
 import pytest
+from requests.exceptions import RequestException
 
 from ....app.models import App
 from ....webhook.event_types import WebhookEventType
@@ -12,7 +13,12 @@ from ....webhook.payloads import (
     generate_product_payload,
 )
 from ...manager import get_plugins_manager
-from ...webhook.tasks import trigger_webhooks_for_event
+from ...webhook.tasks import (
+    WEBHOOK_RETRY_COUNTDOWN,
+    deliver_webhooks,
+    get_delivery_max_workers,
+    trigger_webhooks_for_event,
+)
 
 first_url = "http://www.example.com/first/"
 third_url = "http://www.example.com/third/"
@@ -30,7 +36,7 @@ third_url = "http://www.example.com/third/"
         (WebhookEventType.CUSTOMER_CREATED, 0, set()),
     ],
 )
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request.delay")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook")
 def test_trigger_webhooks_for_event_calls_expected_events(
     mock_request,
     event_name,
@@ -70,10 +76,55 @@ def test_trigger_webhooks_for_event_calls_expected_events(
     trigger_webhooks_for_event(event_name, data="")
     assert mock_request.call_count == total_webhook_calls
 
-    target_url_calls = {call[0][1] for call in mock_request.call_args_list}
+    target_url_calls = {call[0][0] for call in mock_request.call_args_list}
     assert target_url_calls == expected_target_urls
 
 
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook")
+def test_trigger_webhooks_for_event_retries_failed_deliveries(
+    mocked_send_webhook, mocked_retry, app, permission_manage_orders
+):
+    app.permissions.add(permission_manage_orders)
+    first_webhook = app.webhooks.create(target_url=first_url)
+    first_webhook.events.create(event_type=WebhookEventType.ORDER_CREATED)
+    third_webhook = app.webhooks.create(target_url=third_url)
+    third_webhook.events.create(event_type=WebhookEventType.ORDER_CREATED)
+
+    def send_webhook(target_url, *args):
+        if target_url == third_url:
+            raise RequestException()
+
+    mocked_send_webhook.side_effect = send_webhook
+
+    trigger_webhooks_for_event(WebhookEventType.ORDER_CREATED, data="")
+
+    assert mocked_send_webhook.call_count == 2
+    mocked_retry.assert_called_once_with(
+        (third_webhook.pk, third_url, None, WebhookEventType.ORDER_CREATED, ""),
+        countdown=WEBHOOK_RETRY_COUNTDOWN,
+    )
+
+
+def test_delivery_max_workers_at_least_one(settings):
+    settings.WEBHOOK_DELIVERY_MAX_WORKERS = 0
+
+    assert get_delivery_max_workers() == 1
+
+
+def test_deliver_webhooks_records_latency(app, monkeypatch):
+    monkeypatch.setattr("saleor.plugins.webhook.tasks.send_webhook", mock.Mock())
+    webhook = app.webhooks.create(target_url=first_url)
+
+    deliveries = deliver_webhooks([webhook], WebhookEventType.ORDER_CREATED, "{}")
+
+    assert len(deliveries) == 1
+    assert deliveries[0].webhook_id == webhook.pk
+    assert deliveries[0].target_url == first_url
+    assert deliveries[0].duration >= 0
+    assert deliveries[0].error is None
+
+
 @mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
 def test_order_created(mocked_webhook_trigger, settings, order_with_lines):
     settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
@@ -1,3 +1,4 @@
+from http.client import HTTPMessage
 from unittest.mock import MagicMock, patch
 
 import boto3
@@ -6,10 +7,22 @@ import requests
 from django.core.serializers import serialize
 from google.cloud.pubsub_v1 import PublisherClient
 from kombu.asynchronous.aws.sqs.connection import AsyncSQSConnection
+from requests.cookies import extract_cookies_to_jar
 
 from ....webhook.event_types import WebhookEventType
 from ...webhook import signature_for_payload
-from ...webhook.tasks import trigger_webhooks_for_event
+from ...webhook.tasks import (
+    clear_webhook_clients,
+    get_http_session,
+    trigger_webhooks_for_event,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_clients():
+    clear_webhook_clients()
+    yield
+    clear_webhook_clients()
 
 
 def test_trigger_webhooks_with_aws_sqs(
@@ -171,22 +184,22 @@ def test_trigger_webhooks_with_google_pub_sub_and_secret_key(
 
 
 @pytest.mark.vcr
-@patch("saleor.plugins.webhook.tasks.requests.post", wraps=requests.post)
 def test_trigger_webhooks_with_http(
-    mock_request,
     webhook,
     order_with_lines,
     permission_manage_orders,
     permission_manage_users,
     permission_manage_products,
 ):
+    session = get_http_session()
     webhook.app.permissions.add(permission_manage_orders)
     webhook.target_url = "https://webhook.site/48978b64-4efb-43d5-a334-451a1d164009"
     webhook.save()
 
     expected_data = serialize("json", [order_with_lines])
 
-    trigger_webhooks_for_event(WebhookEventType.ORDER_CREATED, expected_data)
+    with patch.object(session, "post", wraps=session.post) as mock_request:
+        trigger_webhooks_for_event(WebhookEventType.ORDER_CREATED, expected_data)
 
     expected_headers = {
         "Content-Type": "application/json",
@@ -204,17 +217,18 @@ def test_trigger_webhooks_with_http(
 
 
 @pytest.mark.vcr
-@patch("saleor.plugins.webhook.tasks.requests.post", wraps=requests.post)
 def test_trigger_webhooks_with_http_and_secret_key(
-    mock_request, webhook, order_with_lines, permission_manage_orders
+    webhook, order_with_lines, permission_manage_orders
 ):
+    session = get_http_session()
     webhook.app.permissions.add(permission_manage_orders)
     webhook.target_url = "https://webhook.site/48978b64-4efb-43d5-a334-451a1d164009"
     webhook.secret_key = "secret_key"
     webhook.save()
 
     expected_data = serialize("json", [order_with_lines])
-    trigger_webhooks_for_event(WebhookEventType.ORDER_CREATED, expected_data)
+    with patch.object(session, "post", wraps=session.post) as mock_request:
+        trigger_webhooks_for_event(WebhookEventType.ORDER_CREATED, expected_data)
 
     expected_signature = signature_for_payload(
         expected_data.encode("utf-8"), webhook.secret_key
@@ -233,3 +247,15 @@ def test_trigger_webhooks_with_http_and_secret_key(
         headers=expected_headers,
         timeout=10,
     )
+
+
+def test_http_session_does_not_keep_cookies():
+    session = get_http_session()
+    request = requests.Request("POST", "https://webhook.example.com/").prepare()
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "sessionid=secret"
+    response = MagicMock(_original_response=MagicMock(msg=headers))
+
+    extract_cookies_to_jar(session.cookies, request, response)
+
+    assert not session.cookies
@@ -26,14 +26,14 @@ T_PRODUCT_FILTER_QUERIES = Dict[int, Iterable[int]]
 def filter_products_by_attributes_values(qs, queries: T_PRODUCT_FILTER_QUERIES):
     # Combine filters of the same attribute with OR operator
     # and then combine full query with AND operator.
+    # Values of products and their variants are looked up in the product's
+    # attribute values index, so no joins nor distinct are needed.
     combine_and = [
-        Q(**{"attributes__values__pk__in": values_pk})
-        | Q(**{"variants__attributes__values__pk__in": values_pk})
+        Q(attribute_index__value_ids__overlap=list(values_pk))
         for _, values_pk in queries.items()
     ]
     query = functools.reduce(operator.and_, combine_and)
-    qs = qs.filter(query).distinct()
-    return qs
+    return qs.filter(query)
 
 
 class AttributeValuesFilter(MultipleChoiceFilter):
@@ -1,13 +1,8 @@
-import logging
-
 from django.core.management.base import BaseCommand
-from tqdm import tqdm
 
 from ....discount.utils import fetch_active_discounts
 from ...models import Product
-from ...utils.variant_prices import update_product_minimal_variant_price
-
-logger = logging.getLogger(__name__)
+from ...utils.variant_prices import update_products_minimal_variant_prices
 
 
 class Command(BaseCommand):
@@ -17,7 +12,7 @@ class Command(BaseCommand):
         self.stdout.write('Updating "minimal_variant_price" field of all the products.')
         # Fetching the discounts just once and reusing them
         discounts = fetch_active_discounts()
-        # Run the update on all the products with "progress bar" (tqdm)
-        qs = Product.objects.all()
-        for product in tqdm(qs.iterator(), total=qs.count()):
-            update_product_minimal_variant_price(product, discounts=discounts)
+        updated = update_products_minimal_variant_prices(
+            Product.objects.all(), discounts=discounts
+        )
+        self.stdout.write(f"Updated {updated} product(s).")
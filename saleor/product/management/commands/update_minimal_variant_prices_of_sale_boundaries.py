@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from ...utils.variant_prices import (
+    update_products_minimal_variant_prices_of_sale_boundaries,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculates the minimal variant prices of products on sales which "
+        "started or ended since the last run. Use it when Celery beat is not "
+        "running, e.g. from cron."
+    )
+
+    def handle(self, *args, **options):
+        update_products_minimal_variant_prices_of_sale_boundaries()
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+def populate_values_sort_key(apps, schema_editor):
+    AssignedProductAttribute = apps.get_model("product", "AssignedProductAttribute")
+    assignments = AssignedProductAttribute.objects.prefetch_related("values")
+    to_update = []
+    for assignment in assignments:
+        values = sorted(
+            assignment.values.all(),
+            key=lambda value: (value.sort_order is None, value.sort_order, value.pk),
+        )
+        assignment.values_sort_key = ",".join(value.name for value in values)
+        to_update.append(assignment)
+    AssignedProductAttribute.objects.bulk_update(
+        to_update, ["values_sort_key"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0125_product_attribute_value_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assignedproductattribute",
+            name="values_sort_key",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.RunPython(populate_values_sort_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="assignedproductattribute",
+            index=models.Index(
+                fields=["assignment", "values_sort_key"],
+                name="product_attr_sort_key_idx",
+            ),
+        ),
+    ]
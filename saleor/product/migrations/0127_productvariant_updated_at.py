@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0126_assignedproductattribute_values_sort_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productvariant",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,58 @@
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+MOVE_ATTRIBUTE_VALUE_IDS = """
+INSERT INTO product_productattributeindex (product_id, value_ids)
+SELECT id, attribute_value_ids FROM product_product;
+"""
+
+RESTORE_ATTRIBUTE_VALUE_IDS = """
+UPDATE product_product p SET attribute_value_ids = i.value_ids
+FROM product_productattributeindex i
+WHERE i.product_id = p.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0127_productvariant_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductAttributeIndex",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="attribute_index",
+                        serialize=False,
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "value_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(),
+                        blank=True,
+                        default=list,
+                        size=None,
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunSQL(MOVE_ATTRIBUTE_VALUE_IDS, RESTORE_ATTRIBUTE_VALUE_IDS),
+        migrations.AddIndex(
+            model_name="productattributeindex",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["value_ids"], name="product_attr_index_gin"
+            ),
+        ),
+        migrations.RemoveIndex(model_name="product", name="product_attr_value_ids_gin"),
+        migrations.RemoveField(model_name="product", name="attribute_value_ids"),
+    ]
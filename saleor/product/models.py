@@ -3,10 +3,12 @@ from typing import TYPE_CHECKING, Iterable, Optional, Union
 from uuid import uuid4
 
 from django.conf import settings
-from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import JSONField  # type: ignore
-from django.db.models import Case, Count, F, FilteredRelation, Q, Value, When
+from django.db.models import Case, F, FilteredRelation, Q, Value, When
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 from django.utils.encoding import smart_text
 from django_measurement.models import MeasurementField
@@ -180,28 +182,18 @@ class ProductsQueryset(PublishedQuerySet):
                     relation_name="attributes",
                     condition=Q(attributes__assignment_id__in=attribute_associations),
                 ),
-                # Implicit `GROUP BY` required for the `StringAgg` aggregation
-                grouped_ids=Count("id"),
-                # String aggregation of the attribute's values to efficiently sort them
+                # Precomputed concatenation of the attribute's values
                 concatenated_values=Case(
                     # If the product has no association data but has
                     # the given attribute associated to its product type,
                     # then consider the concatenated values as empty (non-null).
                     When(
-                        Q(product_type_id__in=product_types_associated_to_attribute)
-                        & Q(filtered_attribute=None),
-                        then=models.Value(""),
-                    ),
-                    default=StringAgg(
-                        F("filtered_attribute__values__name"),
-                        delimiter=",",
-                        ordering=(
-                            [
-                                f"filtered_attribute__values__{field_name}"
-                                for field_name in AttributeValue._meta.ordering or []
-                            ]
+                        Q(product_type_id__in=product_types_associated_to_attribute),
+                        then=Coalesce(
+                            F("filtered_attribute__values_sort_key"), Value("")
                         ),
                     ),
+                    default=Value(None),
                     output_field=models.CharField(),
                 ),
                 concatenated_values_order=Case(
@@ -294,6 +286,26 @@ class Product(SeoModel, ModelWithMetadata, PublishableModel):
     def __str__(self) -> str:
         return self.name
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        super().save(force_insert, force_update, using, update_fields)
+
+        from ..search.documents import PRODUCT_SEARCH_FIELDS
+        from ..search.utils import update_products_search_index
+
+        if update_fields is None or PRODUCT_SEARCH_FIELDS.intersection(update_fields):
+            update_products_search_index([self.pk])
+
+    def delete(self, *args, **kwargs):
+        product_id = self.pk
+        result = super().delete(*args, **kwargs)
+
+        from ..search.utils import delete_products_from_search_index
+
+        delete_products_from_search_index([product_id])
+        return result
+
     @property
     def plain_text_description(self) -> str:
         return json_content_to_raw_text(self.description_json)
@@ -313,6 +325,27 @@ class Product(SeoModel, ModelWithMetadata, PublishableModel):
         )
 
 
+class ProductAttributeIndex(models.Model):
+    """IDs of attribute values assigned to a product and its variants.
+
+    Used to filter products by attributes without joining assignments. It is
+    kept up to date by `update_products_attribute_value_ids` in a separate
+    table, so saving a product loaded earlier can't revert it.
+    """
+
+    product = models.OneToOneField(
+        Product,
+        primary_key=True,
+        related_name="attribute_index",
+        on_delete=models.CASCADE,
+    )
+    value_ids = ArrayField(models.IntegerField(), blank=True, default=list)
+
+    class Meta:
+        app_label = "product"
+        indexes = [GinIndex(fields=["value_ids"], name="product_attr_index_gin")]
+
+
 class ProductTranslation(SeoModelTranslation):
     language_code = models.CharField(max_length=10)
     product = models.ForeignKey(
@@ -366,8 +399,11 @@ class ProductVariantQueryset(models.QuerySet):
             product_ids.add(obj.product_id)
         product_ids = list(product_ids)
 
+        from ..search.utils import update_products_search_index
         from .tasks import update_products_minimal_variant_prices_of_catalogues_task
 
+        update_products_search_index(product_ids)
+
         update_products_minimal_variant_prices_of_catalogues_task.delay(
             product_ids=product_ids
         )
@@ -404,6 +440,7 @@ class ProductVariant(ModelWithMetadata):
     weight = MeasurementField(
         measurement=Weight, unit_choices=WeightUnits.CHOICES, blank=True, null=True
     )
+    updated_at = models.DateTimeField(auto_now=True, null=True, db_index=True)
 
     objects = ProductVariantQueryset.as_manager()
     translated = TranslationProxy()
@@ -415,6 +452,24 @@ class ProductVariant(ModelWithMetadata):
     def __str__(self) -> str:
         return self.name or self.sku
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        super().save(force_insert, force_update, using, update_fields)
+        if update_fields is None or "sku" in update_fields:
+            from ..search.utils import update_products_search_index
+
+            update_products_search_index([self.product_id])
+
+    def delete(self, *args, **kwargs):
+        product_id = self.product_id
+        result = super().delete(*args, **kwargs)
+
+        from ..search.utils import update_products_search_index
+
+        update_products_search_index([product_id])
+        return result
+
     @property
     def is_visible(self) -> bool:
         return self.product.is_visible
@@ -562,9 +617,18 @@ class AssignedProductAttribute(BaseAssignedAttribute):
     assignment = models.ForeignKey(
         "AttributeProduct", on_delete=models.CASCADE, related_name="productassignments"
     )
+    # Names of the assigned values joined in their order, used to sort products
+    # by the attribute; kept up to date by `update_product_attributes_sort_keys`
+    values_sort_key = models.TextField(blank=True, default="")
 
     class Meta:
         unique_together = (("product", "assignment"),)
+        indexes = [
+            models.Index(
+                fields=["assignment", "values_sort_key"],
+                name="product_attr_sort_key_idx",
+            )
+        ]
 
 
 class AssignedVariantAttribute(BaseAssignedAttribute):
@@ -9,6 +9,7 @@ from .utils.variant_prices import (
     update_products_minimal_variant_prices,
     update_products_minimal_variant_prices_of_catalogues,
     update_products_minimal_variant_prices_of_discount,
+    update_products_minimal_variant_prices_of_sale_boundaries,
 )
 
 
@@ -68,3 +69,8 @@ def update_products_minimal_variant_prices_of_discount_task(discount_pk: int):
 def update_products_minimal_variant_prices_task(product_ids: List[int]):
     products = Product.objects.filter(pk__in=product_ids)
     update_products_minimal_variant_prices(products)
+
+
+@app.task
+def update_products_minimal_variant_prices_of_sale_boundaries_task():
+    update_products_minimal_variant_prices_of_sale_boundaries()
@@ -11,7 +11,10 @@ from .. import models
 from ..filters import filter_products_by_attributes_values
 from ..models import DigitalContentUrl
 from ..thumbnails import create_product_thumbnails
-from ..utils.attributes import associate_attribute_values_to_instance
+from ..utils.attributes import (
+    associate_attribute_values_to_instance,
+    update_products_attribute_value_ids,
+)
 from ..utils.costs import get_margin_for_variant
 from ..utils.digital_products import increment_download_count
 
@@ -49,6 +52,7 @@ def test_filtering_by_attribute(db, color_attribute, category, settings):
     # Associate color to a product and a variant
     associate_attribute_values_to_instance(product_a, color_attribute, color)
     associate_attribute_values_to_instance(variant_b, color_attribute, color)
+    update_products_attribute_value_ids([product_a.pk, product_b.pk])
 
     product_qs = models.Product.objects.all().values_list("pk", flat=True)
 
@@ -58,6 +62,7 @@ def test_filtering_by_attribute(db, color_attribute, category, settings):
     assert product_b.pk in list(filtered)
 
     associate_attribute_values_to_instance(product_a, color_attribute, color_2)
+    update_products_attribute_value_ids([product_a.pk])
 
     filters = {color_attribute.pk: [color.pk]}
     filtered = filter_products_by_attributes_values(product_qs, filters)
@@ -4,11 +4,20 @@ from unittest.mock import MagicMock, Mock
 import pytest
 
 from .. import AttributeInputType
-from ..models import AttributeValue, Product, ProductType, ProductVariant
+from ..models import (
+    AttributeValue,
+    Product,
+    ProductAttributeIndex,
+    ProductType,
+    ProductVariant,
+)
 from ..tasks import _update_variants_names
+from ..utils import attributes as attribute_utils
 from ..utils.attributes import (
     associate_attribute_values_to_instance,
     generate_name_for_variant,
+    get_attribute_slug_map,
+    update_products_attribute_value_ids,
 )
 
 
@@ -136,3 +145,63 @@ def test_associate_attribute_to_product_instance_without_values(product):
     # Ensure the values were cleared and no new assignment entry was created
     assert new_assignment.pk == old_assignment.pk
     assert new_assignment.values.count() == 0
+
+
+def test_associate_attribute_values_keeps_product_index(product):
+    variant = product.variants.get()
+    variant_assignment = variant.attributes.first()
+    expected_ids = product.attribute_index.value_ids
+
+    associate_attribute_values_to_instance(variant, variant_assignment.attribute)
+
+    product.refresh_from_db()
+    assert product.attribute_index.value_ids == expected_ids
+    update_products_attribute_value_ids([product.pk])
+    product.refresh_from_db()
+    assert product.attribute_index.value_ids == [
+        product.attributes.first().values.get().pk
+    ]
+
+
+def test_associate_attribute_values_updates_sort_key(product, color_attribute):
+    red, blue = color_attribute.values.all()
+
+    assignment = associate_attribute_values_to_instance(
+        product, color_attribute, blue, red
+    )
+
+    assignment.refresh_from_db()
+    assert assignment.values_sort_key == f"{red.name},{blue.name}"
+
+
+def test_update_products_attribute_value_ids(product):
+    expected_ids = product.attribute_index.value_ids
+    ProductAttributeIndex.objects.filter(product=product).update(value_ids=[])
+
+    index = update_products_attribute_value_ids([product.pk])
+
+    product.refresh_from_db()
+    assert index == {product.pk: expected_ids}
+    assert product.attribute_index.value_ids == expected_ids
+
+
+def test_update_products_attribute_value_ids_creates_index(product):
+    expected_ids = product.attribute_index.value_ids
+    ProductAttributeIndex.objects.filter(product=product).delete()
+
+    update_products_attribute_value_ids([product.pk])
+
+    product.refresh_from_db()
+    assert product.attribute_index.value_ids == expected_ids
+
+
+def test_get_attribute_slug_map(color_attribute, enable_process_cache):
+    enable_process_cache(attribute_utils._attribute_slug_map)
+    value = color_attribute.values.first()
+
+    slug_map = get_attribute_slug_map()
+
+    attribute_pk, values_map = slug_map[color_attribute.slug]
+    assert attribute_pk == color_attribute.pk
+    assert values_map[value.slug] == value.pk
+    assert get_attribute_slug_map() is slug_map
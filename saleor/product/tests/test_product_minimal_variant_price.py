@@ -1,16 +1,28 @@
+from datetime import timedelta
+from decimal import Decimal
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.management import call_command
+from django.utils import timezone
+from freezegun import freeze_time
 from graphql_relay import to_global_id
 from prices import Money
 
+from ...discount.models import Sale
 from ...graphql.tests.utils import get_graphql_content
-from ..models import ProductVariant
+from ..models import Product, ProductVariant
 from ..tasks import (
     update_products_minimal_variant_prices_of_catalogues,
     update_products_minimal_variant_prices_task,
 )
-from ..utils.variant_prices import update_product_minimal_variant_price
+from ..utils.variant_prices import (
+    SALE_BOUNDARIES_CHECKED_AT_CACHE_KEY,
+    update_product_minimal_variant_price,
+    update_products_minimal_variant_prices,
+    update_products_minimal_variant_prices_of_sale_boundaries,
+    update_products_minimal_variant_prices_of_sales_between,
+)
 
 
 def test_update_product_minimal_variant_price(product):
@@ -159,12 +171,110 @@ def test_product_variant_objects_bulk_create_updates_minimal_variant_price(produ
 @patch(
     "saleor.product.management.commands"
     ".update_all_products_minimal_variant_prices"
-    ".update_product_minimal_variant_price"
+    ".update_products_minimal_variant_prices"
 )
 def test_management_commmand_update_all_products_minimal_variant_price(
-    mock_update_product_minimal_variant_price, product_list
+    mock_update_products_minimal_variant_prices, product_list
 ):
     call_command("update_all_products_minimal_variant_prices")
-    call_args_list = mock_update_product_minimal_variant_price.call_args_list
-    for (args, kwargs), product in zip(call_args_list, product_list):
-        assert args[0] == product
+    (products,), _ = mock_update_products_minimal_variant_prices.call_args
+    assert set(products) == set(Product.objects.all())
+
+
+def test_update_products_minimal_variant_prices_applies_discounts(
+    product_list, discount_info
+):
+    Product.objects.update(minimal_variant_price_amount=None)
+
+    updated = update_products_minimal_variant_prices(
+        Product.objects.all(), discounts=[discount_info]
+    )
+
+    assert updated == Product.objects.count()
+    product = product_list[0]
+    product.refresh_from_db()
+    variant = product.variants.get()
+    assert product.minimal_variant_price == variant.get_price([discount_info])
+    assert product.minimal_variant_price < variant.price
+
+
+def test_update_products_minimal_variant_prices_saves_only_changed(product_list):
+    update_products_minimal_variant_prices(product_list, discounts=[])
+    product = product_list[0]
+    Product.objects.filter(pk=product.pk).update(
+        minimal_variant_price_amount=Decimal(99)
+    )
+
+    updated = update_products_minimal_variant_prices(product_list, discounts=[])
+
+    assert updated == 1
+    product.refresh_from_db()
+    assert product.minimal_variant_price == Money("10.00", "USD")
+
+
+def test_update_products_minimal_variant_prices_of_started_sale(product):
+    now = timezone.now()
+    sale = Sale.objects.create(
+        name="Sale", value=5, start_date=now - timedelta(seconds=30)
+    )
+    sale.products.add(product)
+
+    update_products_minimal_variant_prices_of_sales_between(
+        now - timedelta(minutes=1), now
+    )
+
+    product.refresh_from_db()
+    assert product.minimal_variant_price == Money("5.00", "USD")
+
+
+def test_update_products_minimal_variant_prices_of_ended_sale(product, category):
+    now = timezone.now()
+    sale = Sale.objects.create(
+        name="Sale",
+        value=5,
+        start_date=now - timedelta(days=1),
+        end_date=now - timedelta(seconds=30),
+    )
+    sale.categories.add(category)
+    Product.objects.filter(pk=product.pk).update(minimal_variant_price_amount=5)
+
+    update_products_minimal_variant_prices_of_sales_between(
+        now - timedelta(minutes=1), now
+    )
+
+    product.refresh_from_db()
+    assert product.minimal_variant_price == Money("10.00", "USD")
+
+
+def test_update_products_minimal_variant_prices_of_sales_outside_period(product):
+    now = timezone.now()
+    sale = Sale.objects.create(
+        name="Sale", value=5, start_date=now - timedelta(minutes=5)
+    )
+    sale.products.add(product)
+
+    update_products_minimal_variant_prices_of_sales_between(
+        now - timedelta(minutes=1), now
+    )
+
+    product.refresh_from_db()
+    assert product.minimal_variant_price == Money("10.00", "USD")
+
+
+@freeze_time("2020-03-18 12:00:00")
+@patch(
+    "saleor.product.utils.variant_prices"
+    ".update_products_minimal_variant_prices_of_sales_between"
+)
+def test_update_products_minimal_variant_prices_of_sale_boundaries(
+    mock_update_prices_of_sales_between, settings
+):
+    now = timezone.now()
+    cache.delete(SALE_BOUNDARIES_CHECKED_AT_CACHE_KEY)
+
+    update_products_minimal_variant_prices_of_sale_boundaries()
+
+    mock_update_prices_of_sales_between.assert_called_once_with(
+        now - settings.SALE_PRICES_REFRESH_INTERVAL, now
+    )
+    assert cache.get(SALE_BOUNDARIES_CHECKED_AT_CACHE_KEY) == now
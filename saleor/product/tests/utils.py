@@ -3,6 +3,9 @@ from io import BytesIO
 from django.core.files.uploadedfile import SimpleUploadedFile
 from PIL import Image
 
+from ...search.utils import update_products_search_index
+from ..utils.attributes import update_products_attribute_value_ids
+
 
 def create_image(image_name="product2"):
     img_data = BytesIO()
@@ -16,3 +19,8 @@ def create_pdf_file_with_image_ext():
     file_name = "product.jpg"
     file_data = SimpleUploadedFile(file_name, b"product_data", "application/pdf")
     return file_data, file_name
+
+
+def update_products_indexes(product_ids):
+    update_products_attribute_value_ids(product_ids)
+    update_products_search_index(product_ids)
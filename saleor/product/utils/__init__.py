@@ -5,6 +5,7 @@ from django.conf import settings
 from django.db import transaction
 
 from ...core.taxes import TaxedMoney, zero_taxed_money
+from ...search.utils import update_products_search_index
 from ..tasks import update_products_minimal_variant_prices_task
 
 if TYPE_CHECKING:
@@ -36,6 +37,7 @@ def delete_categories(categories_ids: List[str]):
     Set products of deleted categories as unpublished, delete categories
     and update products minimal variant prices.
     """
+    from ...discount.utils import invalidate_discounts_snapshot
     from ..models import Product, Category
 
     categories = Category.objects.select_for_update().filter(pk__in=categories_ids)
@@ -48,7 +50,10 @@ def delete_categories(categories_ids: List[str]):
     products.update(is_published=False, publication_date=None)
     product_ids = list(products.values_list("id", flat=True))
     categories.delete()
+    # Search documents keep names of categories as keywords
+    update_products_search_index(product_ids)
     update_products_minimal_variant_prices_task.delay(product_ids=product_ids)
+    invalidate_discounts_snapshot()
 
 
 def collect_categories_tree_products(category: "Category") -> "QuerySet[Product]":
@@ -1,16 +1,25 @@
-from typing import TYPE_CHECKING, Optional, Set, Union
+from collections import defaultdict
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple, Union
 
+from ...core.utils.cache import ProcessCache
 from ..models import (
     AssignedProductAttribute,
     AssignedVariantAttribute,
     Attribute,
     AttributeValue,
     Product,
+    ProductAttributeIndex,
     ProductVariant,
 )
 
 AttributeAssignmentType = Union[AssignedProductAttribute, AssignedVariantAttribute]
 
+# Attribute slugs mapped to the attribute ID and its value IDs by value slugs
+AttributeSlugMap = Dict[str, Tuple[int, Dict[str, int]]]
+
+ATTRIBUTE_SLUG_MAP_VERSION_CACHE_KEY = "attribute_slug_map_version"
+
 
 if TYPE_CHECKING:
     # flake8: noqa
@@ -77,6 +86,10 @@ def associate_attribute_values_to_instance(
     Note: be award this function invokes the ``set`` method on the instance's
     attribute association. Meaning any values already assigned or concurrently
     assigned will be overridden by this call.
+
+    The product's attribute values index and search document are not refreshed,
+    call ``update_products_attribute_value_ids`` and
+    ``update_products_search_index`` once all values are assigned.
     """
     values_ids = {value.pk for value in values}
 
@@ -86,4 +99,125 @@ def associate_attribute_values_to_instance(
     # Associate the attribute and the passed values
     assignment = _associate_attribute_to_instance(instance, attribute.pk)
     assignment.values.set(values)
+    if isinstance(assignment, AssignedProductAttribute):
+        assignment.values_sort_key = get_values_sort_key(assignment.values.all())
+        assignment.save(update_fields=["values_sort_key"])
+
     return assignment
+
+
+def get_values_sort_key(values: Iterable[AttributeValue]) -> str:
+    """Return the key used to sort products by the given ordered values."""
+    return ",".join(value.name for value in values)
+
+
+def update_product_attributes_sort_keys(assignments):
+    """Recalculate sort keys of the given product attribute assignments."""
+    assignments = list(assignments.prefetch_related("values"))
+    for assignment in assignments:
+        assignment.values_sort_key = get_values_sort_key(assignment.values.all())
+    AssignedProductAttribute.objects.bulk_update(
+        assignments, ["values_sort_key"], batch_size=1000
+    )
+
+
+def update_attributes_sort_keys(attribute_ids: Iterable[int]):
+    """Recalculate sort keys of products assigned to the given attributes."""
+    update_product_attributes_sort_keys(
+        AssignedProductAttribute.objects.filter(
+            assignment__attribute_id__in=attribute_ids
+        )
+    )
+
+
+def update_products_attribute_value_ids(product_ids: Iterable[int]):
+    """Rebuild the attribute values index of the given products.
+
+    The index holds IDs of values assigned to a product and to its variants
+    and is used to filter products by attributes without joining assignments.
+    Return the updated IDs by product ID.
+    """
+    product_ids = set(product_ids)
+    product_values = AssignedProductAttribute.values.through.objects.filter(
+        assignedproductattribute__product_id__in=product_ids
+    ).values_list("assignedproductattribute__product_id", "attributevalue_id")
+    variant_values = AssignedVariantAttribute.values.through.objects.filter(
+        assignedvariantattribute__variant__product_id__in=product_ids
+    ).values_list("assignedvariantattribute__variant__product_id", "attributevalue_id")
+
+    value_ids: Dict[int, Set[int]] = defaultdict(set)
+    for product_id, value_id in chain(product_values, variant_values):
+        value_ids[product_id].add(value_id)
+
+    index = {
+        product_id: sorted(value_ids[product_id])
+        for product_id in Product.objects.filter(pk__in=product_ids).values_list(
+            "pk", flat=True
+        )
+    }
+    indexed_ids = set(
+        ProductAttributeIndex.objects.filter(product_id__in=index).values_list(
+            "product_id", flat=True
+        )
+    )
+    rows = [
+        ProductAttributeIndex(product_id=product_id, value_ids=product_value_ids)
+        for product_id, product_value_ids in index.items()
+    ]
+    ProductAttributeIndex.objects.bulk_update(
+        [row for row in rows if row.product_id in indexed_ids], ["value_ids"]
+    )
+    ProductAttributeIndex.objects.bulk_create(
+        [row for row in rows if row.product_id not in indexed_ids],
+        ignore_conflicts=True,
+    )
+    return index
+
+
+def get_product_ids_with_values(value_ids: Iterable[int]) -> List[int]:
+    """Return IDs of products using the given values, also in their variants."""
+    return list(
+        ProductAttributeIndex.objects.filter(
+            value_ids__overlap=list(value_ids)
+        ).values_list("product_id", flat=True)
+    )
+
+
+def update_attribute_value_ids_of_products_with_values(value_ids: Iterable[int]):
+    """Rebuild the attribute values index of products using the given values.
+
+    Return the updated IDs by product ID.
+    """
+    return update_products_attribute_value_ids(get_product_ids_with_values(value_ids))
+
+
+def _load_attribute_slug_map() -> AttributeSlugMap:
+    slug_map: AttributeSlugMap = {
+        slug: (pk, {}) for pk, slug in Attribute.objects.values_list("pk", "slug")
+    }
+    values = AttributeValue.objects.values_list("attribute__slug", "slug", "pk")
+    for attribute_slug, value_slug, value_pk in values:
+        slug_map[attribute_slug][1][value_slug] = value_pk
+    return slug_map
+
+
+_attribute_slug_map = ProcessCache(
+    ATTRIBUTE_SLUG_MAP_VERSION_CACHE_KEY,
+    "ATTRIBUTE_SLUG_MAP_CACHE_TIMEOUT",
+    _load_attribute_slug_map,
+)
+
+
+def get_attribute_slug_map() -> AttributeSlugMap:
+    """Return IDs of attributes and their values by slugs.
+
+    The map is reused by the process until it is invalidated with
+    `invalidate_attribute_slug_map` or for `ATTRIBUTE_SLUG_MAP_CACHE_TIMEOUT`
+    seconds. It is shared between callers and must not be modified.
+    """
+    return _attribute_slug_map.get()
+
+
+def invalidate_attribute_slug_map():
+    """Drop cached attribute slugs once the transaction is committed."""
+    _attribute_slug_map.invalidate()
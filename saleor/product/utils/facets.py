@@ -0,0 +1,56 @@
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connection
+from django.db.models import Count, F, Func, IntegerField, Q
+
+from ..models import Product, ProductAttributeIndex
+
+PriceRange = Tuple[Optional[Decimal], Optional[Decimal]]
+
+
+def count_products_by_attribute_values(products) -> Dict[int, int]:
+    """Return the number of given products having each attribute value.
+
+    Counts are calculated in a single query over the attribute values index,
+    values assigned to product variants are included.
+    """
+    value_ids = (
+        ProductAttributeIndex.objects.filter(
+            product_id__in=products.order_by().values("pk")
+        )
+        .annotate(
+            value_id=Func(
+                F("value_ids"), function="unnest", output_field=IntegerField(),
+            )
+        )
+        .values("value_id")
+        .order_by()
+    )
+    sql, params = value_ids.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT value_id, COUNT(*) FROM ({sql}) AS product_values "
+            "GROUP BY value_id",
+            params,
+        )
+        return dict(cursor.fetchall())
+
+
+def count_products_in_price_ranges(
+    products, price_ranges: List[PriceRange]
+) -> List[int]:
+    """Return the number of given products in each minimal variant price range."""
+    if not price_ranges:
+        return []
+    counts = {}
+    for index, (gte, lte) in enumerate(price_ranges):
+        lookup = Q()
+        if gte is not None:
+            lookup &= Q(minimal_variant_price_amount__gte=gte)
+        if lte is not None:
+            lookup &= Q(minimal_variant_price_amount__lte=lte)
+        counts[f"range_{index}"] = Count("pk", filter=lookup) if lookup else Count("pk")
+    products = Product.objects.filter(pk__in=products.order_by().values("pk"))
+    result = products.aggregate(**counts)
+    return [result[f"range_{index}"] for index in range(len(price_ranges))]
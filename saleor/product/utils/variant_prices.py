@@ -1,12 +1,25 @@
+import datetime
 import operator
+from collections import defaultdict
 from functools import reduce
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Set
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Min, QuerySet
 from django.db.models.query_utils import Q
+from django.utils import timezone
 from prices import Money
 
-from ...discount.utils import fetch_active_discounts
-from ..models import Product
+from ...discount import DiscountInfo
+from ...discount.models import NotApplicable, Sale
+from ...discount.utils import fetch_active_discounts, get_product_discount_on_sale
+from ..models import Category, CollectionProduct, Product, ProductVariant
+
+# Number of products which prices are calculated with a single set of queries
+BATCH_SIZE = 1000
+
+SALE_BOUNDARIES_CHECKED_AT_CACHE_KEY = "sale_boundaries_checked_at"
 
 
 def _get_product_minimal_variant_price(product, discounts) -> Optional[Money]:
@@ -32,22 +45,79 @@ def update_product_minimal_variant_price(product, discounts=None, save=True):
     return product
 
 
-def update_products_minimal_variant_prices(products, discounts=None):
+def _get_discounted_price(
+    product: Product,
+    price: Money,
+    collection_ids: Set[int],
+    discounts: Iterable[DiscountInfo],
+) -> Money:
+    discounted_prices = []
+    for discount in discounts:
+        try:
+            discount_value = get_product_discount_on_sale(
+                product, collection_ids, discount
+            )
+        except NotApplicable:
+            continue
+        discounted_prices.append(discount_value(price))
+    return min(discounted_prices, default=price)
+
+
+def _update_minimal_variant_prices_batch(
+    product_ids: List[int], discounts: List[DiscountInfo]
+) -> int:
+    # Discounts of a product apply to all its variants and never change the order
+    # of prices, so the minimal discounted price is the discounted minimal price
+    prices = dict(
+        ProductVariant.objects.filter(product_id__in=product_ids)
+        .values("product_id")
+        .annotate(min_price_amount=Min("price_amount"))
+        .values_list("product_id", "min_price_amount")
+        .order_by()
+    )
+    collection_ids: Dict[int, Set[int]] = defaultdict(set)
+    if discounts:
+        product_collections = CollectionProduct.objects.filter(
+            product_id__in=product_ids
+        ).values_list("product_id", "collection_id")
+        for product_id, collection_id in product_collections:
+            collection_ids[product_id].add(collection_id)
+
+    products = Product.objects.filter(pk__in=list(prices)).only(
+        "pk", "category_id", "currency", "minimal_variant_price_amount"
+    )
+    changed_products = []
+    for product in products:
+        price = Money(prices[product.pk], product.currency)
+        minimal_variant_price = _get_discounted_price(
+            product, price, collection_ids[product.pk], discounts
+        )
+        if product.minimal_variant_price_amount != minimal_variant_price.amount:
+            product.minimal_variant_price_amount = minimal_variant_price.amount
+            changed_products.append(product)
+    Product.objects.bulk_update(changed_products, ["minimal_variant_price_amount"])
+    return len(changed_products)
+
+
+def update_products_minimal_variant_prices(products, discounts=None) -> int:
+    """Recalculate minimal variant prices of products in batches.
+
+    Only products which price has changed are saved, products without
+    variants are skipped. Return the number of updated products.
+    """
     if discounts is None:
         discounts = fetch_active_discounts()
-    changed_products_to_update = []
-    for product in products:
-        old_minimal_variant_price = product.minimal_variant_price
-        updated_product = update_product_minimal_variant_price(
-            product, discounts, save=False
+    if isinstance(products, QuerySet):
+        product_ids = list(products.order_by().values_list("pk", flat=True))
+    else:
+        product_ids = [product.pk for product in products]
+    updated = 0
+    for start in range(0, len(product_ids), BATCH_SIZE):
+        end = start + BATCH_SIZE
+        updated += _update_minimal_variant_prices_batch(
+            product_ids[start:end], discounts
         )
-        # Check if the "minimal_variant_price" has changed
-        if updated_product.minimal_variant_price != old_minimal_variant_price:
-            changed_products_to_update.append(updated_product)
-    # Bulk update the changed products
-    Product.objects.bulk_update(
-        changed_products_to_update, ["minimal_variant_price_amount"]
-    )
+    return updated
 
 
 def update_products_minimal_variant_prices_of_catalogues(
@@ -76,3 +146,52 @@ def update_products_minimal_variant_prices_of_discount(discount):
         category_ids=discount.categories.all().values_list("id", flat=True),
         collection_ids=discount.collections.all().values_list("id", flat=True),
     )
+
+
+def update_products_minimal_variant_prices_of_sales_between(
+    since: datetime.datetime, until: datetime.datetime
+):
+    """Recalculate prices of products on sales which started or ended in the period.
+
+    The period excludes `since` and includes `until`. Sales are active until
+    their end date, so they end in the period when it is between `since`
+    and `until`, excluding `until`.
+    """
+    sale_pks = Sale.objects.filter(
+        Q(start_date__gt=since, start_date__lte=until)
+        | Q(end_date__gte=since, end_date__lt=until)
+    ).values("pk")
+    product_ids = Sale.products.through.objects.filter(
+        sale_id__in=sale_pks
+    ).values_list("product_id", flat=True)
+    category_ids = (
+        Category.tree.filter(
+            pk__in=Sale.categories.through.objects.filter(sale_id__in=sale_pks).values(
+                "category_id"
+            )
+        )
+        .get_descendants(include_self=True)
+        .values_list("pk", flat=True)
+    )
+    collection_ids = Sale.collections.through.objects.filter(
+        sale_id__in=sale_pks
+    ).values_list("collection_id", flat=True)
+    update_products_minimal_variant_prices_of_catalogues(
+        product_ids=list(product_ids),
+        category_ids=list(category_ids),
+        collection_ids=list(collection_ids),
+    )
+
+
+def update_products_minimal_variant_prices_of_sale_boundaries():
+    """Recalculate prices of products on sales which started or ended since last run.
+
+    The first run, and runs after the cache was cleared, look back for
+    `SALE_PRICES_REFRESH_INTERVAL`.
+    """
+    until = timezone.now()
+    since = cache.get(SALE_BOUNDARIES_CHECKED_AT_CACHE_KEY)
+    if since is None:
+        since = until - settings.SALE_PRICES_REFRESH_INTERVAL
+    update_products_minimal_variant_prices_of_sales_between(since, until)
+    cache.set(SALE_BOUNDARIES_CHECKED_AT_CACHE_KEY, until, timeout=None)
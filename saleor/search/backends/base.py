@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    # flake8: noqa
+    from django.db.models import QuerySet
+
+
+class BaseSearchBackend:
+    """Abstract class for product search backends.
+
+    A backend keeps its own index of products. The index is refreshed with
+    `update` and `delete` whenever the searched data of products changes.
+    """
+
+    def update(self, product_ids: Iterable[int]):
+        """Index the current data of the given products."""
+        raise NotImplementedError()
+
+    def delete(self, product_ids: Iterable[int]):
+        """Remove the given products from the index."""
+        raise NotImplementedError()
+
+    def search(
+        self, phrase: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[int]:
+        """Return IDs of products matching the phrase, best matches first."""
+        raise NotImplementedError()
+
+    def filter_products(self, qs: "QuerySet", phrase: str) -> "QuerySet":
+        """Limit the products queryset to products matching the phrase."""
+        return qs.filter(pk__in=self.search(phrase))
@@ -0,0 +1,208 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from functools import partial
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ...product.models import Product
+from ..documents import (
+    get_products_for_search_documents,
+    prepare_product_search_document,
+)
+from .base import BaseSearchBackend
+
+# Number of the last change of the index published by any process, IDs of
+# products changed by each change are stored under its number
+INDEX_SEQUENCE_CACHE_KEY = "search_memory_index_sequence"
+INDEX_CHANGE_CACHE_KEY = "search_memory_index_change_{}"
+# Processes which missed expired changes rebuild their copies of the index
+INDEX_CHANGE_TIMEOUT = 60 * 60 * 24
+# Processes behind by more changes rebuild their copies instead of applying them
+MAX_APPLIED_CHANGES = 100
+
+# Weights of document fields in the ranking, same order as in the weights
+# of the PostgreSQL search vector
+FIELD_WEIGHTS = {
+    "name": 1.0,
+    "skus": 1.0,
+    "keywords": 0.4,
+    "translations": 0.2,
+    "description": 0.1,
+}
+# Weight of a word that only starts with the searched one
+PREFIX_MATCH_FACTOR = 0.5
+
+TOKEN_RE = re.compile(r"\w+")
+
+BATCH_SIZE = 1000
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def get_index_sequence() -> int:
+    """Return the number of the last change of the index published by any process."""
+    sequence = cache.get(INDEX_SEQUENCE_CACHE_KEY)
+    if sequence is None:
+        cache.add(INDEX_SEQUENCE_CACHE_KEY, 0, timeout=None)
+        sequence = cache.get(INDEX_SEQUENCE_CACHE_KEY)
+    return sequence
+
+
+class InMemorySearchBackend(BaseSearchBackend):
+    """Search products in an inverted index held in process memory.
+
+    Needs no external service, which suits tests and small shops. Every
+    process builds the index from the database on its first search and then
+    reindexes products changed by other processes. Words are matched exactly
+    or by prefix, typing errors are not tolerated.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Weight of each word in products by word
+        self._index: Dict[str, Dict[int, float]] = {}
+        self._product_words: Dict[int, Set[str]] = {}
+        # Sorted words of the index, sorted again after words were added or
+        # removed
+        self._sorted_words: Optional[List[str]] = None
+        self._sequence: Optional[int] = None
+
+    def update(self, product_ids: Iterable[int]):
+        # Changes are applied once committed, rolled back ones never get
+        # into the index
+        transaction.on_commit(partial(self._update, set(product_ids)))
+
+    def delete(self, product_ids: Iterable[int]):
+        transaction.on_commit(partial(self._update, set(product_ids)))
+
+    def search(
+        self, phrase: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[int]:
+        words = tokenize(phrase)
+        if not words:
+            return []
+        with self._lock:
+            self._ensure_loaded()
+            # Products have to match all words of the phrase
+            scores = self._score_word(words[0])
+            for word in words[1:]:
+                word_scores = self._score_word(word)
+                scores = {
+                    product_id: score + word_scores[product_id]
+                    for product_id, score in scores.items()
+                    if product_id in word_scores
+                }
+        ranked = sorted(
+            scores, key=lambda product_id: (-scores[product_id], product_id)
+        )
+        end = offset + limit if limit is not None else None
+        return ranked[offset:end]
+
+    def _score_word(self, word: str) -> Dict[int, float]:
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._index)
+        words = self._sorted_words
+        scores: Dict[int, float] = defaultdict(float)
+        # Words starting with the searched one follow it in the sorted words
+        position = bisect_left(words, word)
+        while position < len(words) and words[position].startswith(word):
+            indexed_word = words[position]
+            position += 1
+            factor = 1.0 if indexed_word == word else PREFIX_MATCH_FACTOR
+            for product_id, weight in self._index[indexed_word].items():
+                scores[product_id] = max(scores[product_id], weight * factor)
+        return scores
+
+    def _update(self, product_ids: Set[int]):
+        with self._lock:
+            # A rebuilt index already holds the committed changes
+            if not self._ensure_loaded():
+                self._reindex_products(product_ids)
+            self._publish(product_ids)
+
+    def _ensure_loaded(self) -> bool:
+        """Bring the index up to date, return True if it was rebuilt."""
+        sequence = get_index_sequence()
+        if self._sequence == sequence or self._apply_changes(sequence):
+            return False
+        self._index = {}
+        self._product_words = {}
+        self._sorted_words = None
+        product_pks = list(Product.objects.values_list("pk", flat=True))
+        for start in range(0, len(product_pks), BATCH_SIZE):
+            end = start + BATCH_SIZE
+            self._index_products(product_pks[start:end])
+        self._sequence = sequence
+        return True
+
+    def _apply_changes(self, sequence: int) -> bool:
+        """Reindex products changed by other processes up to the given change.
+
+        Return False if the changes are no longer available and the index has
+        to be rebuilt.
+        """
+        if self._sequence is None:
+            return False
+        if not 0 <= sequence - self._sequence <= MAX_APPLIED_CHANGES:
+            return False
+        keys = [
+            INDEX_CHANGE_CACHE_KEY.format(number)
+            for number in range(self._sequence + 1, sequence + 1)
+        ]
+        changes = cache.get_many(keys)
+        if len(changes) != len(keys):
+            return False
+        self._reindex_products(set(chain.from_iterable(changes.values())))
+        self._sequence = sequence
+        return True
+
+    def _reindex_products(self, product_ids: Set[int]):
+        # Deleted products are only removed, they are no longer in the database
+        for product_id in product_ids:
+            self._remove_product(product_id)
+        self._index_products(product_ids)
+
+    def _index_products(self, product_ids: Iterable[int]):
+        for product in get_products_for_search_documents(product_ids):
+            document = prepare_product_search_document(product)
+            weights: Dict[str, float] = defaultdict(float)
+            for field, field_weight in FIELD_WEIGHTS.items():
+                for word in tokenize(getattr(document, field)):
+                    weights[word] += field_weight
+            for word, weight in weights.items():
+                if word not in self._index:
+                    self._index[word] = {}
+                    self._sorted_words = None
+                self._index[word][product.pk] = weight
+            self._product_words[product.pk] = set(weights)
+
+    def _remove_product(self, product_id: int):
+        for word in self._product_words.pop(product_id, ()):
+            postings = self._index[word]
+            del postings[product_id]
+            if not postings:
+                del self._index[word]
+                self._sorted_words = None
+
+    def _publish(self, product_ids: Set[int]):
+        """Let other processes reindex the given products in their copies."""
+        cache.add(INDEX_SEQUENCE_CACHE_KEY, 0, timeout=None)
+        sequence = cache.incr(INDEX_SEQUENCE_CACHE_KEY)
+        cache.set(
+            INDEX_CHANGE_CACHE_KEY.format(sequence),
+            list(product_ids),
+            timeout=INDEX_CHANGE_TIMEOUT,
+        )
+        # Apply changes published by other processes in the meantime, the
+        # index is rebuilt on the next search if they are not available
+        if self._sequence != sequence - 1 and not self._apply_changes(sequence - 1):
+            self._sequence = None
+            return
+        self._sequence = sequence
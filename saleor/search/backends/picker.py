@@ -1,10 +1,20 @@
+from typing import Dict
+
 from django.conf import settings
-from django.utils.module_loading import import_module  # type: ignore
+from django.utils.module_loading import import_string
+
+from .base import BaseSearchBackend
+
+_backends: Dict[str, BaseSearchBackend] = {}
 
 
-def pick_backend():
-    """Return the currently configured storefront search function.
+def pick_backend() -> BaseSearchBackend:
+    """Return the currently configured search backend.
 
-    Returns a callable that accepts the search phrase.
+    Backends are created once per process, so in-process indexes are kept
+    between requests.
     """
-    return import_module(settings.SEARCH_BACKEND).search_storefront
+    backend_path = settings.SEARCH_BACKEND
+    if backend_path not in _backends:
+        _backends[backend_path] = import_string(backend_path)()
+    return _backends[backend_path]
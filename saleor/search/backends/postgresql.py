@@ -1,5 +1,43 @@
+from typing import Iterable, List, Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F
+
+from ..documents import update_product_search_documents
+from ..models import ProductSearchDocument
 from . import postgresql_storefront
+from .base import BaseSearchBackend
 
 
 def search_storefront(phrase):
     return postgresql_storefront.search(phrase)
+
+
+class PostgreSQLSearchBackend(BaseSearchBackend):
+    """Search products in search documents stored in the database."""
+
+    def update(self, product_ids: Iterable[int]):
+        update_product_search_documents(product_ids)
+
+    def delete(self, product_ids: Iterable[int]):
+        ProductSearchDocument.objects.filter(product_id__in=product_ids).delete()
+
+    def search(
+        self, phrase: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[int]:
+        documents = (
+            postgresql_storefront.search_documents(phrase)
+            .annotate(
+                rank=SearchRank(F("search_vector"), SearchQuery(phrase))
+                + TrigramSimilarity("name", phrase)
+            )
+            .order_by("-rank", "product_id")
+            .values_list("product_id", flat=True)
+        )
+        end = offset + limit if limit is not None else None
+        return list(documents[offset:end])
+
+    def filter_products(self, qs, phrase):
+        # Keep the search a subquery instead of fetching the matching IDs
+        documents = postgresql_storefront.search_documents(phrase)
+        return qs.filter(pk__in=documents.values("product_id"))
@@ -1,24 +1,56 @@
-from django.contrib.postgres.search import TrigramSimilarity
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection, transaction
 from django.db.models import Q
 
 from ...product.models import Product
+from ..models import ProductSearchDocument
+
+# Minimal trigram similarity of a product name to the searched phrase
+NAME_SIMILARITY_THRESHOLD = 0.2
 
 
 def search(phrase):
     """Return matching products for storefront views.
 
     Fuzzy storefront search that is resistant to small typing errors made
-    by user. Name is matched using trigram similarity, description uses
-    standard postgres full text search.
+    by user. Phrase is matched against the stored search documents of
+    products, name using trigram similarity and the remaining text
+    (SKUs, attribute values, category, translations and description)
+    using standard postgres full text search. Both conditions use the
+    GIN indexes of the documents.
 
     Args:
         phrase (str): searched phrase
 
     """
-    name_sim = TrigramSimilarity("name", phrase)
-    ft_in_description = Q(description__search=phrase)
-    ft_by_sku = Q(variants__sku__search=phrase)
-    name_similar = Q(name_sim__gt=0.2)
-    return Product.objects.annotate(name_sim=name_sim).filter(
-        (ft_in_description | name_similar | ft_by_sku)
+    documents = search_documents(phrase)
+    return Product.objects.filter(pk__in=documents.values("product_id"))
+
+
+def set_similarity_threshold():
+    """Set the threshold used by the trigram `%` operator of the connection.
+
+    The setting is kept by the session, so it is sent once per connection.
+    """
+    connection.ensure_connection()
+    db_connection = connection.connection
+    if getattr(connection, "_similarity_threshold_set_on", None) is db_connection:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SET pg_trgm.similarity_threshold = %s", [NAME_SIMILARITY_THRESHOLD]
+        )
+
+    def _mark_as_set():
+        connection._similarity_threshold_set_on = db_connection
+
+    # Settings changed in a transaction are reverted when it rolls back
+    transaction.on_commit(_mark_as_set)
+
+
+def search_documents(phrase):
+    """Return search documents of products matching the phrase."""
+    set_similarity_threshold()
+    return ProductSearchDocument.objects.filter(
+        Q(search_vector=SearchQuery(phrase)) | Q(name__trigram_similar=phrase)
     )
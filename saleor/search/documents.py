@@ -0,0 +1,83 @@
+from typing import Iterable, List
+
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Prefetch
+
+from ..product.models import Product, ProductVariant
+from .models import ProductSearchDocument
+
+# Product fields stored in search documents, saving other fields doesn't
+# change the document
+PRODUCT_SEARCH_FIELDS = {"name", "description", "description_json", "category"}
+
+SEARCH_VECTOR = (
+    SearchVector("name", "skus", weight="A")
+    + SearchVector("keywords", weight="B")
+    + SearchVector("translations", weight="C")
+    + SearchVector("description", weight="D")
+)
+
+
+def _join(texts: Iterable[str]) -> str:
+    return " ".join(text for text in texts if text)
+
+
+def prepare_product_search_document(product: Product) -> ProductSearchDocument:
+    """Collect the searched text of a product with prefetched relations."""
+    keywords: List[str] = []
+    if product.category:
+        keywords.append(product.category.name)
+    for variant in product.variants.all():
+        for assignment in variant.attributes.all():
+            keywords.extend(value.name for value in assignment.values.all())
+    for assignment in product.attributes.all():
+        keywords.extend(value.name for value in assignment.values.all())
+    translations = product.translations.all()
+    return ProductSearchDocument(
+        product=product,
+        name=product.name,
+        skus=_join(variant.sku for variant in product.variants.all()),
+        keywords=_join(keywords),
+        translations=_join(
+            _join([translation.name, translation.description])
+            for translation in translations
+        ),
+        description=_join([product.description, product.plain_text_description]),
+    )
+
+
+def get_products_for_search_documents(product_ids: Iterable[int]):
+    """Return the given products with relations used by search documents."""
+    return Product.objects.filter(pk__in=set(product_ids)).prefetch_related(
+        "category",
+        "translations",
+        "attributes__values",
+        Prefetch(
+            "variants",
+            queryset=ProductVariant.objects.prefetch_related("attributes__values"),
+        ),
+    )
+
+
+def update_product_search_documents(product_ids: Iterable[int]):
+    """Refresh search documents of the given products."""
+    products = get_products_for_search_documents(product_ids)
+    documents = [prepare_product_search_document(product) for product in products]
+    if not documents:
+        return
+    product_pks = [document.product_id for document in documents]
+    existing_pks = set(
+        ProductSearchDocument.objects.filter(product_id__in=product_pks).values_list(
+            "product_id", flat=True
+        )
+    )
+    ProductSearchDocument.objects.bulk_create(
+        [document for document in documents if document.product_id not in existing_pks]
+    )
+    ProductSearchDocument.objects.bulk_update(
+        [document for document in documents if document.product_id in existing_pks],
+        ["name", "skus", "keywords", "translations", "description"],
+    )
+    ProductSearchDocument.objects.filter(product_id__in=product_pks).update(
+        search_vector=SEARCH_VECTOR
+    )
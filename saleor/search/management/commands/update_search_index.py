@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...utils import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Index all products in the configured search backend."
+
+    def handle(self, *args, **options):
+        indexed = rebuild_search_index()
+        self.stdout.write(f"Indexed {indexed} product(s).")
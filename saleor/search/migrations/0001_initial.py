@@ -0,0 +1,115 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Documents are populated with SQL to avoid loading every product in Python,
+# the `update_search_index` command rebuilds them using the application code
+POPULATE_PRODUCT_SEARCH_DOCUMENTS = """
+INSERT INTO search_productsearchdocument (
+    product_id, name, skus, keywords, translations, description
+)
+SELECT
+    p.id,
+    p.name,
+    COALESCE(
+        (
+            SELECT string_agg(v.sku, ' ')
+            FROM product_productvariant v
+            WHERE v.product_id = p.id
+        ),
+        ''
+    ),
+    concat_ws(
+        ' ',
+        c.name,
+        (
+            SELECT string_agg(av.name, ' ')
+            FROM product_assignedproductattribute a
+            JOIN product_assignedproductattribute_values av_m2m
+                ON av_m2m.assignedproductattribute_id = a.id
+            JOIN product_attributevalue av ON av.id = av_m2m.attributevalue_id
+            WHERE a.product_id = p.id
+        ),
+        (
+            SELECT string_agg(av.name, ' ')
+            FROM product_productvariant v
+            JOIN product_assignedvariantattribute a ON a.variant_id = v.id
+            JOIN product_assignedvariantattribute_values av_m2m
+                ON av_m2m.assignedvariantattribute_id = a.id
+            JOIN product_attributevalue av ON av.id = av_m2m.attributevalue_id
+            WHERE v.product_id = p.id
+        )
+    ),
+    COALESCE(
+        (
+            SELECT string_agg(concat_ws(' ', t.name, t.description), ' ')
+            FROM product_producttranslation t
+            WHERE t.product_id = p.id
+        ),
+        ''
+    ),
+    p.description
+FROM product_product p
+LEFT JOIN product_category c ON c.id = p.category_id;
+
+UPDATE search_productsearchdocument SET search_vector = (
+    setweight(to_tsvector(concat_ws(' ', name, skus)), 'A')
+    || setweight(to_tsvector(keywords), 'B')
+    || setweight(to_tsvector(translations), 'C')
+    || setweight(to_tsvector(description), 'D')
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("product", "0126_assignedproductattribute_values_sort_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductSearchDocument",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="product.product",
+                    ),
+                ),
+                ("name", models.TextField(blank=True, default="")),
+                ("skus", models.TextField(blank=True, default="")),
+                ("keywords", models.TextField(blank=True, default="")),
+                ("translations", models.TextField(blank=True, default="")),
+                ("description", models.TextField(blank=True, default="")),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        blank=True, null=True
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="productsearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="product_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productsearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="product_search_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunSQL(POPULATE_PRODUCT_SEARCH_DOCUMENTS, migrations.RunSQL.noop),
+    ]
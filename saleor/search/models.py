@@ -0,0 +1,36 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class ProductSearchDocument(models.Model):
+    """Stored text of a product searched by the storefront.
+
+    `search_vector` combines the text fields with weights from the most
+    to the least relevant: name and SKUs, attribute values and category,
+    translations and description. The name is also indexed for trigram
+    similarity to match phrases with typing errors.
+    """
+
+    product = models.OneToOneField(
+        "product.Product",
+        primary_key=True,
+        related_name="search_document",
+        on_delete=models.CASCADE,
+    )
+    name = models.TextField(blank=True, default="")
+    skus = models.TextField(blank=True, default="")
+    keywords = models.TextField(blank=True, default="")
+    translations = models.TextField(blank=True, default="")
+    description = models.TextField(blank=True, default="")
+    search_vector = SearchVectorField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="product_search_vector_idx"),
+            GinIndex(
+                fields=["name"],
+                name="product_search_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
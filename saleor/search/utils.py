@@ -0,0 +1,29 @@
+from typing import Iterable
+
+from ..product.models import Product
+from .backends.picker import pick_backend
+
+
+def update_products_search_index(product_ids: Iterable[int]):
+    """Refresh the given products in the index of the search backend."""
+    pick_backend().update(product_ids)
+
+
+def delete_products_from_search_index(product_ids: Iterable[int]):
+    """Remove the given products from the index of the search backend."""
+    pick_backend().delete(product_ids)
+
+
+def rebuild_search_index(batch_size: int = 1000) -> int:
+    """Index all products in batches.
+
+    Return the number of indexed products.
+    """
+    backend = pick_backend()
+    product_pks = list(
+        Product.objects.order_by("pk").values_list("pk", flat=True).iterator()
+    )
+    for start in range(0, len(product_pks), batch_size):
+        end = start + batch_size
+        backend.update(product_pks[start:end])
+    return len(product_pks)
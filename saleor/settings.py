@@ -461,7 +461,11 @@ PLACEHOLDER_IMAGES = {
 
 DEFAULT_PLACEHOLDER = "images/placeholder255x255.png"
 
-SEARCH_BACKEND = "saleor.search.backends.postgresql"
+# Class of the product search backend, the in-process
+# "saleor.search.backends.memory.InMemorySearchBackend" needs no database index
+SEARCH_BACKEND = os.environ.get(
+    "SEARCH_BACKEND", "saleor.search.backends.postgresql.PostgreSQLSearchBackend"
+)
 
 AUTHENTICATION_BACKENDS = [
     "saleor.core.auth_backend.JSONWebTokenBackend",
@@ -478,6 +482,18 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", None)
 
+# How often prices of products on sales which started or ended are recalculated
+SALE_PRICES_REFRESH_INTERVAL = timedelta(
+    seconds=parse(os.environ.get("SALE_PRICES_REFRESH_INTERVAL", "1 minute"))
+)
+CELERY_BEAT_SCHEDULE = {
+    "update-products-minimal-variant-prices-of-sale-boundaries": {
+        "task": "saleor.product.tasks"
+        ".update_products_minimal_variant_prices_of_sale_boundaries_task",
+        "schedule": SALE_PRICES_REFRESH_INTERVAL,
+    },
+}
+
 # Change this value if your application is running behind a proxy,
 # e.g. HTTP_CF_Connecting_IP for Cloudflare or X_FORWARDED_FOR
 REAL_IP_ENVIRON = os.environ.get("REAL_IP_ENVIRON", "REMOTE_ADDR")
@@ -505,8 +521,59 @@ GRAPHENE = {
     ],
 }
 
+# Number of seconds a process may reuse its snapshot of active discounts before
+# reloading it from the database; 0 disables the snapshot
+DISCOUNTS_SNAPSHOT_TIMEOUT = int(os.environ.get("DISCOUNTS_SNAPSHOT_TIMEOUT", 60))
+
+# Number of seconds a process may reuse attribute and value IDs looked up by
+# their slugs when filtering products; 0 disables the cache
+ATTRIBUTE_SLUG_MAP_CACHE_TIMEOUT = int(
+    os.environ.get("ATTRIBUTE_SLUG_MAP_CACHE_TIMEOUT", 60)
+)
+
+# Number of parsed and validated GraphQL documents kept in memory by each worker,
+# set to 0 to disable the cache
+GRAPHQL_QUERY_CACHE_SIZE = int(os.environ.get("GRAPHQL_QUERY_CACHE_SIZE", 1000))
+
+# Automatic persisted queries allow clients to send a sha256 hash of a query
+# instead of the full query string
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", False
+)
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", "1 day")
+)
+
+# Size of the worker pool executing queries of batched requests concurrently,
+# mutations are always executed sequentially; 0 disables concurrent execution
+GRAPHQL_BATCH_MAX_WORKERS = int(os.environ.get("GRAPHQL_BATCH_MAX_WORKERS", 0))
+
 PLUGINS_MANAGER = "saleor.plugins.manager.PluginsManager"
 
+# Number of seconds a process may reuse plugin configurations loaded from the
+# database; 0 disables the cache
+PLUGINS_CONFIGURATION_CACHE_TIMEOUT = int(
+    os.environ.get("PLUGINS_CONFIGURATION_CACHE_TIMEOUT", 60)
+)
+
+# Number of seconds a process may reuse shipping methods indexed by countries;
+# 0 disables the cache
+SHIPPING_METHODS_INDEX_CACHE_TIMEOUT = int(
+    os.environ.get("SHIPPING_METHODS_INDEX_CACHE_TIMEOUT", 60)
+)
+
+# Number of seconds a process may reuse Vatlayer tax rates prepared for
+# a country; 0 disables the cache
+VATLAYER_TAXES_CACHE_TIMEOUT = int(os.environ.get("VATLAYER_TAXES_CACHE_TIMEOUT", 60))
+
+# Number of seconds users and their permissions may be reused when verifying
+# access tokens; 0 disables the cache
+JWT_USER_CACHE_TIMEOUT = int(os.environ.get("JWT_USER_CACHE_TIMEOUT", 60))
+
+# Number of seconds apps and their permissions may be reused when verifying
+# app tokens; 0 disables the cache
+APP_TOKEN_CACHE_TIMEOUT = int(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", 60))
+
 PLUGINS = [
     "saleor.plugins.avatax.plugin.AvataxPlugin",
     "saleor.plugins.vatlayer.plugin.VatlayerPlugin",
@@ -529,6 +596,9 @@ for entry_point in installed_plugins:
             INSTALLED_APPS.append(entry_point.name)
         PLUGINS.append(plugin_path)
 
+# Number of threads used by a worker to deliver an event to all subscribed webhooks
+WEBHOOK_DELIVERY_MAX_WORKERS = int(os.environ.get("WEBHOOK_DELIVERY_MAX_WORKERS", 8))
+
 if (
     not DEBUG
     and ENABLE_ACCOUNT_CONFIRMATION_BY_EMAIL
@@ -67,6 +67,23 @@ class ShippingZone(models.Model):
     def __str__(self):
         return self.name
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        super().save(force_insert, force_update, using, update_fields)
+
+        from .utils import invalidate_shipping_methods_index
+
+        invalidate_shipping_methods_index()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        from .utils import invalidate_shipping_methods_index
+
+        invalidate_shipping_methods_index()
+        return result
+
     @property
     def price_range(self):
         prices = [
@@ -201,6 +218,23 @@ class ShippingMethod(models.Model):
             ),
         )
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        super().save(force_insert, force_update, using, update_fields)
+
+        from .utils import invalidate_shipping_methods_index
+
+        invalidate_shipping_methods_index()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        from .utils import invalidate_shipping_methods_index
+
+        invalidate_shipping_methods_index()
+        return result
+
     def get_total(self):
         return self.price
 
@@ -1,10 +1,18 @@
+from unittest.mock import patch
+
 import pytest
 from django_countries import countries
 from measurement.measures import Weight
 from prices import Money
 
+from .. import utils as shipping_utils
 from ..models import ShippingMethod, ShippingMethodType, ShippingZone
-from ..utils import default_shipping_zone_exists, get_countries_without_shipping_zone
+from ..utils import (
+    default_shipping_zone_exists,
+    get_applicable_shipping_methods,
+    get_countries_without_shipping_zone,
+    get_shipping_methods_index,
+)
 
 
 def test_shipping_get_total(monkeypatch, shipping_zone):
@@ -67,6 +75,76 @@ def test_applicable_shipping_methods_weight(
     assert (method in result) == shipping_included
 
 
+@pytest.mark.parametrize(
+    "price, weight",
+    (
+        (Money("0.5", "USD"), Weight(kg=5)),
+        (Money("5.0", "USD"), Weight(kg=0.5)),
+        (Money("5.0", "USD"), Weight(kg=5)),
+        (Money("50.0", "USD"), Weight(kg=50)),
+        (Money("5.0", "EUR"), Weight(kg=5)),
+    ),
+)
+def test_get_applicable_shipping_methods_matches_queryset(price, weight, shipping_zone):
+    shipping_zone.shipping_methods.create(
+        minimum_order_price=Money("1.0", "USD"),
+        maximum_order_price=Money("10.0", "USD"),
+        type=ShippingMethodType.PRICE_BASED,
+    )
+    shipping_zone.shipping_methods.create(
+        minimum_order_weight=Weight(kg=1),
+        maximum_order_weight=Weight(kg=10),
+        type=ShippingMethodType.WEIGHT_BASED,
+    )
+    shipping_zone.shipping_methods.create(
+        minimum_order_weight=Weight(kg=1),
+        maximum_order_weight=None,
+        type=ShippingMethodType.WEIGHT_BASED,
+    )
+
+    result = get_applicable_shipping_methods(
+        price=price, weight=weight, country_code="PL"
+    )
+
+    expected = ShippingMethod.objects.applicable_shipping_methods(
+        price=price, weight=weight, country_code="PL"
+    )
+    assert sorted(method.pk for method in result) == sorted(
+        method.pk for method in expected
+    )
+    assert [method.price_amount for method in result] == sorted(
+        method.price_amount for method in result
+    )
+
+
+def test_get_shipping_methods_index_is_reused(
+    shipping_zone, enable_process_cache, django_assert_num_queries
+):
+    enable_process_cache(shipping_utils._shipping_methods_index)
+    method = shipping_zone.shipping_methods.get()
+    index = get_shipping_methods_index()
+
+    with django_assert_num_queries(0):
+        result = get_applicable_shipping_methods(
+            price=method.price, weight=Weight(kg=0), country_code="PL"
+        )
+
+    assert get_shipping_methods_index() is index
+    assert result == [method]
+    # Callers get copies they may modify
+    assert result[0] is not index[("PL", method.currency)][0]
+
+
+@patch("saleor.shipping.utils.invalidate_shipping_methods_index")
+def test_shipping_method_save_invalidates_index(mocked_invalidate, shipping_zone):
+    method = shipping_zone.shipping_methods.get()
+
+    method.save()
+    shipping_zone.delete()
+
+    assert mocked_invalidate.call_count == 2
+
+
 def test_applicable_shipping_methods_country_code_outside_shipping_zone(shipping_zone):
     method = shipping_zone.shipping_methods.create(
         minimum_order_price=Money("1.0", "USD"),
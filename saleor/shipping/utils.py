@@ -1,6 +1,19 @@
+import copy
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
 from django_countries import countries
+from prices import Money
+
+from ..core.utils.cache import ProcessCache
+from . import ShippingMethodType
+from .models import ShippingMethod, ShippingZone
+
+# Shipping methods available in a country by country code and currency,
+# sorted by price
+ShippingMethodsIndex = Dict[Tuple[str, str], List[ShippingMethod]]
 
-from .models import ShippingZone
+SHIPPING_METHODS_INDEX_VERSION_CACHE_KEY = "shipping_methods_index_version"
 
 
 def default_shipping_zone_exists(zone_pk=None):
@@ -13,3 +26,72 @@ def get_countries_without_shipping_zone():
     for zone in ShippingZone.objects.all():
         covered_countries.update({c.code for c in zone.countries})
     return (country[0] for country in countries if country[0] not in covered_countries)
+
+
+def _load_shipping_methods_index() -> ShippingMethodsIndex:
+    index: ShippingMethodsIndex = defaultdict(list)
+    methods = ShippingMethod.objects.select_related("shipping_zone").order_by(
+        "price_amount", "pk"
+    )
+    for method in methods:
+        for country in method.shipping_zone.countries:
+            index[(country.code, method.currency)].append(method)
+    return dict(index)
+
+
+_shipping_methods_index = ProcessCache(
+    SHIPPING_METHODS_INDEX_VERSION_CACHE_KEY,
+    "SHIPPING_METHODS_INDEX_CACHE_TIMEOUT",
+    _load_shipping_methods_index,
+)
+
+
+def get_shipping_methods_index() -> ShippingMethodsIndex:
+    """Return shipping methods by the country code and currency.
+
+    The index is reused by the process until it is invalidated with
+    `invalidate_shipping_methods_index` or for
+    `SHIPPING_METHODS_INDEX_CACHE_TIMEOUT` seconds. It is shared between callers
+    and must not be modified.
+    """
+    return _shipping_methods_index.get()
+
+
+def invalidate_shipping_methods_index():
+    """Drop cached shipping methods once the transaction is committed."""
+    _shipping_methods_index.invalidate()
+
+
+def _is_shipping_method_applicable(method: ShippingMethod, price: Money, weight):
+    if method.type == ShippingMethodType.PRICE_BASED:
+        value = price.amount
+        minimum = method.minimum_order_price_amount
+        maximum = method.maximum_order_price_amount
+    elif method.type == ShippingMethodType.WEIGHT_BASED:
+        value = weight
+        minimum = method.minimum_order_weight
+        maximum = method.maximum_order_weight
+    else:
+        return False
+    return (
+        minimum is not None
+        and minimum <= value
+        and (maximum is None or maximum >= value)
+    )
+
+
+def get_applicable_shipping_methods(
+    price: Money, weight, country_code: str
+) -> List[ShippingMethod]:
+    """Return shipping methods applicable to the given price, weight and country.
+
+    Works like `ShippingMethodQueryset.applicable_shipping_methods`, but the
+    methods are matched against the cached index in memory. Returned methods
+    are copies, which may be modified by the caller.
+    """
+    methods = get_shipping_methods_index().get((country_code, price.currency), [])
+    return [
+        copy.copy(method)
+        for method in methods
+        if _is_shipping_method_applicable(method, price, weight)
+    ]
@@ -75,7 +75,7 @@ from ..product.models import (
     ProductVariant,
     ProductVariantTranslation,
 )
-from ..product.tests.utils import create_image
+from ..product.tests.utils import create_image, update_products_indexes
 from ..product.utils.attributes import associate_attribute_values_to_instance
 from ..shipping.models import (
     ShippingMethod,
@@ -85,6 +85,7 @@ from ..shipping.models import (
 )
 from ..site import AuthenticationBackends
 from ..site.models import AuthorizationKey, SiteSettings
+from ..warehouse.management import reconcile_stocks_quantity_allocated
 from ..warehouse.models import Allocation, Stock, Warehouse
 from ..webhook.event_types import WebhookEventType
 from ..webhook.models import Webhook
@@ -187,6 +188,17 @@ def setup_vatlayer(settings):
     return settings
 
 
+@pytest.fixture
+def enable_process_cache(settings, monkeypatch):
+    """Return a function making the given process cache reuse empty data."""
+
+    def _enable(process_cache):
+        setattr(settings, process_cache.timeout_setting, 60)
+        monkeypatch.setattr(process_cache, "_data", None)
+
+    return _enable
+
+
 @pytest.fixture(autouse=True)
 def setup_dummy_gateways(settings):
     settings.PLUGINS = [
@@ -684,6 +696,7 @@ def categories_tree(db, product_type):  # pylint: disable=W0613
     )
 
     associate_attribute_values_to_instance(product, product_attr, attr_value)
+    update_products_indexes([product.pk])
     return parent
 
 
@@ -789,6 +802,7 @@ def product(product_type, category, warehouse):
     Stock.objects.create(warehouse=warehouse, product_variant=variant, quantity=10)
 
     associate_attribute_values_to_instance(variant, variant_attr, variant_attr_value)
+    update_products_indexes([product.pk])
     return product
 
 
@@ -881,6 +895,7 @@ def product_with_variant_with_two_attributes(
     associate_attribute_values_to_instance(
         variant, size_attribute, size_attribute.values.first()
     )
+    update_products_indexes([product.pk])
 
     return product
 
@@ -903,6 +918,7 @@ def product_with_multiple_values_attributes(product, product_type, category) ->
     product_type.product_attributes.add(attribute)
 
     associate_attribute_values_to_instance(product, attribute, attr_val_1, attr_val_2)
+    update_products_indexes([product.pk])
     return product
 
 
@@ -1098,6 +1114,7 @@ def product_list(product_type, category, warehouse):
 
     for product in products:
         associate_attribute_values_to_instance(product, product_attr, attr_value)
+    update_products_indexes([product.pk for product in products])
 
     return products
 
@@ -1170,6 +1187,7 @@ def unavailable_product_with_variant(product_type, category, warehouse):
     Stock.objects.create(product_variant=variant, warehouse=warehouse, quantity=10)
 
     associate_attribute_values_to_instance(variant, variant_attr, variant_attr_value)
+    update_products_indexes([product.pk])
     return product
 
 
@@ -1286,6 +1304,7 @@ def order_line_with_allocation_in_many_stocks(customer_user, variant_with_many_s
             Allocation(order_line=order_line, stock=stocks[1], quantity_allocated=1),
         ]
     )
+    reconcile_stocks_quantity_allocated(stocks)
 
     return order_line
 
@@ -1316,6 +1335,7 @@ def order_line_with_one_allocation(customer_user, variant_with_many_stocks):
     Allocation.objects.create(
         order_line=order_line, stock=stocks[0], quantity_allocated=1
     )
+    reconcile_stocks_quantity_allocated(stocks)
 
     return order_line
 
@@ -1383,6 +1403,7 @@ def order_with_lines(order, product_type, category, shipping_zone, warehouse):
     Allocation.objects.create(
         order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    reconcile_stocks_quantity_allocated(Stock.objects.filter(pk=stock.pk))
 
     product = Product.objects.create(
         name="Test product 2",
@@ -1415,6 +1436,7 @@ def order_with_lines(order, product_type, category, shipping_zone, warehouse):
     Allocation.objects.create(
         order_line=line, stock=stock, quantity_allocated=line.quantity
     )
+    reconcile_stocks_quantity_allocated(Stock.objects.filter(pk=stock.pk))
 
     order.shipping_address = order.billing_address.get_copy()
     method = shipping_zone.shipping_methods.first()
@@ -1532,6 +1554,7 @@ def fulfillment(fulfilled_order):
 @pytest.fixture
 def draft_order(order_with_lines):
     Allocation.objects.filter(order_line__order=order_with_lines).delete()
+    reconcile_stocks_quantity_allocated()
     order_with_lines.status = OrderStatus.DRAFT
     order_with_lines.save(update_fields=["status"])
     return order_with_lines
@@ -2335,9 +2358,11 @@ def stock(variant, warehouse):
 
 @pytest.fixture
 def allocation(order_line, stock):
-    return Allocation.objects.create(
+    allocation = Allocation.objects.create(
         order_line=order_line, stock=stock, quantity_allocated=order_line.quantity
     )
+    reconcile_stocks_quantity_allocated(Stock.objects.filter(pk=stock.pk))
+    return allocation
 
 
 @pytest.fixture
@@ -2382,7 +2407,7 @@ def allocations(order_list, stock):
             ),
         ]
     )
-    return Allocation.objects.bulk_create(
+    allocations = Allocation.objects.bulk_create(
         [
             Allocation(
                 order_line=lines[0], stock=stock, quantity_allocated=lines[0].quantity
@@ -2395,6 +2420,8 @@ def allocations(order_list, stock):
             ),
         ]
     )
+    reconcile_stocks_quantity_allocated(Stock.objects.filter(pk=stock.pk))
+    return allocations
 
 
 @pytest.fixture
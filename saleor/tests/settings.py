@@ -31,7 +31,7 @@ DEFAULT_CURRENCY = "USD"
 TIME_ZONE = "America/Chicago"
 LANGUAGE_CODE = "en"
 
-SEARCH_BACKEND = "saleor.search.backends.postgresql"
+SEARCH_BACKEND = "saleor.search.backends.postgresql.PostgreSQLSearchBackend"
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
@@ -55,3 +55,17 @@ PATTERNS_IGNORED_IN_QUERY_CAPTURES: List[Union[Pattern, SimpleLazyObject]] = [
 INSTALLED_APPS.append("saleor.tests")  # noqa: F405
 
 JWT_EXPIRE = True
+
+DISCOUNTS_SNAPSHOT_TIMEOUT = 0
+
+ATTRIBUTE_SLUG_MAP_CACHE_TIMEOUT = 0
+
+PLUGINS_CONFIGURATION_CACHE_TIMEOUT = 0
+
+VATLAYER_TAXES_CACHE_TIMEOUT = 0
+
+SHIPPING_METHODS_INDEX_CACHE_TIMEOUT = 0
+
+JWT_USER_CACHE_TIMEOUT = 0
+
+APP_TOKEN_CACHE_TIMEOUT = 0
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple
 
 from django.conf import settings
 from django.db.models import Sum
@@ -13,15 +13,16 @@ if TYPE_CHECKING:
 
 
 def _get_quantity_allocated(stocks: StockQuerySet) -> int:
-    return stocks.aggregate(
-        quantity_allocated=Coalesce(Sum("allocations__quantity_allocated"), 0)
-    )["quantity_allocated"]
+    results = stocks.aggregate(
+        quantity_allocated=Coalesce(Sum("quantity_allocated"), 0)
+    )
+    return results["quantity_allocated"]
 
 
 def _get_available_quantity(stocks: StockQuerySet) -> int:
     results = stocks.aggregate(
-        total_quantity=Coalesce(Sum("quantity", distinct=True), 0),
-        quantity_allocated=Coalesce(Sum("allocations__quantity_allocated"), 0),
+        total_quantity=Coalesce(Sum("quantity"), 0),
+        quantity_allocated=Coalesce(Sum("quantity_allocated"), 0),
     )
     total_quantity = results["total_quantity"]
     quantity_allocated = results["quantity_allocated"]
@@ -44,6 +45,48 @@ def check_stock_quantity(variant: "ProductVariant", country_code: str, quantity:
             raise InsufficientStock(variant)
 
 
+def check_stock_quantity_bulk(
+    variants_quantities: Iterable[Tuple["ProductVariant", int]], country_code: str
+):
+    """Validate if there is stock available for all given variants in given country.
+
+    Works like `check_stock_quantity` called for every variant, but the stocks of
+    all variants are checked with a single query. Quantities of the same variant
+    are summed. Raise InsufficientStock for the first variant that is not available.
+    """
+    quantities: Dict[int, int] = defaultdict(int)
+    variants = {}
+    for variant, quantity in variants_quantities:
+        if variant.track_inventory:
+            quantities[variant.pk] += quantity
+            variants[variant.pk] = variant
+    if not quantities:
+        return
+
+    stocks = (
+        Stock.objects.for_country(country_code)
+        .filter(product_variant_id__in=quantities)
+        .order_by()
+        .values("product_variant_id")
+        .annotate(
+            total_quantity=Coalesce(Sum("quantity"), 0),
+            quantity_allocated=Coalesce(Sum("quantity_allocated"), 0),
+        )
+    )
+    available_quantities = {
+        stock["product_variant_id"]: max(
+            stock["total_quantity"] - stock["quantity_allocated"], 0
+        )
+        for stock in stocks
+    }
+    for variant_pk, quantity in quantities.items():
+        if (
+            variant_pk not in available_quantities
+            or quantity > available_quantities[variant_pk]
+        ):
+            raise InsufficientStock(variants[variant_pk])
+
+
 def get_available_quantity(variant: "ProductVariant", country_code: str) -> int:
     """Return available quantity for given product in given country."""
     stocks = Stock.objects.get_variant_stocks_for_country(country_code, variant)
@@ -1,9 +1,9 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 from django.db import transaction
-from django.db.models import F, Sum
-from django.db.models.functions import Coalesce
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum
+from django.db.models.functions import Coalesce, Greatest
 
 from ..core.exceptions import AllocationError, InsufficientStock
 from .models import Allocation, Stock, Warehouse
@@ -18,56 +18,99 @@ def allocate_stock(
 ):
     """Allocate stocks for given `order_line` in given country.
 
-    Function lock for update all stocks and allocations for variant in
-    given country and order by pk. Next, generate the dictionary
-    ({"stock_pk": "quantity_allocated"}) with actual allocated quantity for stocks.
+    Function lock for update all stocks for variant in given country and order by pk.
     Iterate by stocks and allocate as many items as needed or available in stock
     for order line, until allocated all required quantity for the order line.
     If there is less quantity in stocks then rise InsufficientStock exception.
     """
-    stocks = (
+    _allocate_stocks([(order_line, quantity)], country_code)
+
+
+@transaction.atomic
+def allocate_stocks(order_lines: Iterable["OrderLine"], country_code: str):
+    """Allocate stocks for the whole quantity of given `order_lines` in given country.
+
+    Works like `allocate_stock` called for every line, but stocks of all variants
+    are locked with a single query and allocations are saved with a single
+    `bulk_create`. If any line can't be allocated InsufficientStock is raised
+    and nothing is allocated.
+    """
+    _allocate_stocks([(line, line.quantity) for line in order_lines], country_code)
+
+
+def _allocate_stocks(
+    lines_quantities: List[Tuple["OrderLine", int]], country_code: str
+):
+    variant_ids = {line.variant_id for line, _quantity in lines_quantities}
+    # Lock the stocks always in the same order to avoid deadlocks between orders
+    stocks = list(
         Stock.objects.select_for_update(of=("self",))
-        .get_variant_stocks_for_country(country_code, order_line.variant)
+        .for_country(country_code)
+        .filter(product_variant_id__in=variant_ids)
         .order_by("pk")
     )
+    stocks_for_variants: Dict[int, List[Stock]] = defaultdict(list)
+    for stock in stocks:
+        stocks_for_variants[stock.product_variant_id].append(stock)
 
-    quantity_allocation_list = list(
-        Allocation.objects.filter(stock__in=stocks, quantity_allocated__gt=0,)
-        .values("stock")
-        .annotate(Sum("quantity_allocated"))
-    )
-    quantity_allocation_for_stocks: Dict = defaultdict(int)
-    for allocation in quantity_allocation_list:
-        quantity_allocation_for_stocks[allocation["stock"]] += allocation[
-            "quantity_allocated__sum"
-        ]
-
-    quantity_allocated = 0
     allocations = []
+    allocated_stocks = {}
+    for order_line, quantity in lines_quantities:
+        quantity_allocated = 0
+        for stock in stocks_for_variants[order_line.variant_id]:
+            if quantity_allocated == quantity:
+                break
+            quantity_available_in_stock = stock.quantity - stock.quantity_allocated
+            quantity_to_allocate = min(
+                (quantity - quantity_allocated), quantity_available_in_stock
+            )
+            if quantity_to_allocate > 0:
+                allocations.append(
+                    Allocation(
+                        order_line=order_line,
+                        stock=stock,
+                        quantity_allocated=quantity_to_allocate,
+                    )
+                )
+                # Following lines of the same variant see this allocation
+                stock.quantity_allocated += quantity_to_allocate
+                allocated_stocks[stock.pk] = stock
+                quantity_allocated += quantity_to_allocate
+        if not quantity_allocated == quantity:
+            raise InsufficientStock(order_line.variant)
 
-    for stock in stocks:
-        quantity_allocated_in_stock = quantity_allocation_for_stocks.get(stock.pk, 0)
+    Allocation.objects.bulk_create(allocations)
+    Stock.objects.bulk_update(allocated_stocks.values(), ["quantity_allocated"])
 
-        quantity_available_in_stock = stock.quantity - quantity_allocated_in_stock
 
-        quantity_to_allocate = min(
-            (quantity - quantity_allocated), quantity_available_in_stock
+def _decrease_stocks_quantity_allocated(
+    stocks: Dict[int, Stock], quantities: Dict[int, int]
+):
+    for stock_pk, stock in stocks.items():
+        # Never go below zero, stocks out of sync are fixed by reconciliation
+        stock.quantity_allocated = Greatest(
+            F("quantity_allocated") - quantities[stock_pk], 0
         )
-        if quantity_to_allocate > 0:
-            allocations.append(
-                Allocation(
-                    order_line=order_line,
-                    stock=stock,
-                    quantity_allocated=quantity_to_allocate,
-                )
-            )
+    Stock.objects.bulk_update(stocks.values(), ["quantity_allocated"])
 
-            quantity_allocated += quantity_to_allocate
-            if quantity_allocated == quantity:
-                Allocation.objects.bulk_create(allocations)
-                break
-    if not quantity_allocated == quantity:
-        raise InsufficientStock(order_line.variant)
+
+def _deallocate_all(allocations: QuerySet):
+    """Set given allocations to zero and release their quantity in stocks."""
+    allocations = list(
+        allocations.filter(quantity_allocated__gt=0)
+        .select_related("stock")
+        .select_for_update(of=("self", "stock"))
+        .order_by("stock__pk")
+    )
+    stocks: Dict[int, Stock] = {}
+    quantities: Dict[int, int] = defaultdict(int)
+    for allocation in allocations:
+        stocks[allocation.stock_id] = allocation.stock
+        quantities[allocation.stock_id] += allocation.quantity_allocated
+    _decrease_stocks_quantity_allocated(stocks, quantities)
+    Allocation.objects.filter(
+        pk__in=[allocation.pk for allocation in allocations]
+    ).update(quantity_allocated=0)
 
 
 @transaction.atomic
@@ -86,6 +129,8 @@ def deallocate_stock(order_line: "OrderLine", quantity: int):
         .order_by("stock__pk")
     )
     quantity_dealocated = 0
+    stocks: Dict[int, Stock] = {}
+    quantities: Dict[int, int] = {}
     for allocation in allocations:
         quantity_to_deallocate = min(
             (quantity - quantity_dealocated), allocation.quantity_allocated
@@ -94,9 +139,12 @@ def deallocate_stock(order_line: "OrderLine", quantity: int):
             allocation.quantity_allocated = (
                 F("quantity_allocated") - quantity_to_deallocate
             )
+            stocks[allocation.stock_id] = allocation.stock
+            quantities[allocation.stock_id] = quantity_to_deallocate
             quantity_dealocated += quantity_to_deallocate
             if quantity_dealocated == quantity:
                 Allocation.objects.bulk_update(allocations, ["quantity_allocated"])
+                _decrease_stocks_quantity_allocated(stocks, quantities)
                 break
     if not quantity_dealocated == quantity:
         raise AllocationError(order_line, quantity)
@@ -131,6 +179,8 @@ def increase_stock(
             warehouse=warehouse, product_variant=order_line.variant, quantity=quantity
         )
     if allocate:
+        stock.quantity_allocated = F("quantity_allocated") + quantity
+        stock.save(update_fields=["quantity_allocated"])
         allocation = order_line.allocations.filter(stock=stock).first()
         if allocation:
             allocation.quantity_allocated = F("quantity_allocated") + quantity
@@ -154,23 +204,17 @@ def decrease_stock(order_line: "OrderLine", quantity: int, warehouse_pk: str):
     try:
         deallocate_stock(order_line, quantity)
     except AllocationError:
-        order_line.allocations.update(quantity_allocated=0)
+        _deallocate_all(order_line.allocations.all())
 
     try:
-        stock = (
-            order_line.variant.stocks.select_for_update()  # type: ignore
-            .prefetch_related("allocations")
-            .get(warehouse__pk=warehouse_pk)
+        stock = order_line.variant.stocks.select_for_update().get(  # type: ignore
+            warehouse__pk=warehouse_pk
         )
     except Stock.DoesNotExist:
         error_context = {"order_line": order_line, "warehouse_pk": warehouse_pk}
         raise InsufficientStock(order_line.variant, error_context)
 
-    quantity_allocated = stock.allocations.aggregate(
-        quantity_allocated=Coalesce(Sum("quantity_allocated"), 0)
-    )["quantity_allocated"]
-
-    if stock.quantity - quantity_allocated < quantity:
+    if stock.quantity - stock.quantity_allocated < quantity:
         error_context = {"order_line": order_line, "warehouse_pk": warehouse_pk}
         raise InsufficientStock(order_line.variant, error_context)
 
@@ -181,7 +225,32 @@ def decrease_stock(order_line: "OrderLine", quantity: int, warehouse_pk: str):
 @transaction.atomic
 def deallocate_stock_for_order(order: "Order"):
     """Remove all allocations for given order."""
-    allocations = Allocation.objects.filter(
-        order_line__order=order, quantity_allocated__gt=0
-    ).select_for_update(of=("self",))
-    allocations.update(quantity_allocated=0)
+    _deallocate_all(Allocation.objects.filter(order_line__order=order))
+
+
+@transaction.atomic
+def reconcile_stocks_quantity_allocated(stocks: Optional[QuerySet] = None) -> int:
+    """Recalculate `quantity_allocated` of stocks from their allocations.
+
+    Fix stocks which counter went out of sync with allocations, e.g. after
+    allocations were removed by cascade deletion. Return number of fixed stocks.
+    """
+    if stocks is None:
+        stocks = Stock.objects.all()
+    quantity_allocated = Coalesce(
+        Subquery(
+            Allocation.objects.filter(stock=OuterRef("pk"))
+            .values("stock")
+            .annotate(total=Sum("quantity_allocated"))
+            .values("total")[:1]
+        ),
+        0,
+    )
+    stock_pks = list(
+        stocks.annotate(actual_quantity_allocated=quantity_allocated)
+        .exclude(quantity_allocated=F("actual_quantity_allocated"))
+        .values_list("pk", flat=True)
+    )
+    return Stock.objects.filter(pk__in=stock_pks).update(
+        quantity_allocated=quantity_allocated
+    )
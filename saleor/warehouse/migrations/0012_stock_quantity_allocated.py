@@ -0,0 +1,31 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def set_stocks_quantity_allocated(apps, schema_editor):
+    Stock = apps.get_model("warehouse", "Stock")
+    Allocation = apps.get_model("warehouse", "Allocation")
+    quantity_allocated = Subquery(
+        Allocation.objects.filter(stock=OuterRef("pk"))
+        .values("stock")
+        .annotate(total=Sum("quantity_allocated"))
+        .values("total")[:1]
+    )
+    Stock.objects.update(quantity_allocated=Coalesce(quantity_allocated, 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("warehouse", "0011_auto_20200714_0539"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stock",
+            name="quantity_allocated",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(set_stocks_quantity_allocated, migrations.RunPython.noop),
+    ]
@@ -3,8 +3,7 @@ import uuid
 from typing import Set
 
 from django.db import models
-from django.db.models import F, Sum
-from django.db.models.functions import Coalesce
+from django.db.models import F
 
 from ..account.models import Address
 from ..order.models import OrderLine
@@ -56,10 +55,7 @@ class Warehouse(models.Model):
 
 class StockQuerySet(models.QuerySet):
     def annotate_available_quantity(self):
-        return self.annotate(
-            available_quantity=F("quantity")
-            - Coalesce(Sum("allocations__quantity_allocated"), 0)
-        )
+        return self.annotate(available_quantity=F("quantity") - F("quantity_allocated"))
 
     def for_country(self, country_code: str):
         query_warehouse = models.Subquery(
@@ -92,6 +88,9 @@ class Stock(models.Model):
         ProductVariant, null=False, on_delete=models.CASCADE, related_name="stocks"
     )
     quantity = models.PositiveIntegerField(default=0)
+    # Sum of `quantity_allocated` of the stock allocations, maintained by functions
+    # from `warehouse.management`
+    quantity_allocated = models.PositiveIntegerField(default=0)
 
     objects = StockQuerySet.as_manager()
 
@@ -5,6 +5,7 @@ from ...core.exceptions import InsufficientStock
 from ..availability import (
     are_all_product_variants_in_stock,
     check_stock_quantity,
+    check_stock_quantity_bulk,
     get_available_quantity,
     get_available_quantity_for_customer,
     get_quantity_allocated,
@@ -23,6 +24,27 @@ def test_check_stock_quantity_out_of_stock(variant_with_many_stocks):
         check_stock_quantity(variant_with_many_stocks, COUNTRY_CODE, 8)
 
 
+def test_check_stock_quantity_bulk(variant_with_many_stocks, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        check_stock_quantity_bulk([(variant_with_many_stocks, 7)], COUNTRY_CODE)
+
+
+def test_check_stock_quantity_bulk_skips_variants_without_tracking(variant):
+    variant.track_inventory = False
+    check_stock_quantity_bulk([(variant, 100)], COUNTRY_CODE)
+
+
+def test_check_stock_quantity_bulk_sums_quantities_of_variant(
+    variant_with_many_stocks,
+):
+    with pytest.raises(InsufficientStock) as exc:
+        check_stock_quantity_bulk(
+            [(variant_with_many_stocks, 4), (variant_with_many_stocks, 4)],
+            COUNTRY_CODE,
+        )
+    assert exc.value.item == variant_with_many_stocks
+
+
 def test_check_stock_quantity_with_allocations(
     variant_with_many_stocks,
     order_line_with_allocation_in_many_stocks,
@@ -5,12 +5,14 @@ from django.db.models.functions import Coalesce
 from ...core.exceptions import InsufficientStock
 from ..management import (
     allocate_stock,
+    allocate_stocks,
     deallocate_stock,
     deallocate_stock_for_order,
     decrease_stock,
     increase_stock,
+    reconcile_stocks_quantity_allocated,
 )
-from ..models import Allocation
+from ..models import Allocation, Stock
 
 COUNTRY_CODE = "US"
 
@@ -81,6 +83,54 @@ def test_allocate_stock_insufficient_stocks(order_line, variant_with_many_stocks
     ).exists()
 
 
+def test_allocate_stocks_many_lines_of_the_same_variant(
+    order_line, variant_with_many_stocks
+):
+    stocks = variant_with_many_stocks.stocks.order_by("pk")
+    order_line.quantity = 5
+    order_line.save(update_fields=["quantity"])
+    second_line = order_line.order.lines.create(
+        product_name=order_line.product_name,
+        product_sku=order_line.product_sku,
+        is_shipping_required=order_line.is_shipping_required,
+        quantity=2,
+        variant=order_line.variant,
+        unit_price=order_line.unit_price,
+    )
+
+    allocate_stocks([order_line, second_line], COUNTRY_CODE)
+
+    assert [stock.quantity_allocated for stock in stocks] == [4, 3]
+    allocations = Allocation.objects.filter(stock__in=stocks).order_by("pk")
+    assert [
+        (allocation.order_line, allocation.stock, allocation.quantity_allocated)
+        for allocation in allocations
+    ] == [
+        (order_line, stocks[0], 4),
+        (order_line, stocks[1], 1),
+        (second_line, stocks[1], 2),
+    ]
+
+
+def test_allocate_stocks_insufficient_stocks_for_one_line(
+    order_line, variant_with_many_stocks
+):
+    stocks = variant_with_many_stocks.stocks.all()
+    second_line = order_line.order.lines.create(
+        product_name=order_line.product_name,
+        product_sku=order_line.product_sku,
+        is_shipping_required=order_line.is_shipping_required,
+        quantity=5,
+        variant=order_line.variant,
+        unit_price=order_line.unit_price,
+    )
+
+    with pytest.raises(InsufficientStock):
+        allocate_stocks([order_line, second_line], COUNTRY_CODE)
+
+    assert not Allocation.objects.filter(stock__in=stocks).exists()
+
+
 def test_deallocate_stock(allocation):
     stock = allocation.stock
     stock.quantity = 100
@@ -262,3 +312,26 @@ def test_deallocate_stock_for_order(order_line_with_allocation_in_many_stocks,):
     allocations = order_line.allocations.all()
     assert allocations[0].quantity_allocated == 0
     assert allocations[1].quantity_allocated == 0
+
+    stocks = Stock.objects.filter(allocations__order_line=order_line)
+    assert all(stock.quantity_allocated == 0 for stock in stocks)
+
+
+def test_allocate_and_deallocate_stock_update_quantity_allocated(order_line, stock):
+    allocate_stock(order_line, COUNTRY_CODE, 5)
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 5
+
+    deallocate_stock(order_line, 2)
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 3
+
+
+def test_reconcile_stocks_quantity_allocated(order_line_with_allocation_in_many_stocks):
+    stocks = order_line_with_allocation_in_many_stocks.variant.stocks.order_by("pk")
+    stocks.update(quantity_allocated=10)
+
+    assert reconcile_stocks_quantity_allocated() == 2
+
+    assert [stock.quantity_allocated for stock in stocks] == [2, 1]
+    assert reconcile_stocks_quantity_allocated() == 0